@@ -1,6 +1,17 @@
 #!/usr/bin/env python3
+import argparse
 import os
-import re
+
+from i18n_tools import DEFAULT_IO_WORKERS, dry_run
+from i18n_tools.cli import add_common_arguments, apply_common_arguments
+from i18n_tools.file_cache import FileCache, mapping_hash
+from i18n_tools.injection import (HOOK, IMPORT, PLAN_VERSION, cached_plan, hook_edits,
+                                  injection_plan, splice, unsupported)
+from i18n_tools.mapped_file import MappedFile
+from i18n_tools.phases import phase
+
+# Bump when the injection rules change so cached results are invalidated
+CODEMOD_VERSION = 3
 
 files = [
     "client/src/pages/ChatOrders.tsx",
@@ -25,41 +36,147 @@ files = [
     "client/src/pages/merchant/WhatsAppSetupWizard.tsx",
 ]
 
-for filepath in files:
-    fullpath = f"/home/ubuntu/sari/{filepath}"
-    if not os.path.exists(fullpath):
-        print(f"✗ {filepath} not found")
-        continue
-    
-    with open(fullpath, 'r', encoding='utf-8') as f:
-        content = f.read()
+def inject_use_translation(content, plan=None):
+    """Return content with the useTranslation import and hook added"""
+    if plan is None:
+        with phase('match'):
+            plan = injection_plan(content)
     
+    with phase('rewrite'):
+        # Add const { t } = useTranslation(); to the default export and to
+        # every other component that calls t()
+        edits = hook_edits(plan, f"\n  {HOOK}\n")
+        
+        # Add import after the last import statement (and its line break)
+        if IMPORT not in content and plan['imports']:
+            last_import_end = plan['imports'][-1][1]
+            if content.startswith('\n', last_import_end):
+                last_import_end += 1
+            edits.append((last_import_end, "\n" + IMPORT))
+        return splice(content, edits)
+
+def add_use_translation(fullpath, content, plan=None):
+    """Add the useTranslation import and hook to one file, returning its status"""
     # Check if already has useTranslation
     if 'useTranslation' in content:
+        return 'present'
+    new_content = inject_use_translation(content, plan)
+    
+    with phase('write'):
+        dry_run.write_file(fullpath, new_content, content)
+    
+    return 'updated'
+
+def print_status(filepath, status, plan=None):
+    """Print the result for one file"""
+    if status == 'present':
         print(f"✓ {filepath} already has useTranslation")
-        continue
+    else:
+        print(f"✓ {filepath} updated")
+    skipped = unsupported(plan) if plan is not None else ()
+    if skipped:
+        print(f"  ⚠ no hook added to {', '.join(skipped)} (arrow body is not a block or parenthesized)")
+
+def process_async(root, cache, plans, io_workers):
+    """Inject through the asyncio pipeline, printing results in file order"""
+    # Imported on use: asyncio alone costs more startup time than a serial run's work
+    from i18n_tools.pipeline import run_pipeline
+    
+    def read(filepath):
+        fullpath = f"{root}/{filepath}"
+        if not os.path.exists(fullpath):
+            return None
+        with phase('read'):
+            with MappedFile(fullpath) as source:
+                # Files that already use the hook are never decoded
+                if b'useTranslation' in source:
+                    return source.hash(), None
+                return source.hash(), source.text()
+    
+    def transform(filepath, data):
+        if data is None or data[1] is None or 'useTranslation' in data[1]:
+            return data, None, None
+        plan = cached_plan(plans, data[0], data[1])
+        return data, plan, inject_use_translation(data[1], plan)
+    
+    def write(filepath, transformed):
+        data, plan, new_content = transformed
+        if new_content is None:
+            return data, None, None
+        with phase('write'):
+            return data, plan, dry_run.render(f"{root}/{filepath}", new_content, data[1])
+    
+    def on_result(filepath, result, error):
+        if error is not None:
+            raise error
+        data, plan, diff = result
+        if data is None:
+            print(f"✗ {filepath} not found")
+            return
+        # The cache is only used here, in file order, as in the serial loop
+        file_hash, content = data
+        status = cache.get(file_hash)
+        if status is None and content is None:
+            status = 'present'
+            cache.set(file_hash, status)
+        if diff is not None:
+            dry_run.emit(diff)
+        print_status(filepath, 'present' if plan is None else 'updated', plan)
+    
+    run_pipeline(files, read, transform, write, on_result, io_workers=io_workers)
+
+def process_serial(root, cache, plans):
+    """Inject into each file in turn"""
+    for filepath in files:
+        fullpath = f"{root}/{filepath}"
+        if not os.path.exists(fullpath):
+            print(f"✗ {filepath} not found")
+            continue
+        
+        with phase('read'):
+            with MappedFile(fullpath) as source:
+                file_hash = source.hash()
+                status = cache.get(file_hash)
+                # Files that already use the hook are never decoded
+                if status is None and b'useTranslation' in source:
+                    status = 'present'
+                    cache.set(file_hash, status)
+                content = source.text() if status is None else None
+        plan = None
+        if status is None and 'useTranslation' not in content:
+            plan = cached_plan(plans, file_hash, content)
+        if status is None:
+            status = add_use_translation(fullpath, content, plan)
+        
+        print_status(filepath, status, plan)
+
+def main():
+    parser = argparse.ArgumentParser(description="Add useTranslation to pages")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="recheck every file, ignoring the content-hash cache")
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="overlap file reads and writes with the injection (asyncio pipeline)")
+    parser.add_argument('--io-workers', type=int, default=DEFAULT_IO_WORKERS,
+                        help=f"concurrent reads/writes with --async (default: {DEFAULT_IO_WORKERS})")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+    root = apply_common_arguments(args)
     
-    # Add import
-    if "import { useTranslation } from 'react-i18next';" not in content:
-        # Find last import line
-        import_pattern = r'(import .*?;)\n(?!import)'
-        match = list(re.finditer(import_pattern, content, re.MULTILINE))
-        if match:
-            last_import_end = match[-1].end()
-            content = content[:last_import_end] + "\nimport { useTranslation } from 'react-i18next';" + content[last_import_end:]
+    # Files already seen with useTranslation are skipped without rescanning
+    cache = FileCache('add-usetranslation', mapping_hash(CODEMOD_VERSION), enabled=not args.no_cache)
     
-    # Add const { t } = useTranslation(); after function declaration
-    function_pattern = r'(export default function \w+\([^)]*\)\s*\{)'
-    match = re.search(function_pattern, content)
-    if match:
-        func_end = match.end()
-        # Check if already has const { t }
-        if 'const { t } = useTranslation();' not in content[func_end:func_end+200]:
-            content = content[:func_end] + "\n  const { t } = useTranslation();\n" + content[func_end:]
+    # Edit plans by content hash, shared with translate-pages.py
+    plans = FileCache('injection-plans', mapping_hash(PLAN_VERSION), enabled=not args.no_cache)
     
-    with open(fullpath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    if args.use_async:
+        process_async(root, cache, plans, max(1, args.io_workers))
+    else:
+        process_serial(root, cache, plans)
     
-    print(f"✓ {filepath} updated")
+    cache.save()
+    plans.save()
+    print("Done!")
+    dry_run.close()
 
-print("Done!")
+if __name__ == "__main__":
+    main()
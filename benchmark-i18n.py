@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Script to benchmark the i18n codemod scripts on synthetic client trees.
+
+Each tree is generated from the real pages in client/src/pages, so page
+sizes and toast density match the real client; most toast literals are
+swapped for messages from toast-mapping.json so the codemods have work to
+do. Every script is timed end to end and per phase (read, match, rewrite,
+write) and the results are appended to a JSON file.
+
+With --startup, the scripts are instead timed on a tree they have already
+processed, where startup is all that is left: once cold (--no-cache, so
+caches and artifacts are rebuilt) and once warm. With --memory, the
+memory the locale files take is measured for the parsed JSON dicts, flat
+per-locale dicts and the interned locale catalog. With --templates, the
+extractor for interpolated toast messages is timed in process against the
+three hard-coded special-case patterns it replaced. With --index, the
+scan index is built, refreshed and queried on trees of each size.
+"""
+import gc
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import re
+import argparse
+from pathlib import Path
+
+from i18n_tools.interpolation import interpolate
+from i18n_tools.locale_catalog import LocaleCatalog, flatten
+from i18n_tools.scan_index import ScanIndex
+from i18n_tools.tsx_lexer import tokenize, toast_literals
+
+repo_dir = Path(__file__).resolve().parent
+
+SCRIPTS = [
+    'extract-toast-messages.py',
+    'replace-toast-messages.py',
+    'add-usetranslation.py',
+    'translate-pages.py',
+]
+
+# Scripts that can overlap their file I/O with --async
+ASYNC_SCRIPTS = {
+    'replace-toast-messages.py',
+    'add-usetranslation.py',
+    'translate-pages.py',
+}
+
+# Share of toast literals replaced by a known mapping message
+MAPPED_TOAST_RATIO = 0.7
+
+# The three interpolated messages replace-toast-messages.py used to
+# recognize, one hard-coded pattern each; --templates compares them with
+# the general extractor
+SPECIAL_CASE_PATTERNS = [
+    re.compile(r"toast\.success\(`تم استيراد \$\{[^}]+\} منتج بنجاح`\)"),
+    re.compile(r"toast\.success\(`الاتصال ناجح! الحالة: \$\{[^}]+\}`\)"),
+    re.compile(r"toast\.error\(`فشل الاتصال: \$\{[^}]+\}`\)"),
+]
+
+def load_templates():
+    """Return (relative path, text) for every real page"""
+    pages_dir = repo_dir / "client" / "src" / "pages"
+    return [(path.relative_to(pages_dir), path.read_text(encoding='utf-8'))
+            for path in sorted(pages_dir.rglob("*.tsx"))]
+
+def load_messages():
+    """Return the Arabic messages from toast-mapping.json"""
+    with open(repo_dir / "toast-mapping.json", 'r', encoding='utf-8') as f:
+        mapping = json.load(f)
+    return [msg for messages in mapping.values() for msg in messages]
+
+def seed_toasts(text, messages, rng):
+    """Swap most plain toast literals in a page for mapping messages"""
+    literals = sorted((literal for _, literal in toast_literals(text)), key=lambda token: token.start)
+    pieces = []
+    last = 0
+    for literal in literals:
+        if literal.spans or rng.random() >= MAPPED_TOAST_RATIO:
+            continue
+        pieces.append(text[last:literal.start])
+        pieces.append(f"'{rng.choice(messages)}'")
+        last = literal.end
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
+def strip_use_translation(text):
+    """Remove the useTranslation import and hook so the injectors have work"""
+    return ''.join(line for line in text.splitlines(keepends=True) if 'useTranslation' not in line)
+
+def generate_tree(root, pages, templates, messages, seed=0):
+    """Write a synthetic Sari tree with the given number of generated pages"""
+    rng = random.Random(seed)
+    src = root / "client" / "src"
+    shutil.copytree(repo_dir / "client" / "src" / "locales", src / "locales")
+    shutil.copy(repo_dir / "toast-mapping.json", root / "toast-mapping.json")
+
+    # The real pages keep their paths (the injectors target fixed files)
+    for rel_path, text in templates:
+        target = src / "pages" / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(strip_use_translation(seed_toasts(text, messages, rng)), encoding='utf-8')
+
+    for i in range(max(0, pages - len(templates))):
+        rel_path, text = templates[i % len(templates)]
+        target = src / "pages" / "generated" / f"batch{i // 500:03d}" / f"Page{i:05d}.tsx"
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(seed_toasts(text, messages, rng), encoding='utf-8')
+
+def run_script(script, tree, extra_args=(), use_cache=False):
+    """Run one script against a tree; return (wall seconds, phase timings)"""
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        phases_path = f.name
+    env = dict(os.environ, SARI_ROOT=str(tree), SARI_PHASE_TIMINGS=phases_path)
+    cache_args = () if use_cache else ('--no-cache',)
+    try:
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(repo_dir / script), *cache_args, *extra_args],
+            env=env, check=True, stdout=subprocess.DEVNULL,
+        )
+        wall = time.perf_counter() - start
+        with open(phases_path, 'r', encoding='utf-8') as f:
+            phases = json.load(f)
+    finally:
+        os.unlink(phases_path)
+    return wall, phases
+
+def interpreter_startup(repeat):
+    """Return the fastest wall time of an empty Python run, the floor for every script"""
+    best = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+        wall = time.perf_counter() - start
+        best = wall if best is None else min(best, wall)
+    return best
+
+def import_time(script, repeat):
+    """Return the fastest time to import a script as a module (no work done)"""
+    code = ("import time; start = time.perf_counter(); "
+            "from i18n_tools.scripts import load_script; "
+            f"load_script({script!r}); print(time.perf_counter() - start)")
+    return min(float(subprocess.run([sys.executable, '-c', code], cwd=repo_dir, check=True,
+                                    capture_output=True, text=True).stdout)
+               for _ in range(max(1, repeat)))
+
+def benchmark_startup(scripts, templates, messages, repeat, workdir):
+    """Time each script on a tree it has already processed; return the results"""
+    tree = Path(workdir) / "startup"
+    generate_tree(tree, len(templates), templates, messages)
+    results = []
+    print("=" * 60)
+    print(f"{'script':<36}{'cold':>8}{'warm':>8}{'import':>8}")
+    print("=" * 60)
+    python = interpreter_startup(repeat)
+    print(f"{'python -c pass':<36}{python:>8.3f}{python:>8.3f}")
+    for script in scripts:
+        # The first run does the actual work (and fills the caches)
+        run_script(script, tree, use_cache=True)
+        times = {}
+        for name, use_cache in (('cold', False), ('warm', True)):
+            times[name] = min(run_script(script, tree, use_cache=use_cache)[0]
+                              for _ in range(max(1, repeat)))
+        imports = import_time(script, repeat)
+        results.append({'mode': 'startup', 'script': script, 'cold_seconds': times['cold'],
+                        'warm_seconds': times['warm'], 'import_seconds': imports,
+                        'python_seconds': python})
+        print(f"{script.replace('.py', ''):<36}{times['cold']:>8.3f}{times['warm']:>8.3f}{imports:>8.3f}")
+    print("=" * 60)
+    return results
+
+def retained_bytes(build):
+    """Return (result of build(), bytes it still holds once built)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, size
+
+def benchmark_memory():
+    """Measure the memory all locale files take in each layout; return the results"""
+    locales_dir = repo_dir / "client" / "src" / "locales"
+    paths = sorted(locales_dir.glob("*.json"))
+
+    def load_json():
+        locales = {}
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                locales[path.stem] = json.load(f)
+        return locales
+
+    layouts = [
+        ('json dicts (dict of dicts)', load_json),
+        ('flat dicts (dotted keys)', lambda: {name: dict(flatten(data)) for name, data in load_json().items()}),
+        ('interned catalog', lambda: LocaleCatalog.from_directory(locales_dir)),
+    ]
+    messages = sum(1 for data in load_json().values() for _ in flatten(data))
+    results = []
+    print("=" * 60)
+    print(f"{len(paths)} locales, {messages} messages")
+    print(f"{'layout':<36}{'KiB':>10}{'bytes/msg':>12}")
+    print("=" * 60)
+    for name, build in layouts:
+        _, size = retained_bytes(build)
+        results.append({'mode': 'memory', 'layout': name, 'bytes': size, 'messages': messages})
+        print(f"{name:<36}{size / 1024:>10.1f}{size / messages:>12.1f}")
+    print("=" * 60)
+    return results
+
+def special_case_sites(text):
+    """Return the toast sites the hard-coded special-case patterns recognize"""
+    sites = 0
+    for token in tokenize(text):
+        if token.kind == 'toast' and any(pattern.match(text, token.start) for pattern in SPECIAL_CASE_PATTERNS):
+            sites += 1
+    return sites
+
+def interpolated_sites(text):
+    """Return the toast sites the interpolation extractor turns into one message"""
+    return sum(1 for _, literal in toast_literals(text)
+               if literal.spans and interpolate(text, literal) is not None)
+
+def lexer_sites(text):
+    """Return the toast sites the lexer finds (the cost both approaches share)"""
+    return sum(1 for token in tokenize(text) if token.kind == 'toast')
+
+def benchmark_templates(sizes, templates, repeat):
+    """Time the interpolation extractor against the special-case patterns; return the results"""
+    approaches = [
+        ('lexer only', lexer_sites),
+        ('special cases', special_case_sites),
+        ('interpolation', interpolated_sites),
+    ]
+    results = []
+    print("=" * 70)
+    print(f"{'pages':>7}  {'approach':<18}{'seconds':>10}{'MB/s':>10}{'sites':>10}{'handled':>10}")
+    print("=" * 70)
+    for pages in sizes:
+        texts = [templates[i % len(templates)][1] for i in range(max(pages, len(templates)))]
+        size = sum(len(text.encode('utf-8')) for text in texts)
+        toast_sites = sum(lexer_sites(text) for text in texts)
+        for name, count_sites in approaches:
+            best = None
+            for _ in range(max(1, repeat)):
+                start = time.perf_counter()
+                handled = sum(count_sites(text) for text in texts)
+                seconds = time.perf_counter() - start
+                best = seconds if best is None else min(best, seconds)
+            results.append({'mode': 'templates', 'pages': len(texts), 'approach': name, 'seconds': best,
+                            'bytes': size, 'sites': toast_sites, 'handled': handled})
+            print(f"{len(texts):>7}  {name:<18}{best:>10.3f}{size / best / 1e6:>10.1f}"
+                  f"{toast_sites:>10}{handled:>10}")
+    print("=" * 70)
+    return results
+
+def best_time(fn, repeat):
+    """Return (fastest wall time of fn(), its last result)"""
+    best = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = fn()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best, result
+
+def benchmark_index(sizes, templates, messages, repeat, workdir):
+    """Time building and refreshing the scan index and querying it; return the results"""
+    results = []
+    print("=" * 60)
+    print(f"{'pages':>7}  {'operation':<34}{'ms':>10}{'rows':>8}")
+    print("=" * 60)
+    for pages in sizes:
+        tree = Path(workdir) / f"index-{pages}"
+        generate_tree(tree, pages, templates, messages)
+        files = sorted((tree / "client" / "src" / "pages").rglob("*.tsx"))
+        index_path = Path(workdir) / f"index-{pages}.sqlite"
+
+        def build():
+            if index_path.exists():
+                index_path.unlink()
+            with ScanIndex(index_path) as index:
+                return index.refresh(tree)['scanned']
+
+        def touch_some():
+            # 1% of the pages change between refreshes
+            for path in files[::100]:
+                path.write_text(path.read_text(encoding='utf-8') + "\n", encoding='utf-8')
+            with ScanIndex(index_path) as index:
+                return index.refresh(tree)['scanned']
+
+        def record(name, fn, runs):
+            seconds, rows = best_time(fn, runs)
+            results.append({'mode': 'index', 'pages': len(files), 'operation': name,
+                            'seconds': seconds, 'rows': rows})
+            print(f"{len(files):>7}  {name:<34}{seconds * 1000:>10.1f}{rows:>8}")
+
+        record('build', build, 1)
+        record('refresh, 1% changed', touch_some, 1)
+        with ScanIndex(index_path) as index:
+            record('refresh, nothing changed', lambda: index.refresh(tree)['scanned'], repeat)
+            record('query raw-toasts', lambda: len(index.raw_toasts('client/src/pages')), repeat)
+            record('query key toast.orders.*', lambda: len(index.key_uses('toast.orders.*')), repeat)
+            record('query missing-hook', lambda: len(index.missing_hooks()), repeat)
+    print("=" * 60)
+    return results
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=repo_dir,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def save_run(run, output):
+    """Append a run to the results file"""
+    # Keep every run in one file so regressions show up across commits
+    history = []
+    if os.path.exists(output):
+        with open(output, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+    history.append(run)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2)
+    print(f"Results appended to {output}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the i18n codemod scripts")
+    parser.add_argument('--pages', type=int, nargs='+', default=[100, 1000],
+                        help="tree sizes to benchmark; the real pages are always included (default: 100 1000)")
+    parser.add_argument('--scripts', nargs='+', default=SCRIPTS, choices=SCRIPTS,
+                        help="scripts to run (default: all)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="runs per script, the fastest is kept (default: 3)")
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="also run the scripts that support it with --async")
+    parser.add_argument('--startup', action='store_true',
+                        help="time startup (cold and warm) on an already processed tree instead")
+    parser.add_argument('--memory', action='store_true',
+                        help="measure the memory the locale files take in each catalog layout instead")
+    parser.add_argument('--index', action='store_true',
+                        help="time building, refreshing and querying the scan index instead")
+    parser.add_argument('--templates', action='store_true',
+                        help="time the interpolated-message extractor against the old special cases instead")
+    parser.add_argument('--output', '-o', default='i18n-benchmark.json',
+                        help="JSON file the results are appended to")
+    args = parser.parse_args()
+
+    run = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': git_commit(),
+        'python': sys.version.split()[0],
+        'results': [],
+    }
+    if args.memory:
+        run['results'] = benchmark_memory()
+        save_run(run, args.output)
+        return
+
+    templates = load_templates()
+    if args.templates:
+        run['results'] = benchmark_templates(args.pages, templates, args.repeat)
+        save_run(run, args.output)
+        return
+    messages = load_messages()
+    if args.index:
+        with tempfile.TemporaryDirectory(prefix='sari-bench-') as workdir:
+            run['results'] = benchmark_index(args.pages, templates, messages, args.repeat, workdir)
+        save_run(run, args.output)
+        return
+    if args.startup:
+        with tempfile.TemporaryDirectory(prefix='sari-bench-') as workdir:
+            run['results'] = benchmark_startup(args.scripts, templates, messages, args.repeat, workdir)
+        save_run(run, args.output)
+        return
+
+    print("=" * 86)
+    print(f"{'pages':>7}  {'script':<36}{'wall':>8}{'read':>8}{'match':>8}{'rewrite':>9}{'write':>8}")
+    print("=" * 86)
+    with tempfile.TemporaryDirectory(prefix='sari-bench-') as workdir:
+        for pages in args.pages:
+            template_tree = Path(workdir) / f"tree-{pages}"
+            generate_tree(template_tree, pages, templates, messages)
+            runs = [(script, ()) for script in args.scripts]
+            if args.use_async:
+                runs += [(script, ('--async',)) for script in args.scripts if script in ASYNC_SCRIPTS]
+            for script, extra_args in runs:
+                best = None
+                for _ in range(max(1, args.repeat)):
+                    # Scripts rewrite the tree, so every run gets a fresh copy
+                    tree = Path(workdir) / "run"
+                    shutil.rmtree(tree, ignore_errors=True)
+                    shutil.copytree(template_tree, tree)
+                    wall, phases = run_script(script, tree, extra_args)
+                    if best is None or wall < best[0]:
+                        best = (wall, phases)
+                wall, phases = best
+                run['results'].append({'pages': pages, 'script': script, 'args': list(extra_args),
+                                       'wall_seconds': wall, 'phases': phases})
+                seconds = {name: phases.get(name, {}).get('seconds', 0.0)
+                           for name in ('read', 'match', 'rewrite', 'write')}
+                label = ' '.join((script.replace('.py', ''),) + extra_args)
+                print(f"{pages:>7}  {label:<36}{wall:>8.3f}{seconds['read']:>8.3f}"
+                      f"{seconds['match']:>8.3f}{seconds['rewrite']:>9.3f}{seconds['write']:>8.3f}")
+            shutil.rmtree(template_tree)
+    print("=" * 86)
+    save_run(run, args.output)
+
+if __name__ == "__main__":
+    main()
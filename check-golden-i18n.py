@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Script to check the toast codemods against a golden-output corpus.
+
+i18n-golden/input is a small Sari tree drawn from the real client: the
+pages add-usetranslation.py targets, with their toast t('key') calls
+turned back into the Arabic messages toast-mapping.json gives those keys
+and the useTranslation lines removed, next to the locales they were
+translated with. Cases the real pages lack (interpolated template-literal
+toasts, arrow and memo() components) are appended to them from
+i18n-golden/fixtures, and extract-toast-messages.py is run on the tree so
+its mapping and ar.json carry the content-addressed keys the codemods
+emit. i18n-golden/expected/<script> holds the pages
+replace-toast-messages.py and add-usetranslation.py make of it.
+
+Each script is run on a copy of the input tree and every page must come
+out byte for byte equal to its golden output. The rewrite is then timed
+in process (rewrite_toasts and inject_use_translation over the corpus,
+best of --repeat, so interpreter startup does not drown 20 pages) next
+to a reference pass over the same pages that uses no codemod code. The
+reference time divided by the rewrite time must reach the ratio set in
+i18n-golden/gates.json, so the gate holds on slower machines: a change
+that makes a codemod slower fails the check the way a wrong output does.
+
+After a change meant to alter the output, --update records the golden
+outputs again from the current scripts; --refresh-inputs also rebuilds
+the input tree from the real pages first.
+"""
+import difflib
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import argparse
+from pathlib import Path
+
+from i18n_tools.scripts import load_script
+from i18n_tools.tsx_lexer import WHITESPACE_RE, tokenize
+
+repo_dir = Path(__file__).resolve().parent
+
+CORPUS_DIR = repo_dir / "i18n-golden"
+INPUT_DIR = CORPUS_DIR / "input"
+EXPECTED_DIR = CORPUS_DIR / "expected"
+FIXTURES_DIR = CORPUS_DIR / "fixtures"
+GATES_PATH = CORPUS_DIR / "gates.json"
+
+SCRIPTS = [
+    'replace-toast-messages.py',
+    'add-usetranslation.py',
+]
+
+# Lines of unified diff shown per mismatched page
+DIFF_LINES = 20
+
+# Words and punctuation, for the reference pass of the throughput gate
+REFERENCE_RE = re.compile(r"[\w$]+|\S")
+
+def legacy_messages():
+    """Return {legacy toast key: Arabic message} from toast-mapping.json (first message per key)"""
+    with open(repo_dir / "toast-mapping.json", 'r', encoding='utf-8') as f:
+        mapping = json.load(f)
+    messages = {}
+    for category in mapping.values():
+        for msg, key in category.items():
+            messages.setdefault(key, msg)
+    return messages
+
+def quote(text):
+    """Return text as a single-quoted TS string literal"""
+    return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+def untranslate(text, messages):
+    """Return a page with each toast.xxx(t('key')...) argument turned back into
+    its Arabic message, as the page was before the codemods ran"""
+    tokens = {}
+    heads = []
+    for token in tokenize(text):
+        tokens[token.start] = token
+        if token.kind == 'toast':
+            heads.append(token)
+    pieces = []
+    last = 0
+    for head in heads:
+        call = tokens.get(WHITESPACE_RE.match(text, head.end).end())
+        if call is None or call.kind != 'translate':
+            continue
+        key = tokens.get(WHITESPACE_RE.match(text, call.end).end())
+        if key is None or key.kind != 'string' or key.value not in messages:
+            continue
+        close = WHITESPACE_RE.match(text, key.end).end()
+        if not text.startswith(')', close):
+            continue
+        pieces.append(text[last:call.start])
+        pieces.append(quote(messages[key.value]))
+        last = close + 1
+    pieces.append(text[last:])
+    return ''.join(pieces)
+
+def refresh_inputs():
+    """Rebuild the input tree from the real pages, the fixtures, toast-mapping.json
+    and the locales, then run extract-toast-messages.py on it"""
+    benchmark = load_script('benchmark-i18n.py')
+    pages = load_script('add-usetranslation.py').files
+    messages = legacy_messages()
+    shutil.rmtree(INPUT_DIR, ignore_errors=True)
+    (INPUT_DIR / "client" / "src" / "locales").mkdir(parents=True)
+    shutil.copy(repo_dir / "toast-mapping.json", INPUT_DIR / "toast-mapping.json")
+    for locale in ('ar.json', 'en.json'):
+        shutil.copy(repo_dir / "client" / "src" / "locales" / locale,
+                    INPUT_DIR / "client" / "src" / "locales" / locale)
+    fixtures = 0
+    for rel_path in pages:
+        text = benchmark.strip_use_translation(untranslate((repo_dir / rel_path).read_text(encoding='utf-8'), messages))
+        fixture = FIXTURES_DIR / rel_path
+        if fixture.exists():
+            text += fixture.read_text(encoding='utf-8')
+            fixtures += 1
+        target = INPUT_DIR / rel_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(text, encoding='utf-8')
+    subprocess.run([sys.executable, str(repo_dir / 'extract-toast-messages.py'), '--root', str(INPUT_DIR), '--no-cache'],
+                   check=True, stdout=subprocess.DEVNULL)
+    print(f"✓ Input tree rebuilt from {len(pages)} pages ({fixtures} with fixtures)")
+
+def page_paths(tree):
+    """Return the .tsx pages of a tree, relative to it, in a stable order"""
+    pages_dir = tree / "client" / "src" / "pages"
+    if not pages_dir.exists():
+        return []
+    return sorted(path.relative_to(tree) for path in pages_dir.rglob("*.tsx"))
+
+def run_codemod(script, workdir):
+    """Run a script (without caches) on a fresh copy of the input tree; return the tree"""
+    tree = Path(workdir) / script.replace('.py', '')
+    shutil.rmtree(tree, ignore_errors=True)
+    shutil.copytree(INPUT_DIR, tree)
+    subprocess.run([sys.executable, str(repo_dir / script), '--root', str(tree), '--no-cache'],
+                   cwd=workdir, check=True, stdout=subprocess.DEVNULL)
+    return tree
+
+def compare_pages(tree, expected):
+    """Return (page, problem, diff lines) for each page of tree that differs from expected"""
+    problems = []
+    actual_pages = page_paths(tree)
+    expected_pages = page_paths(expected)
+    for rel_path in sorted(set(actual_pages) | set(expected_pages)):
+        if rel_path not in expected_pages:
+            problems.append((rel_path, "no golden output", []))
+            continue
+        if rel_path not in actual_pages:
+            problems.append((rel_path, "missing from the output", []))
+            continue
+        actual = (tree / rel_path).read_bytes()
+        golden = (expected / rel_path).read_bytes()
+        if actual != golden:
+            diff = list(difflib.unified_diff(
+                golden.decode('utf-8').splitlines(), actual.decode('utf-8').splitlines(),
+                'expected', 'actual', lineterm='', n=1))
+            problems.append((rel_path, "differs", diff[:DIFF_LINES]))
+    return problems
+
+def record_outputs(workdir):
+    """Run each script on the input tree and store its pages as the golden output"""
+    for script in SCRIPTS:
+        tree = run_codemod(script, workdir)
+        expected = EXPECTED_DIR / script.replace('.py', '')
+        changed = len(compare_pages(tree, expected))
+        shutil.rmtree(expected, ignore_errors=True)
+        for rel_path in page_paths(tree):
+            target = expected / rel_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(tree / rel_path, target)
+        print(f"✓ {script}: {len(page_paths(expected))} golden pages recorded ({changed} changed)")
+
+def check_outputs(workdir):
+    """Compare each script's output with the golden pages; return the number of failures"""
+    failures = 0
+    for script in SCRIPTS:
+        tree = run_codemod(script, workdir)
+        problems = compare_pages(tree, EXPECTED_DIR / script.replace('.py', ''))
+        if not problems:
+            print(f"✓ {script}: {len(page_paths(tree))} pages match the golden output")
+            continue
+        failures += 1
+        print(f"✗ {script}: {len(problems)} pages differ from the golden output")
+        for rel_path, problem, diff in problems:
+            print(f"  - {rel_path.as_posix()}: {problem}")
+            for line in diff:
+                print(f"      {line}")
+    return failures
+
+def codemod_rewrites():
+    """Return {script: rewrite(rel_path, text) -> output} for the in-process timing"""
+    replace = load_script('replace-toast-messages.py')
+    inject = load_script('add-usetranslation.py')
+    replace.load_mappings(str(INPUT_DIR), use_cache=False)
+    return {
+        'replace-toast-messages.py': lambda rel_path, text: replace.rewrite_toasts(INPUT_DIR / rel_path, text)[0],
+        'add-usetranslation.py': lambda rel_path, text: inject.inject_use_translation(text),
+    }
+
+def reference_pass(text):
+    """Return the word counts of a page: the reference workload the codemods
+    are timed against (regex scanning plus Python per token, like theirs)"""
+    counts = {}
+    for line in text.splitlines():
+        for word in REFERENCE_RE.findall(line):
+            counts[word] = counts.get(word, 0) + 1
+    return counts
+
+def time_against_reference(fn, pages, repeat):
+    """Return (fastest time of the reference pass, fastest time of fn(), its
+    last result), the two timed in turn so both see the same machine load"""
+    reference = seconds = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        for _, text in pages:
+            reference_pass(text)
+        middle = time.perf_counter()
+        result = fn()
+        end = time.perf_counter()
+        reference = middle - start if reference is None else min(reference, middle - start)
+        seconds = end - middle if seconds is None else min(seconds, end - middle)
+    return reference, seconds, result
+
+def check_throughput(repeat):
+    """Time each rewrite over the corpus against its gate; return the number of failures"""
+    with open(GATES_PATH, 'r', encoding='utf-8') as f:
+        gates = json.load(f)
+    pages = [(rel_path, (INPUT_DIR / rel_path).read_text(encoding='utf-8')) for rel_path in page_paths(INPUT_DIR)]
+    failures = 0
+    print(f"{'script':<30}{'files/s':>10}{'ratio':>10}{'gate':>10}")
+    for script, rewrite in codemod_rewrites().items():
+        reference, seconds, outputs = time_against_reference(
+            lambda: [rewrite(rel_path, text) for rel_path, text in pages], pages, repeat)
+        rate = len(pages) / seconds
+        ratio = reference / seconds
+        gate = gates[script]['min_speed_ratio']
+        # The timed rewrite must be the one whose output was checked
+        expected = EXPECTED_DIR / script.replace('.py', '')
+        same = all(output.encode('utf-8') == (expected / rel_path).read_bytes()
+                   for (rel_path, _), output in zip(pages, outputs))
+        ok = same and ratio >= gate
+        failures += not ok
+        note = "" if same else "  (in-process output differs from the golden output)"
+        print(f"{'✓' if ok else '✗'} {script:<28}{rate:>10.0f}{ratio:>10.2f}{gate:>10.2f}{note}")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the toast codemods against the golden-output corpus")
+    parser.add_argument('--update', action='store_true',
+                        help="record the golden outputs again from the current scripts")
+    parser.add_argument('--refresh-inputs', action='store_true',
+                        help="rebuild the input tree from the real pages (implies --update)")
+    parser.add_argument('--repeat', type=int, default=10,
+                        help="timed passes over the corpus, the fastest is kept (default: 10)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Golden-output check of the toast codemods")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory(prefix='sari-golden-') as workdir:
+        if args.refresh_inputs:
+            refresh_inputs()
+        if args.update or args.refresh_inputs:
+            record_outputs(workdir)
+            return
+        failures = check_outputs(workdir)
+    print()
+    failures += check_throughput(args.repeat)
+    print("=" * 60)
+    if failures:
+        print(f"✗ {failures} checks failed")
+        sys.exit(1)
+    print("✓ All checks passed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Script to report locale coverage: which translation keys the pages use,
+which ones each locale defines, and which are missing or orphaned
+"""
+import json
+import sys
+import argparse
+from pathlib import Path
+
+from i18n_tools import dry_run
+from i18n_tools.cli import add_common_arguments, apply_common_arguments
+from i18n_tools.locale_catalog import SOURCE_LOCALE, load_catalog
+from i18n_tools.mapped_file import MappedFile
+from i18n_tools.scan_index import ScanIndex, default_index_path
+from i18n_tools.tsx_lexer import translation_keys
+
+def scan_file(file_path):
+    """Return (file_path, sorted keys used by t('...') calls in the file)"""
+    with MappedFile(file_path) as source:
+        if b't(' not in source:
+            return file_path, []
+        content = source.text()
+    return file_path, sorted({key for _, key in translation_keys(content)})
+
+def scan_tree(directory, jobs=1):
+    """Return {key: [files using it]} for every TSX file under directory"""
+    file_paths = sorted(directory.rglob("*.tsx"))
+    if jobs > 1:
+        # Imported on use: most runs are serial
+        from multiprocessing import Pool
+        with Pool(jobs) as pool:
+            results = pool.map(scan_file, file_paths, chunksize=16)
+    else:
+        results = map(scan_file, file_paths)
+
+    # Results are in file order, so the report is the same for any --jobs
+    usage = {}
+    for file_path, keys in results:
+        for key in keys:
+            usage.setdefault(key, []).append(str(file_path.relative_to(directory)))
+    return usage, len(file_paths)
+
+def build_report(usage, files_scanned, catalog):
+    """Compute used, defined, missing, untranslated and orphaned keys per locale"""
+    used = sorted(usage)
+    source_keys = set(catalog.locale_keys(SOURCE_LOCALE))
+    report = {
+        'files_scanned': files_scanned,
+        'used_keys': len(used),
+        'source_locale': SOURCE_LOCALE,
+        # Keys the source locale defines but no page references
+        'orphaned': sorted(source_keys - set(used)),
+        'locales': {},
+    }
+    for locale in catalog.locales:
+        defined = catalog.locale_keys(locale)
+        report['locales'][locale] = {
+            'defined': len(defined),
+            # Used by pages but not defined in this locale
+            'missing': {key: usage[key] for key in used if not catalog.has(key, locale)},
+            # Defined in the source locale but not in this one
+            'untranslated': catalog.missing(locale),
+            # Defined here but not in the source locale
+            'extra': [key for key in defined if key not in source_keys],
+        }
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description="Report translation key coverage across locales")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="number of worker processes (default: 1)")
+    parser.add_argument('--output', '-o',
+                        help="write the JSON report to this file ('-' for stdout)")
+    parser.add_argument('--strict', action='store_true',
+                        help="exit with status 1 if pages use keys missing from the source locale")
+    parser.add_argument('--index', action='store_true',
+                        help="take key usage from the scan index (see query-i18n.py), "
+                             "rescanning only files changed since it was last refreshed")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="parse the locale files instead of reading the catalog snapshot")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+    root = apply_common_arguments(args)
+
+    # Paths
+    client_dir = Path(f"{root}/client/src")
+    locales_dir = client_dir / "locales"
+
+    if args.index:
+        with ScanIndex(default_index_path(root)) as index:
+            index.refresh(root)
+            usage, files_scanned = index.usage()
+    else:
+        usage, files_scanned = scan_tree(client_dir, max(1, args.jobs))
+    catalog = load_catalog(locales_dir, use_snapshot=not args.no_cache)
+    report = build_report(usage, files_scanned, catalog)
+
+    if args.output == '-':
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        if args.output:
+            output = Path(args.output)
+            original = output.read_text(encoding='utf-8') if output.exists() else None
+            dry_run.write_file(output, json.dumps(report, ensure_ascii=False, indent=2), original)
+        print("=" * 60)
+        print("Locale Coverage")
+        print("=" * 60)
+        print(f"Files scanned: {report['files_scanned']}")
+        print(f"Keys used: {report['used_keys']}")
+        print(f"Orphaned {SOURCE_LOCALE} keys: {len(report['orphaned'])}")
+        print()
+        print(f"{'locale':<8}{'defined':>10}{'missing':>10}{'untranslated':>15}{'extra':>8}")
+        for locale, info in report['locales'].items():
+            print(f"{locale:<8}{info['defined']:>10}{len(info['missing']):>10}"
+                  f"{len(info['untranslated']):>15}{len(info['extra']):>8}")
+        print("=" * 60)
+        if args.output and not args.dry_run:
+            print(f"Report written to {args.output}")
+
+    dry_run.close()
+    if args.strict and report['locales'].get(SOURCE_LOCALE, {}).get('missing'):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
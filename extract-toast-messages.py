@@ -3,14 +3,30 @@
 Script to extract all toast messages and create translation keys
 """
 import re
-import json
 import os
+import json
+import argparse
 from collections import defaultdict
+from pathlib import Path
+
+from i18n_tools import dry_run
+from i18n_tools.cli import add_common_arguments, apply_common_arguments
+from i18n_tools.file_cache import FileCache, content_hash, mapping_hash, read_source
+from i18n_tools.interpolation import interpolate
+from i18n_tools.keyword_rules import KeywordRules
+from i18n_tools.locale_catalog import load_catalog
+from i18n_tools.locale_writer import LocaleWriter, write_atomic
+from i18n_tools.mapped_file import MappedFile
+from i18n_tools.phases import phase
+from i18n_tools.scripts import load_script
+from i18n_tools.toast_keys import (MIGRATION_FILE, is_legacy_leaf, load_migration,
+                                   message_leaf, normalize_message)
+from i18n_tools.tsx_lexer import toast_literals
 
-# Paths
-pages_dir = "/home/ubuntu/sari/client/src/pages"
-ar_json_path = "/home/ubuntu/sari/client/src/locales/ar.json"
-en_json_path = "/home/ubuntu/sari/client/src/locales/en.json"
+# Bump when the categorization rules change so cached results are invalidated
+CODEMOD_VERSION = 3
+
+ARABIC_RE = re.compile(r'[\u0600-\u06FF]')
 
 # Toast message translations
 toast_translations = {
@@ -152,60 +168,258 @@ toast_translations = {
     
     # Support
     'تم إرسال رسالتك بنجاح! سنرد عليك في أقرب وقت.': 'Your message has been sent successfully! We will reply soon.',
+    
+    # Interpolated messages (template literals; {{name}} is the interpolated value)
+    'تم نسخ {{label}}': '{{label}} copied',
+    'تم نسخ {{label}} إلى الحافظة': '{{label}} copied to clipboard',
+    'تم اختيار: {{value}}...': 'Selected: {{value}}...',
+    'تم تنفيذ: {{action}}': 'Done: {{action}}',
+    'تم تطبيق القالب "{{name}}" بنجاح': 'Template "{{name}}" applied successfully',
+    'تم تطبيق سيناريو: {{title}}': 'Scenario applied: {{title}}',
+    'تم إرسال {{success}} إشعار تجريبي بنجاح!': '{{success}} test notifications sent successfully!',
+    '✅ تم تسجيل الاتفاق بقيمة {{dealValue}} ريال': '✅ Deal recorded with a value of {{dealValue}} SAR',
+    'تم استيراد {{imported}} منتج بنجاح': '{{imported}} products imported successfully',
+    'تم مزامنة {{count}} منتج بنجاح': '{{count}} products synced successfully',
+    'تم مزامنة {{count}} طلب بنجاح': '{{count}} orders synced successfully',
+    'الاتصال ناجح! الحالة: {{status}}': 'Connection successful! Status: {{status}}',
+    'الاتصال ناجح! ✅\nالحالة: {{status}}': 'Connection successful! ✅\nStatus: {{status}}',
+    'فشل الاتصال: {{message}}': 'Connection failed: {{message}}',
+    'فشل فصل الاتصال: {{message}}': 'Failed to disconnect: {{message}}',
+    'فشل إلغاء الموعد: {{message}}': 'Failed to cancel appointment: {{message}}',
+    'فشل إضافة الموظف: {{message}}': 'Failed to add staff member: {{message}}',
+    'فشل تحديث الموظف: {{message}}': 'Failed to update staff member: {{message}}',
+    'فشل حذف الموظف: {{message}}': 'Failed to delete staff member: {{message}}',
+    'فشل إعادة الإرسال: {{message}}': 'Failed to resend: {{message}}',
+    'فشل في إعادة الإرسال: {{message}}': 'Failed to resend: {{message}}',
+    'فشل التحديث: {{message}}': 'Update failed: {{message}}',
+    'فشل في الحذف: {{message}}': 'Failed to delete: {{message}}',
+    'فشل حفظ البيانات: {{message}}': 'Failed to save data: {{message}}',
+    'فشل حذف البيانات: {{message}}': 'Failed to delete data: {{message}}',
+    'فشل حفظ الإعدادات: {{message}}': 'Failed to save settings: {{message}}',
+    'فشل إرسال الرسالة: {{message}}': 'Failed to send message: {{message}}',
+    'فشل إرسال الصورة: {{message}}': 'Failed to send image: {{message}}',
+    'فشل إرسال البريد: {{message}}': 'Failed to send email: {{message}}',
+    'خطأ: {{message}}': 'Error: {{message}}',
+    'خطأ غير متوقع: {{message}}': 'Unexpected error: {{message}}',
 }
 
+# Categories, first match wins; each alternative lists keywords that must
+# all occur in the Arabic ('ar') or English ('en', 'en_lower') text, and
+# 'not_ar' keywords that must not
+CATEGORY_RULES = [
+    ('products', [{'ar': ['منتج']}, {'en': ['Product']}]),
+    ('orders', [{'ar': ['طلب'], 'not_ar': ['الواتساب']}, {'en': ['Order']}]),
+    ('campaigns', [{'ar': ['حملة']}, {'en': ['Campaign']}]),
+    ('conversations', [{'ar': ['تسجيل']}, {'en': ['Recording']}]),
+    ('discounts', [{'ar': ['كود']}, {'en': ['Discount']}, {'en_lower': ['code']}]),
+    ('whatsapp', [{'ar': ['واتساب']}, {'en': ['WhatsApp']}]),
+    ('settings', [{'ar': ['حساب']}, {'ar': ['متجر']}, {'en': ['Account']}, {'en': ['Store']}]),
+    ('subscriptions', [{'ar': ['باقة']}, {'en': ['Plan']}, {'ar': ['اشتراك']}, {'en': ['Subscri']}]),
+    ('carts', [{'ar': ['سلة']}, {'en': ['Cart']}]),
+    ('instances', [{'ar': ['Instance']}, {'en': ['Instance']}]),
+    ('notifications', [{'ar': ['إشعار']}, {'ar': ['قالب']}, {'en': ['Notification']}, {'en': ['Template']}]),
+    ('analytics', [{'ar': ['تصدير']}, {'en': ['PDF']}, {'en': ['Excel']}]),
+    ('upload', [{'ar': ['رفع']}, {'ar': ['استيراد']}, {'en': ['CSV']},
+                {'en_lower': ['upload']}, {'en_lower': ['import']}]),
+    ('merchants', [{'ar': ['تاجر']}, {'en': ['Merchant']}]),
+    ('salla', [{'ar': ['Salla']}, {'en': ['Salla']}]),
+    ('support', [{'ar': ['رسالة', 'إرسال']}]),
+]
+
+# Map common patterns to keys
+KEY_RULES = [
+    (key, [{'ar': [ar]}]) for ar, key in [
+        ('تم إضافة', 'added'),
+        ('تم تحديث', 'updated'),
+        ('تم حذف', 'deleted'),
+        ('تم إنشاء', 'created'),
+        ('تم إرسال', 'sent'),
+        ('تم تفعيل', 'enabled'),
+        ('تم تعطيل', 'disabled'),
+        ('تم حفظ', 'saved'),
+        ('تم تصدير', 'exported'),
+        ('تم استيراد', 'imported'),
+        ('تم قبول', 'approved'),
+        ('تم رفض', 'rejected'),
+        ('تم إلغاء', 'cancelled'),
+        ('فشل', 'failed'),
+        ('يرجى', 'please'),
+        ('الرجاء', 'please'),
+        ('المنتج', 'product'),
+        ('الطلب', 'order'),
+        ('الحملة', 'campaign'),
+        ('كود الخصم', 'discount_code'),
+        ('الإشعار', 'notification'),
+        ('القالب', 'template'),
+        ('الباقة', 'plan'),
+        ('التاجر', 'merchant'),
+        ('الحالة', 'status'),
+        ('بنجاح', 'success'),
+    ]
+]
+
+# Both tables in one matcher, so a message needs a single scan
+message_rules = KeywordRules(
+    {'category': CATEGORY_RULES, 'key': KEY_RULES},
+    defaults={'category': 'common', 'key': 'message'},
+)
+
+def classify_message(ar_msg, en_msg):
+    """Return (category, key) for a message"""
+    result = message_rules.classify({'ar': ar_msg, 'en': en_msg, 'en_lower': en_msg.lower()})
+    return result['category'], result['key']
+
 def create_toast_key(ar_text):
     """Create a translation key from Arabic text"""
     # Remove special characters and normalize
     key = ar_text.strip()
-    
-    # Map common patterns to keys
-    key_mappings = {
-        'تم إضافة': 'added',
-        'تم تحديث': 'updated',
-        'تم حذف': 'deleted',
-        'تم إنشاء': 'created',
-        'تم إرسال': 'sent',
-        'تم تفعيل': 'enabled',
-        'تم تعطيل': 'disabled',
-        'تم حفظ': 'saved',
-        'تم تصدير': 'exported',
-        'تم استيراد': 'imported',
-        'تم قبول': 'approved',
-        'تم رفض': 'rejected',
-        'تم إلغاء': 'cancelled',
-        'فشل': 'failed',
-        'يرجى': 'please',
-        'الرجاء': 'please',
-        'المنتج': 'product',
-        'الطلب': 'order',
-        'الحملة': 'campaign',
-        'كود الخصم': 'discount_code',
-        'الإشعار': 'notification',
-        'القالب': 'template',
-        'الباقة': 'plan',
-        'التاجر': 'merchant',
-        'الحالة': 'status',
-        'بنجاح': 'success',
-    }
-    
-    # Simple key generation
-    for ar, en in key_mappings.items():
-        if ar in key:
-            return en
-    
-    return 'message'
+    return message_rules.classify({'ar': key})['key']
 
-def main():
-    print("Extracting toast messages...")
-    print("=" * 60)
+def build_migration(old_toast, message_keys):
+    """Map the msgN keys of an existing toast section to the keys of the same messages"""
+    migration = {}
+    for cat, entries in old_toast.items():
+        if not isinstance(entries, dict):
+            continue
+        for leaf, text in entries.items():
+            if is_legacy_leaf(leaf) and isinstance(text, str):
+                new_key = message_keys.get(normalize_message(text))
+                if new_key is not None:
+                    migration[f"toast.{cat}.{leaf}"] = new_key
+    return migration
+
+def migrate_toast_section(toast, migration):
+    """Return a toast section with its msgN keys renamed as in migration"""
+    migrated = {}
+    for cat, entries in toast.items():
+        if not isinstance(entries, dict):
+            migrated[cat] = entries
+            continue
+        for leaf, value in entries.items():
+            new_key = migration.get(f"toast.{cat}.{leaf}")
+            new_cat, new_leaf = new_key.split('.')[1:] if new_key else (cat, leaf)
+            migrated.setdefault(new_cat, {}).setdefault(new_leaf, value)
+    return migrated
+
+def write_json(path, data, original):
+    """Write data as indented JSON if it differs from the original text"""
+    text = json.dumps(data, ensure_ascii=False, indent=2) + '\n'
+    if text == original:
+        return False
+    dry_run.write_file(path, text, original, write_atomic)
+    return True
+
+def toast_messages(content):
+    """Yield the Arabic toast messages of a page; template literals with
+    ${...} interpolations come out with {{name}} placeholders"""
+    with phase('match'):
+        literals = [literal for _, literal in toast_literals(content)]
+        for literal in literals:
+            if literal.spans:
+                interpolation = interpolate(content, literal)
+                if interpolation is None:
+                    continue
+                message = interpolation.message
+            else:
+                message = literal.value
+            if ARABIC_RE.search(message):
+                yield message
+
+def has_translation(message, catalog):
+    """Return True if toast_translations or the locales have the message"""
+    return message in toast_translations or catalog.key_for_text(message) is not None
+
+def untranslated_literals(content, catalog):
+    """Yield the Arabic toast messages of a page that have no entry in toast_translations or the locales"""
+    for message in toast_messages(content):
+        if not has_translation(message, catalog):
+            yield message
+
+def find_interpolated_toasts(directory):
+    """Return {message: pages} for the interpolated Arabic toast messages in pages"""
+    found = defaultdict(list)
+    for file_path in sorted(Path(directory).rglob("*.tsx")):
+        with phase('read'):
+            with MappedFile(file_path) as source:
+                # Only pages with a toast call and an interpolation are decoded
+                if b'toast.' not in source or b'${' not in source:
+                    continue
+                content = source.text()
+        for message in toast_messages(content):
+            if '{{' in message:
+                found[message].append(file_path.relative_to(directory))
+    return found
+
+def find_untranslated_toasts(directory, catalog):
+    """Return Arabic toast literals in pages with no entry in toast_translations or the locales"""
+    untranslated = defaultdict(list)
+    for file_path in sorted(Path(directory).rglob("*.tsx")):
+        with phase('read'):
+            with MappedFile(file_path) as source:
+                # Pages without a toast call are never decoded
+                if b'toast.' not in source:
+                    continue
+                content = source.text()
+        for message in untranslated_literals(content, catalog):
+            untranslated[message].append(file_path.relative_to(directory))
+    return untranslated
+
+def report_untranslated(untranslated):
+    """Print the toast messages pages use without a translation"""
+    if untranslated:
+        print(f"⚠ {len(untranslated)} toast messages in pages have no translation:")
+        for ar_msg, files in list(untranslated.items())[:20]:
+            print(f"  - {ar_msg} ({files[0]}, {len(files)} files)")
+        if len(untranslated) > 20:
+            print(f"  ... and {len(untranslated) - 20} more")
+        print("=" * 60)
+
+def extracted_interpolations(ar_toast, en_toast):
+    """Yield (Arabic message, English message or None) for the interpolated
+    messages of an existing toast section"""
+    for cat, entries in ar_toast.items():
+        if not isinstance(entries, dict):
+            continue
+        en_entries = en_toast.get(cat)
+        for leaf, text in entries.items():
+            if isinstance(text, str) and '{{' in text:
+                en_msg = en_entries.get(leaf) if isinstance(en_entries, dict) else None
+                yield text, en_msg if isinstance(en_msg, str) else None
+
+def update_locales(root, use_cache=True, interpolated=None):
+    """Write the toast section of ar.json / en.json (and follow key changes in
+    the other locales, toast-mapping.json and the migration table); return
+    the migration table, {old key: current key}, for the pages to follow.
+
+    interpolated is {message: pages} for the interpolated messages in pages;
+    the pages are scanned for them if it is None.
+    """
+    ar_json_path = f"{root}/client/src/locales/ar.json"
+    en_json_path = f"{root}/client/src/locales/en.json"
+    
+    ar_text, ar_hash = read_source(ar_json_path)
+    en_text, en_hash = read_source(en_json_path)
+    ar_toast = json.loads(ar_text).get('toast', {})
     
-    # Load existing translations
-    with open(ar_json_path, 'r', encoding='utf-8') as f:
-        ar_data = json.load(f)
+    # Interpolated messages get a key each: the ones in pages, and the ones
+    # extracted earlier (pages using their keys no longer show the text).
+    # English comes from toast_translations, else from en.json if it has one
+    if interpolated is None:
+        interpolated = find_interpolated_toasts(f"{root}/client/src/pages")
+    translations = dict(toast_translations)
+    for ar_msg, en_msg in extracted_interpolations(ar_toast, json.loads(en_text).get('toast', {})):
+        translations.setdefault(ar_msg, en_msg)
+    for ar_msg in interpolated:
+        translations.setdefault(ar_msg, None)
     
-    with open(en_json_path, 'r', encoding='utf-8') as f:
-        en_data = json.load(f)
+    # Locale files already written from these translations are left alone
+    cache = FileCache(
+        'extract-toast-messages',
+        mapping_hash(CODEMOD_VERSION, list(translations.items()), CATEGORY_RULES),
+        enabled=use_cache,
+    )
+    up_to_date = cache.get(content_hash(ar_hash + en_hash)) is not None
+    table = load_migration(root)
     
     # Create toast section
     toast_ar = {}
@@ -236,45 +450,12 @@ def main():
     }
     
     # Categorize messages
-    for ar_msg, en_msg in toast_translations.items():
-        if 'منتج' in ar_msg or 'Product' in en_msg:
-            cat = 'products'
-        elif 'طلب' in ar_msg and 'الواتساب' not in ar_msg or 'Order' in en_msg:
-            cat = 'orders'
-        elif 'حملة' in ar_msg or 'Campaign' in en_msg:
-            cat = 'campaigns'
-        elif 'تسجيل' in ar_msg or 'Recording' in en_msg:
-            cat = 'conversations'
-        elif 'كود' in ar_msg or 'Discount' in en_msg or 'code' in en_msg.lower():
-            cat = 'discounts'
-        elif 'واتساب' in ar_msg or 'WhatsApp' in en_msg:
-            cat = 'whatsapp'
-        elif 'حساب' in ar_msg or 'متجر' in ar_msg or 'Account' in en_msg or 'Store' in en_msg:
-            cat = 'settings'
-        elif 'باقة' in ar_msg or 'Plan' in en_msg or 'اشتراك' in ar_msg or 'Subscri' in en_msg:
-            cat = 'subscriptions'
-        elif 'سلة' in ar_msg or 'Cart' in en_msg:
-            cat = 'carts'
-        elif 'Instance' in ar_msg or 'Instance' in en_msg:
-            cat = 'instances'
-        elif 'إشعار' in ar_msg or 'قالب' in ar_msg or 'Notification' in en_msg or 'Template' in en_msg:
-            cat = 'notifications'
-        elif 'تصدير' in ar_msg or 'PDF' in en_msg or 'Excel' in en_msg:
-            cat = 'analytics'
-        elif 'رفع' in ar_msg or 'استيراد' in ar_msg or 'CSV' in en_msg or 'upload' in en_msg.lower() or 'import' in en_msg.lower():
-            cat = 'upload'
-        elif 'تاجر' in ar_msg or 'Merchant' in en_msg:
-            cat = 'merchants'
-        elif 'Salla' in ar_msg or 'Salla' in en_msg:
-            cat = 'salla'
-        elif 'رسالة' in ar_msg and 'إرسال' in ar_msg:
-            cat = 'support'
-        else:
-            cat = 'common'
-        
+    for ar_msg, en_msg in translations.items():
+        cat, _ = classify_message(ar_msg, en_msg or '')
         categories[cat].append((ar_msg, en_msg))
     
     # Build toast object
+    message_keys = {}
     for cat, messages in categories.items():
         if not messages:
             continue
@@ -282,24 +463,77 @@ def main():
         toast_ar[cat] = {}
         toast_en[cat] = {}
         
-        for i, (ar_msg, en_msg) in enumerate(messages, 1):
-            # Create simple numeric keys
-            key = f"msg{i}"
+        for ar_msg, en_msg in messages:
+            # Keys come from the message text, so they survive other edits
+            key = message_leaf(ar_msg)
+            normalized = normalize_message(ar_msg)
+            if key in toast_ar[cat]:
+                if normalize_message(toast_ar[cat][key]) == normalized:
+                    continue
+                raise ValueError(f"Toast key collision in {cat}: {toast_ar[cat][key]!r} and {ar_msg!r}")
             toast_ar[cat][key] = ar_msg
-            toast_en[cat][key] = en_msg
+            if en_msg is not None:
+                toast_en[cat][key] = en_msg
+            message_keys.setdefault(normalized, f"toast.{cat}.{key}")
     
-    # Add to main objects
-    ar_data['toast'] = toast_ar
-    en_data['toast'] = toast_en
-    
-    # Save updated files
-    with open(ar_json_path, 'w', encoding='utf-8') as f:
-        json.dump(ar_data, f, ensure_ascii=False, indent=2)
-    
-    with open(en_json_path, 'w', encoding='utf-8') as f:
-        json.dump(en_data, f, ensure_ascii=False, indent=2)
+    if up_to_date:
+        print("✓ ar.json and en.json already up to date")
+    else:
+        # Keys that change (msgN keys, or a message moving category) are
+        # recorded so pages and other locales can follow
+        migration = build_migration(ar_toast, message_keys)
+        migration = {old: new for old, new in migration.items() if old != new}
+        
+        # Replace the toast section in place; the rest of each file is untouched
+        writer = LocaleWriter()
+        writer.set(ar_json_path, 'toast', toast_ar)
+        writer.set(en_json_path, 'toast', toast_en)
+        for path in sorted(Path(ar_json_path).parent.glob("*.json")):
+            if str(path) in (ar_json_path, en_json_path):
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                toast = json.load(f).get('toast')
+            if isinstance(toast, dict) and migration:
+                migrated = migrate_toast_section(toast, migration)
+                if migrated != toast:
+                    writer.set(str(path), 'toast', migrated)
+        results, written = writer.commit()
+        for path in written:
+            print(f"✓ Updated {os.path.basename(path)}")
+        
+        # Point toast-mapping.json at the new keys
+        mapping_path = f"{root}/toast-mapping.json"
+        if os.path.exists(mapping_path):
+            with open(mapping_path, 'r', encoding='utf-8') as f:
+                mapping_text = f.read()
+            mapping = {
+                group: {ar_msg: message_keys.get(normalize_message(ar_msg), key)
+                        for ar_msg, key in entries.items()}
+                for group, entries in json.loads(mapping_text).items()
+            }
+            if write_json(mapping_path, mapping, mapping_text):
+                print("✓ Updated toast-mapping.json")
+        
+        # Keep earlier migrations pointing at the current keys
+        if migration:
+            table_path = f"{root}/{MIGRATION_FILE}"
+            table_text = None
+            if os.path.exists(table_path):
+                with open(table_path, 'r', encoding='utf-8') as f:
+                    table_text = f.read()
+            table = {old: migration.get(new, new) for old, new in table.items()}
+            table.update(migration)
+            if write_json(table_path, table, table_text):
+                print(f"✓ Recorded {len(migration)} toast key changes in {MIGRATION_FILE}")
+        
+        # A dry run leaves the files as they were, so nothing is cached
+        if dry_run.sink is None:
+            ar_out = results[ar_json_path]
+            en_out = results[en_json_path]
+            cache.set(content_hash(content_hash(ar_out) + content_hash(en_out)), 'written')
+            cache.save()
     
-    print(f"✓ Added {len(toast_translations)} toast messages")
+    print(f"✓ Added {len(translations)} toast messages ({len(interpolated)} interpolated ones found in pages)")
     print(f"✓ Organized into {len([c for c in categories.values() if c])} categories")
     print("=" * 60)
     print("Toast categories:")
@@ -307,7 +541,40 @@ def main():
         if messages:
             print(f"  - {cat}: {len(messages)} messages")
     print("=" * 60)
+    untranslated_en = [ar_msg for ar_msg, en_msg in translations.items() if en_msg is None]
+    if untranslated_en:
+        print(f"⚠ {len(untranslated_en)} interpolated messages have no English translation in toast_translations:")
+        for ar_msg in untranslated_en[:20]:
+            print(f"  - {ar_msg}" + (f" ({interpolated[ar_msg][0]})" if ar_msg in interpolated else ""))
+        print("=" * 60)
+    return table
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract toast messages into ar.json / en.json")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="rebuild the toast section even if the locale files are up to date")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+    root = apply_common_arguments(args)
+    
+    print("Extracting toast messages...")
+    print("=" * 60)
+    
+    migration = update_locales(root, use_cache=not args.no_cache)
+    
+    # The locale files only have the current keys, so the pages follow in
+    # the same run (as migrate-toast-keys.py would)
+    if migration:
+        migrate_toast_keys = load_script('migrate-toast-keys.py')
+        files, keys = migrate_toast_keys.migrate_pages(f"{root}/client/src/pages", migration)
+        print(f"✓ Migrated {keys} toast keys in {files} pages" if keys
+              else "✓ Pages already use the current toast keys")
+        print("=" * 60)
+    
+    catalog = load_catalog(f"{root}/client/src/locales", use_snapshot=not args.no_cache)
+    report_untranslated(find_untranslated_toasts(f"{root}/client/src/pages", catalog))
     print("Done!")
+    dry_run.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,29 @@
+
+const ProductImport = ({ onImport }: { onImport: () => Promise<{ imported: number }> }) => {
+  const handleImport = async () => {
+    try {
+      const data = await onImport();
+      toast.success(`تم استيراد ${data.imported} منتج بنجاح`);
+    } catch (error: any) {
+      toast.error(`فشل الاتصال: ${error.message}`);
+    }
+  };
+
+  return <Button onClick={handleImport}>{t('common.import')}</Button>;
+};
+
+const ConnectionStatus = React.memo(({ status }: { status: string }) => {
+  const handleTest = () => {
+    if (status === 'connected') {
+      toast.success(`الاتصال ناجح! الحالة: ${status}`);
+    } else {
+      toast.error("فشل الاتصال");
+    }
+  };
+
+  return <Button onClick={handleTest}>{t('common.status')}</Button>;
+});
+
+const SyncBadge = ({ count }: { count: number }) => (
+  <span title={t('common.total')}>{count}</span>
+);
@@ -0,0 +1,11 @@
+"""
+Shared helpers for the i18n codemod scripts (extract/replace toast messages,
+add-usetranslation, translate-pages)
+"""
+import os
+
+# Root of the Sari checkout the scripts operate on (override with SARI_ROOT)
+SARI_ROOT = os.environ.get('SARI_ROOT', '/home/ubuntu/sari')
+
+# Concurrent reads/writes of the asyncio pipeline (see pipeline.py)
+DEFAULT_IO_WORKERS = 8
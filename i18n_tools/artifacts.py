@@ -0,0 +1,66 @@
+"""
+Versioned on-disk artifacts for fast startup.
+
+An artifact is data derived from a few input files (the flattened toast
+mapping, the matcher index built from it, ...) that costs more to rebuild
+than to load. It is stored as one pickle in .i18n-cache together with a
+version and the (size, mtime) fingerprint of its inputs, the same scheme
+as the locale catalog snapshot. load_artifact() returns it with a single
+read while both still match, and rebuilds and saves it otherwise.
+
+Artifacts should hold plain data (dicts, lists, strings): a pickled class
+from a script would tie the artifact to the name the script was run under.
+"""
+import os
+import pickle
+from pathlib import Path
+
+from i18n_tools.file_cache import CACHE_DIR, content_hash
+
+
+def fingerprint(paths):
+    """Return (path, size, mtime) for each input file (None for missing ones)"""
+    result = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            result.append((str(path), None))
+            continue
+        result.append((str(path), stat.st_size, stat.st_mtime_ns))
+    return tuple(result)
+
+
+def artifact_path(name, inputs, cache_dir=CACHE_DIR):
+    """Return the artifact file; trees with different inputs get their own"""
+    digest = content_hash('\0'.join(str(Path(path).resolve()) for path in inputs))[:12]
+    return Path(cache_dir) / f"{name}-{digest}.pickle"
+
+
+def load_artifact(name, version, inputs, build, enabled=True, cache_dir=CACHE_DIR):
+    """Return the artifact built by build() from the input files, from disk when current.
+
+    version must change whenever build() would produce something different
+    from the same inputs (a codemod version, a hash of built-in tables).
+    """
+    if not enabled:
+        return build()
+    stamp = (version, fingerprint(inputs))
+    path = artifact_path(name, inputs, cache_dir)
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        saved_stamp, artifact = pickle.loads(data)
+        if saved_stamp == stamp:
+            return artifact
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+        pass
+    artifact = build()
+    # Inputs that changed while building would be stamped wrongly, so the
+    # fingerprint is the one taken before build()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+    with open(tmp_path, 'wb') as f:
+        pickle.dump((stamp, artifact), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return artifact
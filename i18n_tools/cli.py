@@ -0,0 +1,19 @@
+"""
+Command-line options shared by the codemod scripts
+"""
+from i18n_tools import SARI_ROOT, dry_run
+
+
+def add_common_arguments(parser):
+    """Add --root and --dry-run to a script's argument parser"""
+    parser.add_argument('--root', default=SARI_ROOT,
+                        help="Sari checkout to operate on (default: $SARI_ROOT or %(default)s)")
+    parser.add_argument('--dry-run', nargs='?', const='-', metavar='PATCH',
+                        help="write nothing; stream unified diffs to stdout or to PATCH")
+
+
+def apply_common_arguments(args):
+    """Turn on dry run if requested; return the Sari root"""
+    if args.dry_run:
+        dry_run.enable(args.dry_run, args.root)
+    return args.root
@@ -0,0 +1,134 @@
+"""
+Dry-run mode shared by the codemods.
+
+Scripts send every source and locale write through write_file(). When dry
+run is on, no file is written. Each change is instead streamed as a git
+style unified diff (paths relative to the Sari root) to stdout or a patch
+file, so the output can be reviewed or applied with `git apply`. Diffs are
+emitted as each file is processed, so at most one file's before and after
+text is held at a time. When the diffs go to stdout, progress messages move
+to stderr.
+
+Worker processes call defer() and hand their diffs back to the parent
+(take()), which emits them in file order. Concurrent writers use render()
+and leave emitting to whoever restores the order.
+"""
+import os
+import sys
+
+# Open stream the diffs go to, or None when dry run is off
+sink = None
+root = None
+deferred = None
+# True when sink is a patch file enable() opened, which close() closes
+owns_sink = False
+# sys.stdout as it was before enable() moved progress messages to stderr
+saved_stdout = None
+
+
+def enable(output='-', root_dir=None):
+    """Turn dry run on, writing diffs to output ('-' for stdout)"""
+    global sink, root, owns_sink, saved_stdout
+    root = root_dir
+    if output == '-':
+        sink = sys.stdout
+        owns_sink = False
+        saved_stdout = sys.stdout
+        sys.stdout = sys.stderr
+    else:
+        sink = open(output, 'w', encoding='utf-8')
+        owns_sink = True
+
+
+def close():
+    """Flush the diffs, close the patch file and put stdout back"""
+    global sink, owns_sink, saved_stdout
+    if sink is not None:
+        sink.flush()
+        # A stdout stream belongs to the caller (or a test capture)
+        if owns_sink:
+            sink.close()
+        sink = None
+        owns_sink = False
+    if saved_stdout is not None:
+        sys.stdout = saved_stdout
+        saved_stdout = None
+
+
+def defer():
+    """Collect diffs in this (worker) process instead of emitting them"""
+    global deferred
+    deferred = []
+
+
+def take():
+    """Return and clear the diffs collected since defer()"""
+    diffs = list(deferred or ())
+    if deferred is not None:
+        deferred.clear()
+    return diffs
+
+
+def _label(path):
+    path = os.path.abspath(path)
+    if root is not None:
+        relative = os.path.relpath(path, os.path.abspath(root))
+        if not relative.startswith('..'):
+            return relative.replace(os.sep, '/')
+    return path.lstrip('/')
+
+
+def unified_diff(path, original, text):
+    """Return a git-style unified diff between two versions of a file
+    (original is None for a file that does not exist yet)"""
+    # Only dry runs need difflib, so it is not imported up front
+    import difflib
+    label = _label(path)
+    header = f"diff --git a/{label} b/{label}\n"
+    old_label = f"a/{label}"
+    if original is None:
+        header += "new file mode 100644\n"
+        old_label = "/dev/null"
+    lines = []
+    for line in difflib.unified_diff((original or '').splitlines(keepends=True),
+                                     text.splitlines(keepends=True),
+                                     old_label, f"b/{label}"):
+        if line.endswith('\n'):
+            lines.append(line)
+        else:
+            lines.append(line + '\n\\ No newline at end of file\n')
+    if not lines:
+        return ''
+    return header + ''.join(lines)
+
+
+def emit(diff):
+    """Write one file's diff to the sink"""
+    if diff:
+        sink.write(diff)
+        sink.flush()
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def render(path, text, original, write=_write):
+    """Write text to path (with write(path, text)); in dry run return its diff
+    instead, for the caller to emit() in order"""
+    if sink is None and deferred is None:
+        write(path, text)
+        return None
+    return unified_diff(path, original, text)
+
+
+def write_file(path, text, original, write=_write):
+    """Write text to path (with write(path, text)), or emit its diff in dry run"""
+    diff = render(path, text, original, write)
+    if diff is None:
+        return
+    if deferred is not None:
+        deferred.append(diff)
+    else:
+        emit(diff)
@@ -0,0 +1,108 @@
+"""
+Persistent content-hash cache so codemods can skip files they already handled
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from i18n_tools.mapped_file import decode_source
+
+# Default cache location: <repo>/.i18n-cache/
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".i18n-cache"
+DEFAULT_MAX_ENTRIES = 20000
+
+
+def content_hash(data):
+    """Return the sha1 hex digest of bytes or str data"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha1(data).hexdigest()
+
+
+def read_source(path):
+    """Read a file once, returning (text, content hash).
+
+    The text gets the same newline translation as open(path, 'r').
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return decode_source(data), content_hash(data)
+
+
+def mapping_hash(*parts):
+    """Hash the mapping / translations (and codemod version) a result depends on"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+    return content_hash(payload)
+
+
+class FileCache:
+    """LRU cache of per-file results keyed by (content hash, mapping hash).
+
+    Entries are stored in one JSON file per codemod. The oldest entries are
+    evicted once the cache grows past max_entries.
+    """
+
+    def __init__(self, name, context_hash, max_entries=DEFAULT_MAX_ENTRIES,
+                 cache_dir=CACHE_DIR, enabled=True):
+        self.path = Path(cache_dir) / f"{name}.json"
+        self.context_hash = context_hash
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+        if enabled:
+            self.load()
+
+    def load(self):
+        """Load entries from disk, ignoring a missing or corrupt cache file"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = OrderedDict(json.load(f))
+        except (OSError, ValueError):
+            self.entries = OrderedDict()
+
+    def key(self, file_hash):
+        return f"{self.context_hash}:{file_hash}"
+
+    def get(self, file_hash):
+        """Return the cached result for a file's content hash, or None"""
+        if not self.enabled:
+            return None
+        key = self.key(file_hash)
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        self.dirty = True
+        return result
+
+    def set(self, file_hash, result):
+        """Store a result for a file's content hash and evict old entries"""
+        if not self.enabled:
+            return
+        key = self.key(file_hash)
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self.dirty = True
+
+    def save(self):
+        """Write the cache to disk (atomically) if it changed"""
+        if not self.enabled or not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def summary(self):
+        return f"cache: {self.hits} hits, {self.misses} misses ({len(self.entries)} entries)"
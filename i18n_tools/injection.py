@@ -0,0 +1,249 @@
+"""
+Edit plans for injecting the useTranslation hook into TSX pages.
+
+A plan lists where the edits go in one file: the import statements, and for
+each top-level component the offset just inside its body. Components are:
+- function declarations (`function Name(`, exported or not)
+- `export default function`
+- arrow functions assigned to a const (`const Name = (props) => {`),
+  also wrapped in memo() / forwardRef()
+
+Arrow components with an expression body (`=> (<div/>)`) get a block body
+with the hook and a return statement.
+
+The plan comes from one bracket-matching pass that skips strings, template
+literals and comments, so parameters with default values or destructuring
+do not confuse it. Plans only hold offsets, so they can be cached by
+content hash; applying one is a splice.
+"""
+import re
+from bisect import bisect_left, bisect_right
+
+from i18n_tools.tsx_lexer import TEMPLATE_TEXT_RE, _STRING, tokenize
+
+# Bump when plans change shape or meaning so cached plans are dropped
+PLAN_VERSION = 2
+
+HOOK = "const { t } = useTranslation();"
+IMPORT = "import { useTranslation } from 'react-i18next';"
+
+SCAN_RE = re.compile(
+    r"(?=[/'\"`(){}\[\]])(?:"
+    r"(?P<comment>//[^\n]*|/\*.*?\*/)"
+    rf"|(?P<string>{_STRING})"
+    r"|(?P<tick>`)"
+    r"|(?P<open>[({\[])"
+    r"|(?P<close>[)}\]]))",
+    re.DOTALL,
+)
+
+# Top-level declarations start a line
+DECLARATION_RE = re.compile(
+    r"^(?:export\s+(?P<default>default\s+)?)?"
+    r"(?:(?:async\s+)?function\b\s*\*?\s*(?P<function>\w+)?\s*(?=[<(])"
+    r"|(?:const|let|var)\s+(?P<const>\w+)\s*(?::[^=\n]+)?=(?![=>])\s*)",
+    re.MULTILINE,
+)
+DEFAULT_EXPORT_RE = re.compile(
+    r"^export\s+default\s+(?:(?:React\.)?(?:memo|forwardRef)\s*\(\s*)*(?P<name>\w+)\s*\)*\s*;?[ \t]*$",
+    re.MULTILINE,
+)
+WRAPPER_RE = re.compile(r"(?:React\.)?(?:memo|forwardRef)\s*(?:<[^()]*?>)?\s*\(\s*")
+FUNCTION_RE = re.compile(r"(?:async\s+)?function\b\s*\*?\s*\w*\s*")
+GENERICS_RE = re.compile(r"<[^()]*?>\s*")
+ARROW_PARAM_RE = re.compile(r"(?:async\s+)?(?:<[^()]*?>\s*)?(?:(?P<param>[A-Za-z_$][\w$]*)|(?=\())")
+ARROW_RE = re.compile(r"\s*(?::[^=]*?)?=>\s*")
+BODY_RE = re.compile(r"\s*(?::\s*[^{;]*?)?\s*(?=\{)")
+HOOK_CALL_RE = re.compile(r"\buseTranslation\s*\(")
+
+
+def scan_brackets(text):
+    """Return ({open offset: close offset}, top-level (start, end) spans).
+
+    Brackets in strings, comments and template text are ignored; code in
+    ${...} spans is matched. The spans are the brackets, strings, comments
+    and templates that sit at the top level of the file.
+    """
+    pairs = {}
+    spans = []
+    stack = []
+    pos = 0
+    size = len(text)
+    while pos < size:
+        if stack and stack[-1][0] == '`':
+            pos = TEMPLATE_TEXT_RE.match(text, pos).end()
+            if pos >= size:
+                break
+            if text[pos] == '`':
+                _, start = stack.pop()
+                pos += 1
+                if not stack:
+                    spans.append((start, pos))
+            else:
+                stack.append(('${', pos))
+                pos += 2
+            continue
+        match = SCAN_RE.search(text, pos)
+        if match is None:
+            break
+        start, pos = match.span()
+        kind = match.lastgroup
+        if kind == 'tick':
+            stack.append(('`', start))
+        elif kind == 'open':
+            stack.append((match.group(), start))
+        elif kind == 'close':
+            if not stack:
+                continue
+            opener, open_pos = stack.pop()
+            if opener != '${':
+                pairs[open_pos] = start
+            if not stack:
+                spans.append((open_pos, pos))
+        elif not stack:
+            spans.append((start, pos))
+    return pairs, spans
+
+
+def _is_top_level(spans, starts, pos):
+    index = bisect_right(starts, pos) - 1
+    return index < 0 or spans[index][1] <= pos
+
+
+def _function_body(text, pairs, pos):
+    """Offset of the '{' opening a function body whose parameters start at pos"""
+    generics = GENERICS_RE.match(text, pos) if text.startswith('<', pos) else None
+    if generics is not None:
+        pos = generics.end()
+    if pos not in pairs:
+        return None
+    match = BODY_RE.match(text, pairs[pos] + 1)
+    return match.end() if match is not None and match.end() in pairs else None
+
+
+def _component(text, pairs, pos):
+    """Return ('block', '{' offset) or ('expr', start, end) for the function
+    starting at pos, ('unsupported',) for other arrow bodies, or None if
+    pos does not start a function"""
+    match = WRAPPER_RE.match(text, pos)
+    while match is not None:
+        pos = match.end()
+        match = WRAPPER_RE.match(text, pos)
+    match = FUNCTION_RE.match(text, pos)
+    if match is not None:
+        body = _function_body(text, pairs, match.end())
+        return ('block', body) if body is not None else None
+    match = ARROW_PARAM_RE.match(text, pos)
+    if match is None:
+        return None
+    pos = match.end()
+    if match.group('param') is None:
+        if pos not in pairs:
+            return None
+        pos = pairs[pos] + 1
+    match = ARROW_RE.match(text, pos)
+    if match is None:
+        return None
+    pos = match.end()
+    if pos in pairs:
+        if text[pos] == '{':
+            return ('block', pos)
+        if text[pos] == '(':
+            return ('expr', pos, pairs[pos] + 1)
+    return ('unsupported',)
+
+
+def injection_plan(text):
+    """Return the JSON-serializable edit plan for one TSX source text"""
+    pairs, spans = scan_brackets(text)
+    starts = [start for start, _ in spans]
+    calls = []
+    imports = []
+    for token in tokenize(text):
+        if token.kind == 'translate':
+            calls.append(token.start)
+        elif token.kind == 'import':
+            imports.append([token.start, token.end, token.value])
+    defaults = {match.group('name') for match in DEFAULT_EXPORT_RE.finditer(text)
+                if _is_top_level(spans, starts, match.start())}
+
+    declarations = [match for match in DECLARATION_RE.finditer(text)
+                    if _is_top_level(spans, starts, match.start())]
+    components = []
+    for index, match in enumerate(declarations):
+        is_default = match.group('default') is not None
+        if match.group('const') is not None:
+            name = match.group('const')
+            body = _component(text, pairs, match.end())
+        else:
+            name = match.group('function') or 'default'
+            body = _function_body(text, pairs, match.end())
+            body = ('block', body) if body is not None else None
+        # Components are capitalized; anonymous default exports count too
+        if body is None or not (name[0].isupper() or is_default):
+            continue
+        if body[0] == 'block':
+            start, end = body[1], pairs[body[1]]
+        elif body[0] == 'expr':
+            start, end = body[1], body[2]
+        else:
+            # The body runs at most up to the next declaration
+            start = match.end()
+            end = declarations[index + 1].start() if index + 1 < len(declarations) else len(text)
+        components.append({
+            'name': name,
+            'default': is_default or name in defaults,
+            'kind': body[0],
+            'start': start,
+            'end': end,
+            'uses_t': bisect_left(calls, start) < bisect_left(calls, end),
+            'has_hook': HOOK_CALL_RE.search(text, start, end) is not None,
+        })
+    return {'imports': imports, 'components': components}
+
+
+def cached_plan(cache, file_hash, text):
+    """Return the plan for text, from cache (a FileCache) when it has one"""
+    plan = cache.get(file_hash) if cache is not None else None
+    if plan is None:
+        plan = injection_plan(text)
+        if cache is not None:
+            cache.set(file_hash, plan)
+    return plan
+
+
+def hook_targets(plan):
+    """Return the components that need the hook: the default export and
+    every other component calling t(), unless they already have it"""
+    return [component for component in plan['components']
+            if not component['has_hook'] and (component['default'] or component['uses_t'])]
+
+
+def unsupported(plan):
+    """Return the names of target components whose body cannot take the hook"""
+    return [component['name'] for component in hook_targets(plan) if component['kind'] == 'unsupported']
+
+
+def hook_edits(plan, block_text):
+    """Return (offset, text) edits adding the hook to each target component;
+    block_text is inserted right after a block body's '{'"""
+    edits = []
+    for component in hook_targets(plan):
+        if component['kind'] == 'block':
+            edits.append((component['start'] + 1, block_text))
+        elif component['kind'] == 'expr':
+            edits.append((component['start'], f"{{\n  {HOOK}\n  return "))
+            edits.append((component['end'], ";\n}"))
+    return edits
+
+
+def splice(text, edits):
+    """Apply (offset, text) insertions; insertions at one offset keep their order"""
+    pieces = []
+    last = 0
+    for offset, insert in sorted(edits, key=lambda edit: edit[0]):
+        pieces.append(text[last:offset])
+        pieces.append(insert)
+        last = offset
+    pieces.append(text[last:])
+    return ''.join(pieces)
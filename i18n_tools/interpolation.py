@@ -0,0 +1,101 @@
+"""
+Interpolated toast messages.
+
+A toast whose message is a template literal with ${...} interpolations,
+
+    toast.error(`فشل الاتصال: ${error.message}`)
+
+is treated as one message with named placeholders, in the {{name}} syntax
+i18next interpolates by default:
+
+    فشل الاتصال: {{message}}
+
+and the template literal becomes a single t() call passing the values:
+
+    toast.error(t('toast.common.m1a2b3c4d5e', { message: error.message }))
+
+A translation can then put the placeholders wherever its word order needs
+them. Placeholder names come from the interpolated expressions: the last
+property of a member chain (error.message -> message, count -> count),
+'value' for anything else (calls, arithmetic), numbered when two different
+expressions would share a name.
+"""
+import re
+from collections import namedtuple
+
+# message: the text with {{name}} placeholders
+# placeholders: (name, expression) for each distinct interpolated expression
+Interpolation = namedtuple('Interpolation', 'message placeholders')
+
+MEMBER_CHAIN_RE = re.compile(r'[A-Za-z_$][\w$]*(?:\s*\??\.\s*[A-Za-z_$][\w$]*)*')
+IDENTIFIER_RE = re.compile(r'[A-Za-z_$][\w$]*')
+# t() calls in a template mean an earlier codemod already split it into keys
+TRANSLATE_RE = re.compile(r'(?<![\w$])t\(')
+ESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\n|.)', re.DOTALL)
+ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0', '\n': ''}
+
+# Names t() reads as options rather than interpolation values
+RESERVED_NAMES = {
+    'lng', 'lngs', 'ns', 'context', 'defaultValue', 'replace', 'returnObjects',
+    'returnDetails', 'joinArrays', 'postProcess', 'interpolation', 'keySeparator',
+    'nsSeparator', 'fallbackLng', 'ordinal',
+}
+
+
+def _unescape(match):
+    escape = match.group(1)
+    if escape.startswith('u{'):
+        return chr(int(escape[2:-1], 16))
+    if escape[0] in 'ux' and len(escape) > 1:
+        return chr(int(escape[1:], 16))
+    return ESCAPES.get(escape, escape)
+
+
+def cook(raw):
+    """Return the value of raw template literal text (escape sequences resolved)"""
+    return ESCAPE_RE.sub(_unescape, raw) if '\\' in raw else raw
+
+
+def placeholder_name(expression):
+    """Return the placeholder name for an interpolated expression"""
+    if MEMBER_CHAIN_RE.fullmatch(expression):
+        name = IDENTIFIER_RE.findall(expression)[-1].replace('$', '')
+        if name and name not in RESERVED_NAMES:
+            return name
+    return 'value'
+
+
+def interpolate(content, literal):
+    """Return the Interpolation for a template literal token from tsx_lexer, or
+    None if it has no ${...} or already goes through t()"""
+    if not literal.spans or TRANSLATE_RE.search(content, literal.start, literal.end):
+        return None
+    pieces = []
+    placeholders = {}
+    names = set()
+    last = literal.start + 1
+    for start, end in literal.spans:
+        expression = content[start + 2:end - 1].strip()
+        if not expression:
+            return None
+        pieces.append(cook(content[last:start]))
+        name = placeholders.get(expression)
+        if name is None:
+            base = name = placeholder_name(expression)
+            number = 1
+            while name in names:
+                number += 1
+                name = f"{base}{number}"
+            names.add(name)
+            placeholders[expression] = name
+        pieces.append(f"{{{{{name}}}}}")
+        last = end
+    pieces.append(cook(content[last:literal.end - 1]))
+    return Interpolation(''.join(pieces), tuple((name, expression) for expression, name in placeholders.items()))
+
+
+def translate_call(key, placeholders):
+    """Return the t() call that replaces an interpolated template literal"""
+    values = ', '.join(name if name == expression else f"{name}: {expression}"
+                       for name, expression in placeholders)
+    return f"t('{key}', {{ {values} }})"
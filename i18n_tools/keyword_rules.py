@@ -0,0 +1,117 @@
+"""
+Ordered keyword rule tables compiled into one matcher.
+
+A rule table is a list of (result, alternatives). The first rule that has
+a satisfied alternative wins. An alternative maps a field name ('ar', 'en',
+...) to keywords that must all occur in that field's text. A 'not_' prefix
+on the field lists keywords that must not occur.
+
+All keywords of all tables are compiled into one trie-shaped regex. One
+scan over the joined fields finds every keyword occurrence. Each table
+then resolves to the lowest-numbered rule among the matched keywords, so
+the cost per message does not grow with the number of rules.
+"""
+import re
+from bisect import bisect_right
+
+# Joins the fields into one text; keywords never contain it
+SEPARATOR = '\0'
+
+
+def trie_regex(words):
+    """Return a regex matching any of words, longest first, factored as a trie"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A word that ends here is a prefix of the longer branches
+        return f'(?:{body})?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordRules:
+    """Compiled first-match-wins keyword rules for one or more tables"""
+
+    def __init__(self, tables, defaults=None):
+        self.defaults = defaults or {}
+        self.tables = {}
+        keywords = set()
+        fields = set()
+        for name, rules in tables.items():
+            # (field, keyword) -> first rule it satisfies on its own
+            simple = {}
+            # (index, required, excluded) for alternatives needing more checks
+            compound = []
+            for index, (result, alternatives) in enumerate(rules):
+                for alternative in alternatives:
+                    required = set()
+                    excluded = set()
+                    for field, words in alternative.items():
+                        if field.startswith('not_'):
+                            excluded.update((field[4:], word) for word in words)
+                        else:
+                            required.update((field, word) for word in words)
+                    if not required:
+                        raise ValueError(f"Rule {result!r} in {name} has an alternative with no required keyword")
+                    for field, word in required | excluded:
+                        if SEPARATOR in word or not word:
+                            raise ValueError(f"Invalid keyword {word!r} in rule {result!r}")
+                        fields.add(field)
+                        keywords.add(word)
+                    if len(required) == 1 and not excluded:
+                        simple.setdefault(next(iter(required)), index)
+                    else:
+                        compound.append((index, frozenset(required), frozenset(excluded)))
+            compound.sort(key=lambda check: check[0])
+            self.tables[name] = ([result for result, _ in rules], simple, compound)
+
+        self.fields = sorted(fields)
+        self.pattern = re.compile(trie_regex(keywords))
+        # Keywords that also match wherever a longer keyword starts
+        self.implied = {word: [other for other in keywords if word.startswith(other)] for word in keywords}
+
+    def scan(self, values):
+        """Return the set of (field, keyword) pairs found in values[field]"""
+        texts = [values.get(field, '') for field in self.fields]
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+        text = SEPARATOR.join(texts)
+        search = self.pattern.search
+        found = set()
+        # Restart one character after each match so overlapping keywords
+        # are found too; the regex reports the longest keyword at a position
+        match = search(text)
+        while match is not None:
+            start = match.start()
+            field = self.fields[bisect_right(starts, start) - 1]
+            for word in self.implied[match.group()]:
+                found.add((field, word))
+            match = search(text, start + 1)
+        return found
+
+    def classify(self, values):
+        """Return {table name: result of its first matching rule (or the default)}"""
+        found = self.scan(values)
+        results = {}
+        for name, (rule_results, simple, compound) in self.tables.items():
+            best = min([simple[term] for term in found if term in simple], default=len(rule_results))
+            for index, required, excluded in compound:
+                if index >= best:
+                    break
+                if required <= found and not excluded & found:
+                    best = index
+                    break
+            results[name] = rule_results[best] if best < len(rule_results) else self.defaults.get(name)
+        return results
@@ -0,0 +1,251 @@
+"""
+Index over all locale files in client/src/locales.
+
+The catalog flattens every locale into dotted keys once, keeps a reverse
+map from source (Arabic) text to key and a presence bitmap per locale, and
+is saved as a pickle snapshot so later runs skip parsing the JSON entirely.
+Keys and values are interned in one UTF-8 buffer (string_store.py) and
+the tables are integer arrays, so all locales fit in a fraction of the
+memory the parsed JSON dicts take.
+
+Usage:
+    python3 -m i18n_tools.locale_catalog key toast.orders.msg3
+    python3 -m i18n_tools.locale_catalog text "تم إلغاء الطلب"
+    python3 -m i18n_tools.locale_catalog missing it
+"""
+import json
+import os
+import pickle
+import sys
+from array import array
+from pathlib import Path
+
+from i18n_tools.file_cache import CACHE_DIR, content_hash
+from i18n_tools.string_store import StringStore
+
+LOCALES_DIR = Path(__file__).resolve().parent.parent / "client" / "src" / "locales"
+SOURCE_LOCALE = 'ar'
+
+# Bump when the snapshot layout changes
+SNAPSHOT_VERSION = 3
+
+
+def flatten(data, prefix=''):
+    """Yield (dotted key, value) pairs for every leaf of a nested locale dict"""
+    for name, value in data.items():
+        key = f"{prefix}.{name}" if prefix else name
+        if isinstance(value, dict):
+            yield from flatten(value, key)
+        else:
+            yield key, value
+
+
+def locale_fingerprint(locales_dir):
+    """Return (name, size, mtime) for each locale file, used to validate snapshots"""
+    fingerprint = []
+    for path in sorted(Path(locales_dir).glob("*.json")):
+        stat = path.stat()
+        fingerprint.append((path.stem, stat.st_size, stat.st_mtime_ns))
+    return tuple(fingerprint)
+
+
+class LocaleCatalog:
+    """Flattened keys, values and presence bitmaps for a set of locales.
+
+    Keys and string values live once each in a StringStore; the tables hold
+    their ids in arrays (-1 for none). Key k's value in a locale is
+    values[locale][k]; leaves that are not strings (numbers, lists) are
+    kept as they are in other.
+    """
+
+    def __init__(self, locales, fingerprint=()):
+        self.locales = sorted(locales)
+        self.fingerprint = fingerprint
+        self.strings = StringStore()
+        # Source locale first, so key order follows the source file
+        order = sorted(self.locales, key=lambda name: name != SOURCE_LOCALE)
+        key_index = {}
+        self.key_ids = array('i')
+        for name in order:
+            for key in locales[name]:
+                if key not in key_index:
+                    key_index[key] = len(self.key_ids)
+                    self.key_ids.append(self.strings.add(key))
+        self.values = {}
+        self.other = {}
+        self.presence = {}
+        for name in self.locales:
+            values = array('i', [-1]) * len(self.key_ids)
+            bitmap = 0
+            for key, value in locales[name].items():
+                index = key_index[key]
+                if isinstance(value, str):
+                    values[index] = self.strings.add(value)
+                else:
+                    self.other[name, index] = value
+                bitmap |= 1 << index
+            self.values[name] = values
+            self.presence[name] = bitmap
+        self.strings.freeze()
+
+        # String id -> key index, and source text id -> first key that uses it
+        self.key_of = array('i', [-1]) * len(self.strings)
+        for index, string_id in enumerate(self.key_ids):
+            self.key_of[string_id] = index
+        self.text_key = array('i', [-1]) * len(self.strings)
+        for index, string_id in enumerate(self.values.get(SOURCE_LOCALE, ())):
+            if string_id >= 0 and self.text_key[string_id] < 0:
+                self.text_key[string_id] = index
+
+    @classmethod
+    def from_directory(cls, locales_dir=LOCALES_DIR):
+        """Parse every <locale>.json in locales_dir"""
+        fingerprint = locale_fingerprint(locales_dir)
+        locales = {}
+        for path in sorted(Path(locales_dir).glob("*.json")):
+            with open(path, 'r', encoding='utf-8') as f:
+                locales[path.stem] = dict(flatten(json.load(f)))
+        return cls(locales, fingerprint)
+
+    def __len__(self):
+        return len(self.key_ids)
+
+    def key_at(self, index):
+        """Return the dotted key with the given index"""
+        return self.strings[self.key_ids[index]]
+
+    def index_of(self, key):
+        """Return the index of a dotted key, or None"""
+        string_id = self.strings.find(key)
+        if string_id is None or self.key_of[string_id] < 0:
+            return None
+        return self.key_of[string_id]
+
+    def _value(self, locale, index):
+        string_id = self.values[locale][index]
+        if string_id >= 0:
+            return self.strings[string_id]
+        return self.other.get((locale, index))
+
+    def get(self, key, locale=SOURCE_LOCALE):
+        """Return the value of a dotted key in a locale, or None"""
+        index = self.index_of(key)
+        if index is None or locale not in self.values:
+            return None
+        return self._value(locale, index)
+
+    def has(self, key, locale):
+        """Return True if a locale defines key"""
+        index = self.index_of(key)
+        return index is not None and bool(self.presence.get(locale, 0) >> index & 1)
+
+    def key_for_text(self, text):
+        """Return the key whose source-locale value is text, or None"""
+        string_id = self.strings.find(text)
+        if string_id is None or self.text_key[string_id] < 0:
+            return None
+        return self.key_at(self.text_key[string_id])
+
+    def locale_values(self, locale):
+        """Return the values of a locale in key order (None where it has no value)"""
+        if locale not in self.values:
+            return []
+        return [self._value(locale, index) for index in range(len(self.key_ids))]
+
+    def locale_keys(self, locale):
+        """Return the keys a locale defines, in catalog order"""
+        bitmap = self.presence.get(locale, 0)
+        return [self.key_at(index) for index in range(len(self.key_ids)) if bitmap >> index & 1]
+
+    def missing(self, locale, reference=SOURCE_LOCALE):
+        """Return keys defined by the reference locale but missing from locale"""
+        bitmap = self.presence.get(reference, 0) & ~self.presence.get(locale, 0)
+        return [self.key_at(index) for index in range(len(self.key_ids)) if bitmap >> index & 1]
+
+
+def snapshot_path(locales_dir):
+    """Return the snapshot file for a locales directory"""
+    # One snapshot per directory, so several trees can share the cache
+    digest = content_hash(str(Path(locales_dir).resolve()))[:12]
+    return Path(CACHE_DIR) / f"locale-catalog-{digest}.pickle"
+
+
+def read_snapshot_header(f):
+    """Return (version, locales directory) from the start of a snapshot file"""
+    try:
+        version, locales_dir = pickle.load(f)
+    except (pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+        return None, None
+    return version, locales_dir
+
+
+def prune_snapshots(keep=None):
+    """Delete the snapshots of locales directories that are gone (temporary
+    trees) or of an older layout; return how many were deleted"""
+    pruned = 0
+    for path in Path(CACHE_DIR).glob("locale-catalog-*.pickle"):
+        if path == keep:
+            continue
+        try:
+            with open(path, 'rb') as f:
+                version, locales_dir = read_snapshot_header(f)
+            if version == SNAPSHOT_VERSION and os.path.isdir(locales_dir):
+                continue
+            path.unlink()
+            pruned += 1
+        except OSError:
+            pass
+    return pruned
+
+
+def load_catalog(locales_dir=LOCALES_DIR, use_snapshot=True):
+    """Return the catalog for locales_dir, from the snapshot when it is current;
+    with use_snapshot=False the snapshot is neither read nor written"""
+    fingerprint = locale_fingerprint(locales_dir)
+    path = snapshot_path(locales_dir)
+    if use_snapshot:
+        try:
+            with open(path, 'rb') as f:
+                # The header alone tells prune_snapshots() whose snapshot it is
+                version, _ = read_snapshot_header(f)
+                if version == SNAPSHOT_VERSION:
+                    catalog = pickle.load(f)
+                    if catalog.fingerprint == fingerprint:
+                        return catalog
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError):
+            pass
+    catalog = LocaleCatalog.from_directory(locales_dir)
+    if use_snapshot:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((SNAPSHOT_VERSION, str(Path(locales_dir).resolve())), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(catalog, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        # Writing a snapshot is rare (the locales changed, or a new tree),
+        # so it is when the ones left by deleted trees are cleared
+        prune_snapshots(keep=path)
+    return catalog
+
+
+def main():
+    if len(sys.argv) != 3 or sys.argv[1] not in ('key', 'text', 'missing'):
+        print(__doc__.strip().split('Usage:')[1])
+        sys.exit(1)
+    command, arg = sys.argv[1], sys.argv[2]
+    catalog = load_catalog()
+    if command == 'key':
+        for locale in catalog.locales:
+            print(f"{locale}: {catalog.get(arg, locale)}")
+    elif command == 'text':
+        print(catalog.key_for_text(arg))
+    else:
+        missing = catalog.missing(arg)
+        for key in missing:
+            print(key)
+        print(f"{len(missing)} keys missing from {arg}")
+
+
+if __name__ == "__main__":
+    main()
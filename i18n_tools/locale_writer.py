@@ -0,0 +1,176 @@
+"""
+Batched, atomic writer for locale JSON files.
+
+Updates are collected per file and applied in one pass. Each update
+replaces only the text of the value it touches, so the rest of the file
+(key order, formatting, even duplicate keys) stays byte-for-byte as it was
+and git diffs only show the changed lines. Files are written through a
+temporary file and an atomic rename (or shown as a diff in dry run), and
+skipped entirely when nothing changed.
+"""
+import json
+import os
+import tempfile
+from json.decoder import scanstring
+
+from i18n_tools import dry_run
+from i18n_tools.phases import phase
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+
+
+def _skip_ws(text, pos):
+    while pos < len(text) and text[pos] in _WHITESPACE:
+        pos += 1
+    return pos
+
+
+def _scan_object(text, pos, prefix, members, objects):
+    """Scan the object starting at text[pos] == '{', recording member spans"""
+    open_pos = pos
+    last_end = None
+    pos = _skip_ws(text, pos + 1)
+    if text[pos] != '}':
+        while True:
+            if text[pos] != '"':
+                raise ValueError(f"Expected key at offset {pos}")
+            key_start = pos
+            name, pos = scanstring(text, pos + 1)
+            pos = _skip_ws(text, pos)
+            if text[pos] != ':':
+                raise ValueError(f"Expected ':' at offset {pos}")
+            pos = _skip_ws(text, pos + 1)
+            path = f"{prefix}.{name}" if prefix else name
+            value_start = pos
+            if text[pos] == '{':
+                pos = _scan_object(text, pos, path, members, objects)
+            else:
+                _, pos = _decoder.raw_decode(text, pos)
+            # Later duplicates win, as they do for json.load
+            members[path] = (key_start, value_start, pos)
+            last_end = pos
+            pos = _skip_ws(text, pos)
+            if text[pos] == ',':
+                pos = _skip_ws(text, pos + 1)
+                continue
+            if text[pos] != '}':
+                raise ValueError(f"Expected ',' or '}}' at offset {pos}")
+            break
+    objects[prefix] = (open_pos, pos, last_end)
+    return pos + 1
+
+
+def scan_locale(text):
+    """Return (members, objects) span maps for a locale JSON document.
+
+    members: dotted key -> (key start, value start, value end)
+    objects: dotted key ('' for the root) -> (open brace, close brace, end of last member)
+    """
+    members = {}
+    objects = {}
+    _scan_object(text, _skip_ws(text, 0), '', members, objects)
+    return members, objects
+
+
+def _line_indent(text, pos):
+    line_start = text.rfind('\n', 0, pos) + 1
+    return text[line_start:pos]
+
+
+def _dump(value, indent):
+    return json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n' + indent)
+
+
+def set_value(text, key, value):
+    """Return text with the dotted key set to value, touching only that value"""
+    members, objects = scan_locale(text)
+    if key in members:
+        key_start, value_start, value_end = members[key]
+        dumped = _dump(value, _line_indent(text, key_start))
+        return text[:value_start] + dumped + text[value_end:]
+
+    parent, _, name = key.rpartition('.')
+    if parent not in objects:
+        if parent in members:
+            raise ValueError(f"Cannot set {key}: {parent} is not an object")
+        return set_value(text, parent, {name: value})
+
+    open_pos, close_pos, last_end = objects[parent]
+    parent_indent = _line_indent(text, members[parent][0]) if parent else ''
+    indent = parent_indent + '  '
+    member = f"{json.dumps(name, ensure_ascii=False)}: {_dump(value, indent)}"
+    if last_end is None:
+        return text[:open_pos] + f"{{\n{indent}{member}\n{parent_indent}}}" + text[close_pos + 1:]
+    return text[:last_end] + f",\n{indent}{member}" + text[last_end:]
+
+
+def write_atomic(path, text):
+    """Write text to path via a temporary file in the same directory"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(path):
+            os.chmod(tmp_path, os.stat(path).st_mode & 0o777)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class LocaleWriter:
+    """Collect updates for several locale files and write them in one batch"""
+
+    def __init__(self):
+        self.pending = {}
+
+    def set(self, path, key, value):
+        """Queue setting a dotted key (a leaf or a whole subtree) in a locale file"""
+        self.pending.setdefault(path, []).append((key, value))
+
+    def commit(self):
+        """Apply all queued updates; return {path: final text} and the paths written"""
+        results = {}
+        written = []
+        for path, updates in self.pending.items():
+            with phase('read'):
+                with open(path, 'r', encoding='utf-8') as f:
+                    original = f.read()
+            text = original
+            with phase('rewrite'):
+                for key, value in updates:
+                    text = set_value(text, key, value)
+            if text != original:
+                with phase('write'):
+                    dry_run.write_file(path, text, original, write_atomic)
+                written.append(path)
+            results[path] = text
+        self.pending = {}
+        return results, written
+
+
+def group_updates(values, existing_keys):
+    """Return (key, value) updates for {dotted key: value}, nesting the keys
+    under objects the file does not have yet so each new object is written
+    once, as a subtree; existing_keys are the leaf keys the file defines"""
+    objects = {key.rsplit('.', depth)[0] for key in existing_keys for depth in range(1, key.count('.') + 1)}
+    updates = {}
+    for key, value in values.items():
+        parts = key.split('.')
+        depth = 1
+        while depth < len(parts) and '.'.join(parts[:depth]) in objects:
+            depth += 1
+        anchor = '.'.join(parts[:depth])
+        if depth == len(parts):
+            updates[anchor] = value
+            continue
+        node = updates.setdefault(anchor, {})
+        for name in parts[depth:-1]:
+            node = node.setdefault(name, {})
+        node[parts[-1]] = value
+    return list(updates.items())
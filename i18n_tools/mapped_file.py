@@ -0,0 +1,62 @@
+"""
+Read-only memory-mapped source files with bytes-level prefiltering.
+
+Most pages contain none of the markers a codemod looks for (b'toast.',
+b'useTranslation', ...). A MappedFile answers `marker in source` and
+computes the content hash straight from the mapping, with no decode and
+no copy into a Python bytes object. Only files that pass the prefilter are
+decoded. They are decoded whole, because the TSX lexer needs the full
+text to tell code from strings and comments.
+"""
+import hashlib
+import mmap
+
+
+def decode_source(data):
+    """Decode UTF-8 source bytes with the newline translation of open(path, 'r')"""
+    text = str(data, 'utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+class MappedFile:
+    """A file mapped into memory; use as a context manager"""
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            size = f.seek(0, 2)
+            # mmap cannot map an empty file
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+    def __contains__(self, marker):
+        return self.data.find(marker) != -1
+
+    def contains_any(self, markers):
+        """Return True if any of the byte markers occurs in the file"""
+        return any(self.data.find(marker) != -1 for marker in markers)
+
+    def hash(self):
+        """Return the same sha1 hex digest as file_cache.content_hash"""
+        return hashlib.sha1(self.data).hexdigest()
+
+    def text(self):
+        """Decode the file with the newline translation of open(path, 'r')"""
+        return decode_source(self.data)
+
+
+def file_contains(path, *markers):
+    """Return True if the file at path contains any of the byte markers"""
+    with MappedFile(path) as source:
+        return source.contains_any(markers)
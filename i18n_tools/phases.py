@@ -0,0 +1,59 @@
+"""
+Per-phase wall-clock timers for the codemods (read, match, rewrite, write).
+
+Timing is off unless SARI_PHASE_TIMINGS names a JSON file; the totals are
+written there when the process exits. When off, phase() returns a shared
+no-op context manager.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+OUTPUT = os.environ.get('SARI_PHASE_TIMINGS')
+
+totals = {}
+_noop = nullcontext()
+# Pipeline stages time their phases from several threads
+_lock = threading.Lock()
+
+
+class _Phase:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.start
+        with _lock:
+            entry = totals.setdefault(self.name, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+
+def phase(name):
+    """Context manager that adds the time spent in its block to a phase"""
+    if OUTPUT is None:
+        return _noop
+    return _Phase(name)
+
+
+def report():
+    """Return {phase: {'seconds': total, 'calls': count}}"""
+    return {name: {'seconds': seconds, 'calls': calls}
+            for name, (seconds, calls) in totals.items()}
+
+
+def _dump():
+    with open(OUTPUT, 'w', encoding='utf-8') as f:
+        json.dump(report(), f, indent=2)
+
+
+if OUTPUT is not None:
+    atexit.register(_dump)
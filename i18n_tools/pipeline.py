@@ -0,0 +1,118 @@
+"""
+asyncio read -> transform -> write pipeline for the codemods.
+
+Each stage has its own pool of workers, and the stages are joined by
+bounded queues. When the transformers fall behind, the readers block on
+a full queue instead of pulling the whole tree into memory. Reads and
+writes run on an I/O thread pool, so many files are in flight at once.
+Transforms run on the event loop thread by default: the I/O threads spend
+their time in system calls, so they keep reading and writing meanwhile,
+and no thread fights the transform for the GIL. A process pool can be
+passed to spread the transforms over several cores.
+
+Results are passed to on_result in input order as soon as every earlier
+item is done, so the output is the same as a serial loop.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from i18n_tools import DEFAULT_IO_WORKERS
+
+
+class _Failed:
+    """Marks an item whose earlier stage raised; later stages skip it"""
+    __slots__ = ('error',)
+
+    def __init__(self, error):
+        self.error = error
+
+
+async def _stage(fn, executor, workers, inbox, outbox):
+    loop = asyncio.get_running_loop()
+
+    async def worker():
+        while True:
+            job = await inbox.get()
+            if job is None:
+                break
+            index, item, data = job
+            if not isinstance(data, _Failed):
+                try:
+                    if executor is None:
+                        data = fn(item, data)
+                    else:
+                        data = await loop.run_in_executor(executor, fn, item, data)
+                except Exception as e:
+                    data = _Failed(e)
+            await outbox.put((index, item, data))
+
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+
+async def _run(items, read, transform, write, on_result, io_workers, cpu_executor,
+               cpu_workers, queue_size):
+    loop = asyncio.get_running_loop()
+    io_pool = ThreadPoolExecutor(io_workers, thread_name_prefix='codemod-io')
+    to_transform = asyncio.Queue(queue_size)
+    to_write = asyncio.Queue(queue_size)
+    done = asyncio.Queue()
+    jobs = iter(enumerate(items))
+
+    async def reader():
+        for index, item in jobs:
+            try:
+                data = await loop.run_in_executor(io_pool, read, item)
+            except Exception as e:
+                data = _Failed(e)
+            await to_transform.put((index, item, data))
+
+    async def read_all():
+        await asyncio.gather(*(reader() for _ in range(io_workers)))
+        for _ in range(cpu_workers):
+            await to_transform.put(None)
+
+    async def transform_all():
+        await _stage(transform, cpu_executor, cpu_workers, to_transform, to_write)
+        for _ in range(io_workers):
+            await to_write.put(None)
+
+    async def write_all():
+        await _stage(write, io_pool, io_workers, to_write, done)
+        await done.put(None)
+
+    async def collect():
+        # Hand results on in input order
+        pending = {}
+        next_index = 0
+        while True:
+            job = await done.get()
+            if job is None:
+                break
+            pending[job[0]] = job
+            while next_index in pending:
+                _, item, data = pending.pop(next_index)
+                if isinstance(data, _Failed):
+                    on_result(item, None, data.error)
+                else:
+                    on_result(item, data, None)
+                next_index += 1
+
+    try:
+        await asyncio.gather(read_all(), transform_all(), write_all(), collect())
+    finally:
+        io_pool.shutdown()
+
+
+def run_pipeline(items, read, transform, write, on_result, io_workers=DEFAULT_IO_WORKERS,
+                 cpu_executor=None, cpu_workers=1, queue_size=None):
+    """Run read(item) -> transform(item, data) -> write(item, data) over items.
+
+    on_result(item, result, error) is called in input order; error is the
+    exception raised by the first failing stage, or None. With cpu_executor,
+    transform must be picklable if it is a process pool, and cpu_workers is
+    the number of transforms in flight (match it to the executor's workers).
+    """
+    if queue_size is None:
+        queue_size = 2 * io_workers
+    asyncio.run(_run(items, read, transform, write, on_result, max(1, io_workers),
+                     cpu_executor, max(1, cpu_workers), queue_size))
@@ -0,0 +1,137 @@
+"""
+Opt-in per-pattern and per-file profiling for the toast codemod.
+
+Profiling is off unless SARI_PROFILE names an output prefix. When it is on,
+every toast call site records the time spent matching it. That time is
+charged to the pattern family that rewrote the site (pattern1/2/3,
+'template' for interpolated messages or 'literal' for messages only ar.json
+has a key for) and to its key, or to 'miss' if nothing fit. The lexer pass is recorded as its own 'lexer' entry. Sizes
+are counted in characters: whole files for the lexer, matched spans for
+patterns. Each file gets a span in a Chrome trace (chrome://tracing,
+Perfetto). Two files are written:
+
+    <prefix>.txt         report sorted by time
+    <prefix>.trace.json  Chrome trace events
+
+When off, `active` is None and callers skip all bookkeeping.
+"""
+import json
+import os
+
+OUTPUT = os.environ.get('SARI_PROFILE')
+
+
+class Profiler:
+    """Accumulates pattern, mapping-key and file statistics for one process"""
+
+    def __init__(self):
+        self.patterns = {}
+        self.keys = {}
+        self.files = {}
+        self.events = []
+
+    @staticmethod
+    def _add(table, name, seconds, matched, size):
+        entry = table.get(name)
+        if entry is None:
+            entry = table[name] = [0.0, 0, 0, 0]
+        entry[0] += seconds
+        entry[1] += 1
+        entry[2] += matched
+        entry[3] += size
+
+    def site(self, pattern, key, seconds, size):
+        """Record one toast call site; pattern is 'miss' if nothing matched"""
+        matched = pattern != 'miss'
+        self._add(self.patterns, pattern, seconds, matched, size)
+        if key is not None:
+            self._add(self.keys, key, seconds, matched, size)
+
+    def lexer(self, seconds, size):
+        """Record one lexer pass over a file"""
+        self._add(self.patterns, 'lexer', seconds, 0, size)
+
+    def file(self, path, start, seconds, size, sites, replacements):
+        """Record one processed file and its trace span"""
+        self.files[str(path)] = [seconds, size, sites, replacements]
+        self.events.append({
+            'name': os.path.basename(str(path)),
+            'cat': 'file',
+            'ph': 'X',
+            'ts': start * 1e6,
+            'dur': seconds * 1e6,
+            'pid': os.getpid(),
+            'tid': 0,
+            'args': {'path': str(path), 'chars': size, 'sites': sites,
+                     'replacements': replacements},
+        })
+
+    def drain(self):
+        """Return the collected data as a plain dict and start over"""
+        data = {'patterns': self.patterns, 'keys': self.keys,
+                'files': self.files, 'events': self.events}
+        self.__init__()
+        return data
+
+    def merge(self, data):
+        """Add data returned by drain() (e.g. from a worker process)"""
+        for table_name in ('patterns', 'keys'):
+            table = getattr(self, table_name)
+            for name, (seconds, calls, matches, size) in data[table_name].items():
+                entry = table.setdefault(name, [0.0, 0, 0, 0])
+                entry[0] += seconds
+                entry[1] += calls
+                entry[2] += matches
+                entry[3] += size
+        self.files.update(data['files'])
+        self.events.extend(data['events'])
+
+    def report(self, limit=25):
+        """Return the text report, slowest entries first"""
+        lines = []
+
+        def table(title, rows, label):
+            lines.append("=" * 70)
+            lines.append(title)
+            lines.append("=" * 70)
+            lines.append(f"{label:<36}{'seconds':>10}{'calls':>8}{'matches':>9}{'chars':>10}")
+            for name, (seconds, calls, matches, size) in rows:
+                lines.append(f"{name[:35]:<36}{seconds:>10.4f}{calls:>8}{matches:>9}{size:>10}")
+            lines.append("")
+
+        by_time = lambda item: (-item[1][0], item[0])
+        table("Patterns", sorted(self.patterns.items(), key=by_time), 'pattern')
+        table(f"Mapping keys (top {limit})", sorted(self.keys.items(), key=by_time)[:limit], 'key')
+
+        lines.append("=" * 70)
+        lines.append(f"Files (top {limit})")
+        lines.append("=" * 70)
+        lines.append(f"{'file':<36}{'seconds':>10}{'chars':>9}{'sites':>7}{'repl':>7}")
+        for path, (seconds, size, sites, replacements) in sorted(
+                self.files.items(), key=by_time)[:limit]:
+            lines.append(f"{os.path.basename(path)[:35]:<36}{seconds:>10.4f}{size:>9}{sites:>7}{replacements:>7}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, prefix=None):
+        """Write <prefix>.txt and <prefix>.trace.json; return their paths"""
+        prefix = prefix or OUTPUT
+        report_path = f"{prefix}.txt"
+        trace_path = f"{prefix}.trace.json"
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write(self.report())
+        with open(trace_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+        return report_path, trace_path
+
+
+# The profiler of this process, or None when profiling is off
+active = Profiler() if OUTPUT else None
+
+
+def enable(prefix):
+    """Turn profiling on for this process and any worker it starts"""
+    global OUTPUT, active
+    OUTPUT = os.environ['SARI_PROFILE'] = prefix
+    if active is None:
+        active = Profiler()
+    return active
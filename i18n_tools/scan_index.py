@@ -0,0 +1,250 @@
+"""
+Persistent scan index over the client sources (SQLite).
+
+One lexer pass per .tsx file records what the i18n questions need, as
+inverted tables keyed for lookup:
+
+- key_uses: translation key -> files, lines and offsets of its t('key') calls
+- raw_toasts: Arabic toast message still in a page -> files, lines, offsets
+  (interpolated template literals with {{name}} placeholders, as extracted)
+- files: file -> content hash, toast and t() call counts, useTranslation
+  import and hook
+
+refresh() brings the index up to date incrementally: a file whose size and
+mtime are unchanged is not opened, one whose content hash is unchanged is
+not lexed again, and only changed files have their rows replaced. Queries
+are then index lookups and take milliseconds however large the tree is.
+"""
+import os
+import re
+import sqlite3
+from bisect import bisect_right
+from pathlib import Path
+
+from i18n_tools.file_cache import CACHE_DIR, content_hash
+from i18n_tools.interpolation import interpolate
+from i18n_tools.mapped_file import MappedFile
+from i18n_tools.tsx_lexer import WHITESPACE_RE, tokenize
+
+# Sources indexed under a Sari root
+SOURCE_DIR = os.path.join('client', 'src')
+
+# Bump when the table layout or what a scan records changes
+SCHEMA_VERSION = 1
+
+ARABIC_RE = re.compile(r'[\u0600-\u06FF]')
+HOOK_RE = re.compile(r'\buseTranslation\s*\(')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    toast_calls INTEGER NOT NULL,
+    t_calls INTEGER NOT NULL,
+    has_import INTEGER NOT NULL,
+    has_hook INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS key_uses (
+    key TEXT NOT NULL,
+    path TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    pos INTEGER NOT NULL,
+    PRIMARY KEY (key, path, pos)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS key_uses_path ON key_uses (path);
+CREATE TABLE IF NOT EXISTS raw_toasts (
+    message TEXT NOT NULL,
+    path TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    pos INTEGER NOT NULL,
+    level TEXT NOT NULL,
+    PRIMARY KEY (message, path, pos)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS raw_toasts_path ON raw_toasts (path);
+"""
+
+
+def default_index_path(root):
+    """Return the index file for a Sari root (one per checkout, in the cache directory)"""
+    return Path(CACHE_DIR) / f"scan-index-{content_hash(str(Path(root).resolve()))[:12]}.sqlite"
+
+
+def scan_source(text):
+    """Return (toast calls, t() calls, key uses, raw toasts, has import, has hook)
+    for one source text; key uses are (key, pos) and raw toasts (message, pos, level)"""
+    toast_calls = 0
+    t_calls = 0
+    key_uses = []
+    raw_toasts = []
+    has_import = False
+    # Call heads waiting for their first argument, by the argument's offset
+    pending = {}
+    for token in tokenize(text):
+        kind = token.kind
+        if kind == 'toast':
+            toast_calls += 1
+            pending[WHITESPACE_RE.match(text, token.end).end()] = token
+        elif kind == 'translate':
+            t_calls += 1
+            pending[WHITESPACE_RE.match(text, token.end).end()] = token
+        elif kind == 'import':
+            if token.value == 'react-i18next' and 'useTranslation' in text[token.start:token.end]:
+                has_import = True
+        elif kind in ('string', 'template') and token.start in pending:
+            head = pending.pop(token.start)
+            if head.kind == 'translate':
+                if not token.spans:
+                    key_uses.append((token.value, head.start))
+                continue
+            message = token.value
+            if token.spans:
+                interpolation = interpolate(text, token)
+                if interpolation is None:
+                    continue
+                message = interpolation.message
+            if ARABIC_RE.search(message):
+                raw_toasts.append((message, head.start, head.value))
+    return toast_calls, t_calls, key_uses, raw_toasts, has_import, HOOK_RE.search(text) is not None
+
+
+def source_files(root):
+    """Yield (path relative to root with '/' separators, full path, stat) for
+    every .tsx file under root's SOURCE_DIR"""
+    # os.scandir instead of Path.rglob: on a no-change refresh the walk is
+    # nearly all the work, and pathlib objects cost several times the stat
+    pending = [(os.path.join(root, SOURCE_DIR), Path(SOURCE_DIR).as_posix())]
+    while pending:
+        directory, relative = pending.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, f"{relative}/{entry.name}"))
+                elif entry.name.endswith('.tsx') and entry.is_file():
+                    yield f"{relative}/{entry.name}", entry.path, entry.stat()
+
+
+class ScanIndex:
+    """Inverted index of toast and t() usage; see the module docstring"""
+
+    def __init__(self, path):
+        self.path = path
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        version = self.db.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            # Derived data: rebuilt rather than migrated
+            self.db.executescript('DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS key_uses; '
+                                  'DROP TABLE IF EXISTS raw_toasts;')
+        with self.db:
+            self.db.executescript(_SCHEMA)
+            self.db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def refresh(self, root):
+        """Bring the index up to date with the sources of a Sari root;
+        return {'scanned': n, 'unchanged': n, 'removed': n}"""
+        stored = {path: (size, mtime_ns, digest) for path, size, mtime_ns, digest
+                  in self.db.execute('SELECT path, size, mtime_ns, hash FROM files')}
+        counts = {'scanned': 0, 'unchanged': 0, 'removed': 0}
+        seen = set()
+        with self.db:
+            for path, file_path, stat in source_files(root):
+                seen.add(path)
+                old = stored.get(path)
+                if old is not None and old[:2] == (stat.st_size, stat.st_mtime_ns):
+                    counts['unchanged'] += 1
+                    continue
+                with MappedFile(file_path) as source:
+                    digest = source.hash()
+                    if old is not None and old[2] == digest:
+                        self.db.execute('UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?',
+                                        (stat.st_size, stat.st_mtime_ns, path))
+                        counts['unchanged'] += 1
+                        continue
+                    text = source.text()
+                self._store(path, stat, digest, text)
+                counts['scanned'] += 1
+            for path in set(stored) - seen:
+                self._delete(path)
+                counts['removed'] += 1
+        return counts
+
+    def _delete(self, path):
+        for table in ('files', 'key_uses', 'raw_toasts'):
+            self.db.execute(f'DELETE FROM {table} WHERE path = ?', (path,))
+
+    def _store(self, path, stat, digest, text):
+        toast_calls, t_calls, key_uses, raw_toasts, has_import, has_hook = scan_source(text)
+        newlines = [match.start() for match in re.finditer('\n', text)]
+
+        def line(pos):
+            return bisect_right(newlines, pos) + 1
+
+        self._delete(path)
+        self.db.execute('INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                        (path, stat.st_size, stat.st_mtime_ns, digest, toast_calls, t_calls,
+                         int(has_import), int(has_hook)))
+        self.db.executemany('INSERT OR IGNORE INTO key_uses VALUES (?, ?, ?, ?)',
+                            [(key, path, line(pos), pos) for key, pos in key_uses])
+        self.db.executemany('INSERT OR IGNORE INTO raw_toasts VALUES (?, ?, ?, ?, ?)',
+                            [(message, path, line(pos), pos, level) for message, pos, level in raw_toasts])
+
+    def key_uses(self, key):
+        """Return (path, line, offset) of the t() calls with key; a key ending
+        in '*' matches every key starting with the rest"""
+        if key.endswith('*'):
+            prefix = key[:-1]
+            rows = self.db.execute('SELECT key, path, line, pos FROM key_uses WHERE key >= ? AND key < ? '
+                                   'ORDER BY key, path, pos', (prefix, prefix + '\U0010ffff'))
+        else:
+            rows = self.db.execute('SELECT key, path, line, pos FROM key_uses WHERE key = ? '
+                                   'ORDER BY path, pos', (key,))
+        return rows.fetchall()
+
+    def raw_toasts(self, under=''):
+        """Return (path, line, level, message) of the Arabic toast messages left in files under a path"""
+        return self.db.execute('SELECT path, line, level, message FROM raw_toasts '
+                               'WHERE path >= ? AND path < ? ORDER BY path, pos',
+                               (under, under + '\U0010ffff')).fetchall()
+
+    def message_files(self, message):
+        """Return (path, line) of the toast calls that still show message"""
+        return self.db.execute('SELECT path, line FROM raw_toasts WHERE message = ? ORDER BY path, pos',
+                               (message,)).fetchall()
+
+    def missing_hooks(self, under=''):
+        """Return (path, t() calls, has import) of files that call t() without the useTranslation hook"""
+        return self.db.execute('SELECT path, t_calls, has_import FROM files '
+                               'WHERE path >= ? AND path < ? AND t_calls > 0 AND has_hook = 0 ORDER BY path',
+                               (under, under + '\U0010ffff')).fetchall()
+
+    def usage(self):
+        """Return ({key: [files using it, relative to SOURCE_DIR]}, files indexed), in
+        the layout and file order of check-locale-coverage's own scan"""
+        prefix = Path(SOURCE_DIR).as_posix() + '/'
+        usage = {}
+        rows = self.db.execute('SELECT DISTINCT key, path FROM key_uses').fetchall()
+        for key, path in sorted(rows, key=lambda row: (row[0], row[1].split('/'))):
+            usage.setdefault(key, []).append(path[len(prefix):] if path.startswith(prefix) else path)
+        files = self.db.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+        return dict(sorted(usage.items())), files
+
+    def summary(self):
+        """Return {'files': n, 'key_uses': n, 'keys': n, 'raw_toasts': n}"""
+        queries = {
+            'files': 'SELECT COUNT(*) FROM files',
+            'key_uses': 'SELECT COUNT(*) FROM key_uses',
+            'keys': 'SELECT COUNT(DISTINCT key) FROM key_uses',
+            'raw_toasts': 'SELECT COUNT(*) FROM raw_toasts',
+        }
+        return {name: self.db.execute(sql).fetchone()[0] for name, sql in queries.items()}
@@ -0,0 +1,25 @@
+"""
+Import the codemod scripts as modules.
+
+The scripts have hyphenated file names (replace-toast-messages.py, ...), so
+they cannot be imported normally. Long-running tools such as watch mode
+load them here to call their per-file transforms in-process.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+
+def load_script(filename):
+    """Import a script by file name, once; e.g. load_script('translate-pages.py')"""
+    name = filename[:-len('.py')].replace('-', '_')
+    module = sys.modules.get(name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / filename)
+        module = importlib.util.module_from_spec(spec)
+        # Registered before it runs, as a normal import would be
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,123 @@
+"""
+Sharded runs for trees too large for one pass.
+
+The pages of a tree are split into N shards by a hash of their path
+relative to the root, so every machine computes the same split without
+talking to the others. Each shard rewrites its own pages (no two shards
+touch the same file) and writes a partial result as JSON: its stats, the
+interpolated toast messages and untranslated toast literals it found, and
+the translation keys its pages use. Files every shard would share (the
+locale files) are left alone until the merge step, which checks that the
+partials of a root cover each shard exactly once, combines them and
+writes the locale files and reports from the combined result.
+
+Partials of several roots (apps of one monorepo) can be merged in one go;
+they are grouped by root.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from i18n_tools.locale_writer import write_atomic
+
+# Bump when the partial result layout changes
+PARTIAL_VERSION = 1
+
+# Partial sections mapping an item to the pages (relative paths) it came from
+PAGE_LISTS = ('interpolated', 'untranslated', 'key_usage')
+STAT_NAMES = ('files', 'modified', 'errors')
+
+
+def parse_shard(spec):
+    """Return (index, count) for 'INDEX/COUNT' (0 <= INDEX < COUNT)"""
+    try:
+        index, count = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise ValueError(f"Shard must be INDEX/COUNT, not {spec!r}") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Shard {spec} is out of range (expected 0 <= INDEX < COUNT)")
+    return index, count
+
+
+def shard_of(relative_path, count):
+    """Return the shard of a page path relative to the root (stable across machines)"""
+    digest = hashlib.sha1(Path(relative_path).as_posix().encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % count
+
+
+def select_shard(paths, root, shard):
+    """Return the paths that belong to shard (index, count)"""
+    index, count = shard
+    return [path for path in paths if shard_of(os.path.relpath(path, root), count) == index]
+
+
+def new_partial(root, shard):
+    """Return an empty partial result for one shard of a root"""
+    partial = {
+        'version': PARTIAL_VERSION,
+        'root': str(Path(root).resolve()),
+        'shard': list(shard),
+        'stats': dict.fromkeys(STAT_NAMES, 0),
+        'failed_stages': [],
+    }
+    for name in PAGE_LISTS:
+        partial[name] = {}
+    return partial
+
+
+def add_page(partial, section, item, page):
+    """Record that page (a path relative to the root) has item in section"""
+    pages = partial[section].setdefault(item, [])
+    page = Path(page).as_posix()
+    if page not in pages:
+        pages.append(page)
+
+
+def write_partial(path, partial):
+    """Write a partial result as JSON"""
+    write_atomic(path, json.dumps(partial, ensure_ascii=False, indent=2, sort_keys=True) + '\n')
+
+
+def load_partials(paths):
+    """Return {root: [partial, ...]} for partial result files, checking that
+    the partials of each root cover each of its shards exactly once"""
+    by_root = {}
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            partial = json.load(f)
+        if partial.get('version') != PARTIAL_VERSION:
+            raise ValueError(f"{path}: partial result version {partial.get('version')} "
+                             f"(expected {PARTIAL_VERSION})")
+        by_root.setdefault(partial['root'], []).append(partial)
+    for root, partials in by_root.items():
+        counts = {partial['shard'][1] for partial in partials}
+        if len(counts) != 1:
+            raise ValueError(f"{root}: partials from different shard counts ({', '.join(map(str, sorted(counts)))})")
+        count = counts.pop()
+        seen = sorted(partial['shard'][0] for partial in partials)
+        if seen != list(range(count)):
+            missing = sorted(set(range(count)) - set(seen))
+            duplicate = sorted({index for index in seen if seen.count(index) > 1})
+            problems = ([f"missing {', '.join(map(str, missing))}"] if missing else []) + \
+                       ([f"duplicate {', '.join(map(str, duplicate))}"] if duplicate else [])
+            raise ValueError(f"{root}: shards of {count} do not line up ({'; '.join(problems)})")
+        partials.sort(key=lambda partial: partial['shard'][0])
+    return by_root
+
+
+def merge_partials(partials):
+    """Combine the partials of one root into one result with the same layout"""
+    merged = new_partial(partials[0]['root'], (0, 1))
+    for partial in partials:
+        for name in STAT_NAMES:
+            merged['stats'][name] += partial['stats'][name]
+        for stage in partial['failed_stages']:
+            if stage not in merged['failed_stages']:
+                merged['failed_stages'].append(stage)
+        for section in PAGE_LISTS:
+            for item, pages in partial[section].items():
+                merged[section].setdefault(item, []).extend(pages)
+    for section in PAGE_LISTS:
+        merged[section] = {item: sorted(pages) for item, pages in sorted(merged[section].items())}
+    return merged
@@ -0,0 +1,192 @@
+"""
+Stage scheduler for run-i18n.py.
+
+A stage has a name, the stages it needs, and up to two parts:
+- run(): whole-tree work, done once (update the locale files, load the mapping)
+- transform(path, content): per-page work, returning (new content, note)
+
+requires lists stages that are always pulled in with this one; after lists
+stages that must finish first when they are selected too. The whole-tree
+parts become nodes of a dependency graph, and nodes whose requirements are
+done run at the same time in threads. The page parts of all selected
+stages are fused into a single 'pages' node (one pass over the pages, see
+run-i18n.py), which starts once the whole-tree parts it depends on are done.
+
+Each node's output is buffered and printed as one block when the node
+finishes, so concurrent stages do not interleave their lines.
+"""
+import io
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+PAGES = 'pages'
+
+
+class Stage:
+    """One step of a run; see the module docstring"""
+
+    def __init__(self, name, run=None, transform=None, wants=None, requires=(), after=()):
+        self.name = name
+        self.run = run
+        self.transform = transform
+        # wants(path, source) -> bool, with source a MappedFile: does the page
+        # need this stage (checked before the page is decoded)
+        self.wants = wants
+        self.requires = tuple(requires)
+        self.after = tuple(after)
+
+
+def select(stages, names):
+    """Return the named stages plus the ones they require, in dependency order"""
+    by_name = {stage.name: stage for stage in stages}
+    unknown = [name for name in names if name not in by_name]
+    if unknown:
+        raise ValueError(f"Unknown stage {', '.join(unknown)} (expected {', '.join(by_name)})")
+    chosen = set()
+    pending = list(names)
+    while pending:
+        name = pending.pop()
+        if name not in chosen:
+            chosen.add(name)
+            pending.extend(by_name[name].requires)
+
+    ordered = []
+    state = {}
+
+    def visit(name):
+        if state.get(name) == 'done':
+            return
+        if state.get(name) == 'visiting':
+            raise ValueError(f"Stage {name} depends on itself")
+        state[name] = 'visiting'
+        stage = by_name[name]
+        for before in stage.requires + stage.after:
+            if before in chosen:
+                visit(before)
+        state[name] = 'done'
+        ordered.append(stage)
+
+    for stage in stages:
+        if stage.name in chosen:
+            visit(stage.name)
+    return ordered
+
+
+def graph(stages):
+    """Return {node: node names it waits for} for stages in dependency order.
+
+    Nodes are the stages with a run() part, plus PAGES for the page parts.
+    """
+    names = {stage.name for stage in stages}
+    with_run = {stage.name for stage in stages if stage.run is not None}
+    with_transform = {stage.name for stage in stages if stage.transform is not None}
+
+    def node_deps(stage):
+        deps = set()
+        for before in stage.requires + stage.after:
+            if before not in names:
+                continue
+            # Waiting for a stage means waiting for its run() part if it has one
+            if before in with_run:
+                deps.add(before)
+            elif before in with_transform:
+                deps.add(PAGES)
+        return deps
+
+    nodes = {}
+    for stage in stages:
+        if stage.run is not None:
+            nodes[stage.name] = node_deps(stage)
+    if with_transform:
+        deps = set()
+        for stage in stages:
+            if stage.transform is not None:
+                deps |= node_deps(stage)
+                if stage.run is not None:
+                    deps.add(stage.name)
+        deps.discard(PAGES)
+        nodes[PAGES] = deps
+    for name, deps in nodes.items():
+        if name != PAGES and PAGES in deps and name in nodes[PAGES]:
+            raise ValueError(f"Stage {name} both feeds and follows the page pass")
+    return nodes
+
+
+class _NodeOutput:
+    """sys.stdout stand-in that gives each node's thread its own buffer"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def flush(self):
+        if getattr(self.local, 'buffer', None) is None:
+            self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def run_graph(nodes, jobs):
+    """Run {name: (waits for, fn)}; return ({name: fn() result}, {name: error}).
+
+    A node starts once every node it waits for has succeeded; nodes after a
+    failed one are skipped (and reported) instead.
+    """
+    results = {}
+    errors = {}
+    output = _NodeOutput(sys.stdout)
+
+    def call(name, fn):
+        output.local.buffer = io.StringIO()
+        try:
+            return fn()
+        finally:
+            text = output.local.buffer.getvalue()
+            output.local.buffer = None
+            # Printed here, so a block appears as soon as its node is done
+            with lock:
+                output.stream.write(text)
+                output.stream.flush()
+
+    lock = threading.Lock()
+    waiting = dict(nodes)
+    running = {}
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max(1, jobs), thread_name_prefix='stage') as executor:
+            while waiting or running:
+                # Skipping a node can make later ones skippable, so repeat until settled
+                changed = True
+                while changed:
+                    changed = False
+                    for name, (deps, fn) in list(waiting.items()):
+                        failed = [dep for dep in deps if dep in errors]
+                        if failed:
+                            del waiting[name]
+                            errors[name] = None
+                            changed = True
+                            with lock:
+                                output.stream.write(f"⊘ {name} skipped ({', '.join(failed)} failed)\n")
+                        elif all(dep in results for dep in deps):
+                            del waiting[name]
+                            running[executor.submit(call, name, fn)] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        errors[name] = e
+                        with lock:
+                            output.stream.write(f"✗ {name} failed: {e}\n")
+    finally:
+        sys.stdout = output.stream
+    return results, {name: error for name, error in errors.items() if error is not None}
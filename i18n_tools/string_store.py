@@ -0,0 +1,74 @@
+"""
+Interned string store: every distinct string once, in one UTF-8 buffer.
+
+Strings are added while a structure is built (add() returns an integer id,
+the same id for the same text) and the store is then frozen into a single
+bytes buffer plus an array of offsets. Tables that refer to strings hold
+these ids in typed arrays instead of str objects, which cost ~50 bytes of
+object overhead each before counting their text. Looking a string up
+(find()) is a binary search over the ids sorted by their UTF-8 bytes.
+"""
+from array import array
+from bisect import bisect_left
+
+
+class StringStore:
+    """Distinct strings addressed by integer ids; see the module docstring"""
+
+    def __init__(self):
+        self.buffer = b''
+        self.offsets = array('I', [0])
+        # Ids sorted by their bytes, for find()
+        self.order = array('I')
+        # Text -> id, only while building
+        self._ids = {}
+        self._chunks = []
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def add(self, text):
+        """Return the id of text, adding it if it is new (before freeze() only)"""
+        string_id = self._ids.get(text)
+        if string_id is None:
+            data = text.encode('utf-8')
+            string_id = len(self.offsets) - 1
+            self._ids[text] = string_id
+            self._chunks.append(data)
+            self.offsets.append(self.offsets[-1] + len(data))
+        return string_id
+
+    def freeze(self):
+        """Join the strings into one buffer and drop the build-time dict; return self"""
+        self.buffer = b''.join(self._chunks)
+        self.order = array('I', sorted(range(len(self)), key=self._bytes))
+        self._ids = {}
+        self._chunks = []
+        return self
+
+    def _bytes(self, string_id):
+        return self.buffer[self.offsets[string_id]:self.offsets[string_id + 1]]
+
+    def __getitem__(self, string_id):
+        return self._bytes(string_id).decode('utf-8')
+
+    def find(self, text):
+        """Return the id of text, or None if the store does not hold it"""
+        data = text.encode('utf-8')
+        index = bisect_left(self.order, data, key=self._bytes)
+        if index < len(self.order) and self._bytes(self.order[index]) == data:
+            return self.order[index]
+        return None
+
+    def nbytes(self):
+        """Return the size of the buffer and the arrays"""
+        return (len(self.buffer) + self.offsets.itemsize * len(self.offsets)
+                + self.order.itemsize * len(self.order))
+
+    def __getstate__(self):
+        return {'buffer': self.buffer, 'offsets': self.offsets, 'order': self.order}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._ids = {}
+        self._chunks = []
@@ -0,0 +1,87 @@
+"""
+Content-addressed toast keys.
+
+A toast key is toast.<category>.m<digest>. The digest is taken from the
+normalized Arabic source text, so a message keeps its key when other
+messages are added or removed. The old positional keys (msg1, msg2, ...)
+shifted in that case. Keys that change are recorded in a migration table,
+toast-key-migration.json: {old key: new key}. migrate-toast-keys.py applies
+it to the pages.
+"""
+import hashlib
+import json
+import os
+import re
+import unicodedata
+
+from i18n_tools.tsx_lexer import call_literals
+
+MIGRATION_FILE = 'toast-key-migration.json'
+DIGEST_LENGTH = 10
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_LEGACY_LEAF_RE = re.compile(r'msg\d+')
+
+
+def normalize_message(text):
+    """Return text in NFC with runs of whitespace collapsed and trimmed"""
+    return unicodedata.normalize('NFC', _WHITESPACE_RE.sub(' ', text).strip())
+
+
+def message_leaf(text):
+    """Return the last key segment for a message: 'm' + digest of its text"""
+    digest = hashlib.sha1(normalize_message(text).encode('utf-8')).hexdigest()
+    return 'm' + digest[:DIGEST_LENGTH]
+
+
+def toast_key(category, text):
+    """Return the full key for a message in a category"""
+    return f"toast.{category}.{message_leaf(text)}"
+
+
+def is_legacy_leaf(leaf):
+    """Return True for a positional msgN key segment"""
+    return _LEGACY_LEAF_RE.fullmatch(leaf) is not None
+
+
+def toast_key_index(keys):
+    """Return {leaf: key} for the content-addressed toast keys among keys"""
+    index = {}
+    for key in keys:
+        if key.startswith('toast.'):
+            leaf = key.rpartition('.')[2]
+            if not is_legacy_leaf(leaf):
+                index.setdefault(leaf, key)
+    return index
+
+
+def find_toast_key(index, text):
+    """Return the content-addressed key for text from a toast_key_index, or None"""
+    return index.get(message_leaf(text))
+
+
+def migrate_keys(content, migration):
+    """Return (content with every t('old key') of the migration rewritten to
+    the new key, number of calls rewritten)"""
+    edits = [(literal.start + 1, literal.end - 1, migration[literal.value])
+             for _, literal in call_literals(content, 'translate')
+             if not literal.spans and literal.value in migration]
+    if not edits:
+        return content, 0
+    pieces = []
+    last = 0
+    for start, end, key in sorted(edits):
+        pieces.append(content[last:start])
+        pieces.append(key)
+        last = end
+    pieces.append(content[last:])
+    return ''.join(pieces), len(edits)
+
+
+def load_migration(root):
+    """Return the {old key: new key} table of a Sari checkout ({} if none)"""
+    path = os.path.join(root, MIGRATION_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,126 @@
+"""
+Persistent translation memory (SQLite).
+
+Every translation is stored per (source locale, target locale, source
+text), with the normalized source text next to it. A lookup first tries the
+exact text, then the normalized text, so a message that only differs in
+whitespace or Unicode composition is not translated again. The memory is
+seeded from the translations the locale files already have, and it
+records where each entry came from (a backend, or a locale file).
+"""
+import sqlite3
+
+from i18n_tools.toast_keys import normalize_message
+
+MEMORY_FILE = 'translation-memory.sqlite'
+
+# Bump when the table layout changes
+SCHEMA_VERSION = 1
+
+# SQLite limits the number of parameters per statement
+_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    source_locale TEXT NOT NULL,
+    target_locale TEXT NOT NULL,
+    source TEXT NOT NULL,
+    normalized TEXT NOT NULL,
+    target TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    PRIMARY KEY (source_locale, target_locale, source)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS translations_normalized
+    ON translations (source_locale, target_locale, normalized);
+"""
+
+
+def _chunks(items):
+    for start in range(0, len(items), _CHUNK):
+        yield items[start:start + _CHUNK]
+
+
+class TranslationMemory:
+    """Exact and normalized-text lookup of earlier translations"""
+
+    def __init__(self, path):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        version = self.db.execute('PRAGMA user_version').fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self.db.close()
+            raise ValueError(f"{path} has translation memory schema {version}, expected {SCHEMA_VERSION}")
+        with self.db:
+            self.db.executescript(_SCHEMA)
+            self.db.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def lookup(self, source_locale, target_locale, texts):
+        """Return {text: translation} for the texts the memory knows"""
+        found = {}
+        texts = list(dict.fromkeys(texts))
+        for chunk in _chunks(texts):
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.db.execute(
+                f'SELECT source, target FROM translations WHERE source_locale = ? AND target_locale = ? '
+                f'AND source IN ({placeholders})', [source_locale, target_locale, *chunk])
+            found.update(rows)
+
+        # Texts that only differ after normalization share a translation
+        by_normalized = {}
+        for text in texts:
+            if text not in found:
+                by_normalized.setdefault(normalize_message(text), []).append(text)
+        for chunk in _chunks(list(by_normalized)):
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.db.execute(
+                f'SELECT normalized, MIN(target) FROM translations WHERE source_locale = ? '
+                f'AND target_locale = ? AND normalized IN ({placeholders}) GROUP BY normalized',
+                [source_locale, target_locale, *chunk])
+            for normalized, target in rows:
+                for text in by_normalized[normalized]:
+                    found[text] = target
+        return found
+
+    def add(self, source_locale, target_locale, pairs, origin):
+        """Store (source text, translation) pairs; return how many were new or changed"""
+        rows = [(source_locale, target_locale, source, normalize_message(source), target, origin)
+                for source, target in pairs]
+        with self.db:
+            before = self.db.total_changes
+            self.db.executemany(
+                'INSERT INTO translations VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (source_locale, target_locale, source) DO UPDATE '
+                'SET target = excluded.target, origin = excluded.origin '
+                'WHERE target != excluded.target', rows)
+            return self.db.total_changes - before
+
+    def seed(self, catalog, source_locale):
+        """Remember the translations the locale files already contain; return the count added"""
+        added = 0
+        sources = catalog.locale_values(source_locale)
+        for locale in catalog.locales:
+            if locale == source_locale:
+                continue
+            pairs = {}
+            for source, target in zip(sources, catalog.locale_values(locale)):
+                # Values copied over untranslated are not translations
+                if isinstance(source, str) and isinstance(target, str) and target and target != source:
+                    pairs.setdefault(source, target)
+            # What the locale file says wins over an earlier backend result
+            added += self.add(source_locale, locale, pairs.items(), f"locale:{locale}")
+        return added
+
+    def count(self):
+        """Return {(source locale, target locale): entries}"""
+        rows = self.db.execute('SELECT source_locale, target_locale, COUNT(*) FROM translations '
+                               'GROUP BY source_locale, target_locale')
+        return {(source, target): count for source, target, count in rows}
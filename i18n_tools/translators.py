@@ -0,0 +1,61 @@
+"""
+Machine-translation backends for translate-locales.py.
+
+A backend is any object with a name, batch limits (max_batch_items,
+max_batch_chars) and translate(source_locale, target_locale, texts), which
+returns one translation per text, in order. Backends are looked up by
+registered name ('stub') or loaded from 'package.module:Class', so a real
+service can be plugged in without touching this package.
+"""
+import importlib
+import re
+
+# i18next interpolations ({{count}}) and HTML-ish tags must survive translation
+PLACEHOLDER_RE = re.compile(r'\{\{\s*[\w.]+\s*\}\}|<\/?\w+[^>]*>')
+
+
+class StubTranslator:
+    """Offline backend for tests: prefixes each text with the target locale"""
+
+    name = 'stub'
+    max_batch_items = 100
+    max_batch_chars = 20000
+
+    def translate(self, source_locale, target_locale, texts):
+        return [f"[{target_locale}] {text}" for text in texts]
+
+
+BACKENDS = {
+    'stub': StubTranslator,
+}
+
+
+def load_backend(spec):
+    """Return a backend instance for a registered name or 'package.module:Class'"""
+    if spec in BACKENDS:
+        return BACKENDS[spec]()
+    module_name, _, attr = spec.partition(':')
+    if not attr:
+        raise ValueError(f"Unknown translation backend {spec!r} (expected one of "
+                         f"{', '.join(sorted(BACKENDS))} or package.module:Class)")
+    return getattr(importlib.import_module(module_name), attr)()
+
+
+def placeholders(text):
+    """Return the sorted placeholders of a text"""
+    return sorted(PLACEHOLDER_RE.findall(text))
+
+
+def batches(texts, max_items, max_chars):
+    """Split texts into batches of at most max_items texts and max_chars characters"""
+    batch = []
+    size = 0
+    for text in texts:
+        if batch and (len(batch) >= max_items or size + len(text) > max_chars):
+            yield batch
+            batch = []
+            size = 0
+        batch.append(text)
+        size += len(text)
+    if batch:
+        yield batch
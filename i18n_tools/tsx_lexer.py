@@ -0,0 +1,129 @@
+"""
+Streaming lexer for the TSX constructs the i18n codemods care about.
+
+One pass over a file yields string literals, template literals (with their
+${...} spans), import statements, `export default function Name(...) {`
+headers, `toast.success/error/info/warning(` call heads and `t(` call
+heads. Comments are
+skipped, and nothing inside a string or template is reported as code.
+
+Tokens are yielded as they complete, so a template literal comes after any
+tokens found inside its ${...} spans.
+"""
+import re
+from collections import namedtuple
+
+# kind: 'string' | 'template' | 'import' | 'function' | 'toast' | 'translate'
+# value: literal body, import source, component name, toast level or 't'
+# spans: (start, end) of each ${...} in a template literal
+Token = namedtuple('Token', 'kind start end value spans', defaults=((),))
+
+_STRING = r"'[^'\\\n]*(?:\\.[^'\\\n]*)*'|\"[^\"\\\n]*(?:\\.[^\"\\\n]*)*\""
+
+CODE_RE = re.compile(
+    # The leading lookahead lets the regex engine skip straight to
+    # characters that can start a token
+    r"(?=[/'\"`{}ite])(?:"
+    r"(?P<comment>//[^\n]*|/\*.*?\*/)"
+    rf"|(?P<string>{_STRING})"
+    r"|(?P<tick>`)"
+    r"|(?P<open>\{)"
+    r"|(?P<close>\})"
+    # Import statements may span lines; the source is the first string literal
+    rf"|(?P<import>^import\b[^'\"]*(?P<source>{_STRING})[ \t]*;?)"
+    r"|(?P<function>export\s+default\s+function\s+(?P<name>\w+)\s*\([^)]*\)\s*\{)"
+    r"|(?P<toast>toast\.(?P<level>success|error|info|warning)\s*\()"
+    r"|(?P<translate>(?<![\w$])t\())",
+    re.MULTILINE | re.DOTALL,
+)
+
+# Template text up to the closing backtick or the next ${
+TEMPLATE_TEXT_RE = re.compile(r"(?:[^`\\$]|\\.|\$(?!\{))*", re.DOTALL)
+
+WHITESPACE_RE = re.compile(r"\s*")
+
+
+class _Template:
+    __slots__ = ('start', 'spans', 'span_start', 'depth', 'in_expr')
+
+    def __init__(self, start):
+        self.start = start
+        self.spans = []
+        self.span_start = 0
+        self.depth = 0
+        self.in_expr = False
+
+
+def tokenize(text):
+    """Yield Tokens for one TSX source text in a single pass"""
+    pos = 0
+    size = len(text)
+    templates = []
+    while pos < size:
+        frame = templates[-1] if templates else None
+        if frame is not None and not frame.in_expr:
+            pos = TEMPLATE_TEXT_RE.match(text, pos).end()
+            if pos >= size:
+                break
+            if text[pos] == '`':
+                templates.pop()
+                yield Token('template', frame.start, pos + 1,
+                            text[frame.start + 1:pos], tuple(frame.spans))
+                pos += 1
+            else:
+                frame.in_expr = True
+                frame.span_start = pos
+                frame.depth = 0
+                pos += 2
+            continue
+
+        match = CODE_RE.search(text, pos)
+        if match is None:
+            break
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == 'string':
+            yield Token('string', match.start(), pos, match.group()[1:-1])
+        elif kind == 'tick':
+            templates.append(_Template(match.start()))
+        elif kind == 'open':
+            if frame is not None:
+                frame.depth += 1
+        elif kind == 'close':
+            if frame is not None:
+                if frame.depth:
+                    frame.depth -= 1
+                else:
+                    frame.spans.append((frame.span_start, pos))
+                    frame.in_expr = False
+        elif kind == 'import':
+            yield Token('import', match.start(), pos, match.group('source')[1:-1])
+        elif kind == 'function':
+            yield Token('function', match.start(), pos, match.group('name'))
+        elif kind == 'toast':
+            yield Token('toast', match.start(), pos, match.group('level'))
+        elif kind == 'translate':
+            yield Token('translate', match.start(), pos, 't')
+
+
+def call_literals(text, kind='toast'):
+    """Yield (call head, literal) pairs for calls of the given kind whose
+    first argument is a string or template literal"""
+    pending = {}
+    for token in tokenize(text):
+        if token.kind == kind:
+            pending[WHITESPACE_RE.match(text, token.end).end()] = token
+        elif token.kind in ('string', 'template') and token.start in pending:
+            yield pending.pop(token.start), token
+
+
+def toast_literals(text):
+    """Yield (toast head, literal) pairs for toast.xxx('...') calls"""
+    return call_literals(text, 'toast')
+
+
+def translation_keys(text):
+    """Yield (t head, key) for every t('key') call with a constant key"""
+    for head, literal in call_literals(text, 'translate'):
+        if not literal.spans:
+            yield head, literal.value
@@ -0,0 +1,194 @@
+"""
+File change notification for watch mode.
+
+On Linux the watcher uses inotify through ctypes, so it needs no extra
+dependency. It wakes up as soon as a file is closed after writing or
+renamed into place. Elsewhere, or when inotify is unavailable (for
+example when the watch limit is reached), it polls the tree and compares
+each file's size and mtime.
+
+Both watchers have the same interface: wait(timeout) returns the set of
+paths that changed, and close() releases the watcher.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Events that mean a file has new content or is gone
+FILE_EVENTS = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+WATCH_MASK = FILE_EVENTS | IN_CREATE
+
+_EVENT = struct.Struct('iIII')
+
+# Editors save in bursts (write, rename, chmod); events this close
+# together are reported as one change
+SETTLE_SECONDS = 0.005
+
+DEFAULT_POLL_INTERVAL = 0.25
+
+
+def _tree_files(directories, suffixes):
+    """Yield every file under directories whose name ends with one of suffixes"""
+    for directory in directories:
+        for dirpath, _, filenames in os.walk(directory):
+            for name in filenames:
+                if name.endswith(suffixes):
+                    yield os.path.join(dirpath, name)
+
+
+class PollingWatcher:
+    """Detect changes by comparing (mtime, size) snapshots"""
+
+    method = 'polling'
+
+    def __init__(self, directories, suffixes, files=(), interval=DEFAULT_POLL_INTERVAL):
+        self.directories = [os.path.abspath(directory) for directory in directories]
+        self.suffixes = tuple(suffixes)
+        self.files = [os.path.abspath(path) for path in files]
+        self.interval = interval
+        self.state = self._snapshot()
+
+    def _snapshot(self):
+        state = {}
+        for path in [*_tree_files(self.directories, self.suffixes), *self.files]:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            state[path] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def wait(self, timeout=None):
+        """Block until files change; return the changed paths (empty on timeout)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            state = self._snapshot()
+            changed = {path for path in state.keys() | self.state.keys()
+                       if state.get(path) != self.state.get(path)}
+            self.state = state
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval)
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Detect changes with Linux inotify; raises OSError or AttributeError
+    where inotify is not available"""
+
+    method = 'inotify'
+
+    def __init__(self, directories, suffixes, files=()):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.directories = [os.path.abspath(directory) for directory in directories]
+        self.suffixes = tuple(suffixes)
+        self.files = {os.path.abspath(path) for path in files}
+        # watch descriptor -> (directory, watched recursively)
+        self.watches = {}
+        try:
+            for directory in self.directories:
+                self._watch_tree(directory)
+            for directory in {os.path.dirname(path) for path in self.files}:
+                self._watch(directory, False)
+        except OSError:
+            self.close()
+            raise
+
+    def _watch(self, directory, recursive):
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), directory)
+        # inotify returns the same descriptor for a directory watched twice
+        recursive = recursive or self.watches.get(wd, (None, False))[1]
+        self.watches[wd] = (directory, recursive)
+
+    def _watch_tree(self, root):
+        for dirpath, _, _ in os.walk(root):
+            self._watch(dirpath, True)
+
+    def _read(self):
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b'\0')
+            offset += _EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped: report everything
+                changed.update(_tree_files(self.directories, self.suffixes))
+                changed.update(self.files)
+                continue
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            if wd not in self.watches or not name:
+                continue
+            directory, recursive = self.watches[wd]
+            path = os.path.join(directory, os.fsdecode(name))
+            if mask & IN_ISDIR:
+                if recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files may land in a new directory before it is watched
+                    self._watch_tree(path)
+                    changed.update(_tree_files([path], self.suffixes))
+                continue
+            if not mask & FILE_EVENTS:
+                continue
+            if (recursive and path.endswith(self.suffixes)) or path in self.files:
+                changed.add(path)
+        return changed
+
+    def wait(self, timeout=None):
+        """Block until files change; return the changed paths (empty on timeout)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not select.select([self.fd], [], [], remaining)[0]:
+                return set()
+            changed = self._read()
+            while select.select([self.fd], [], [], SETTLE_SECONDS)[0]:
+                changed |= self._read()
+            if changed:
+                return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def open_watcher(directories, suffixes, files=(), poll=False, interval=DEFAULT_POLL_INTERVAL):
+    """Return an inotify watcher, or a polling one if asked or if inotify is unavailable"""
+    if not poll:
+        try:
+            return InotifyWatcher(directories, suffixes, files)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directories, suffixes, files, interval)
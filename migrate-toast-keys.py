@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Script to rewrite t('toast...') keys in pages using the migration table
+written by extract-toast-messages.py (toast-key-migration.json)
+"""
+import argparse
+from pathlib import Path
+
+from i18n_tools import dry_run
+from i18n_tools.cli import add_common_arguments, apply_common_arguments
+from i18n_tools.mapped_file import MappedFile
+from i18n_tools.phases import phase
+from i18n_tools.toast_keys import MIGRATION_FILE, load_migration, migrate_keys
+
+def migrate_file(file_path, migration):
+    """Rewrite the migrated keys in one file; return how many were changed"""
+    with phase('read'):
+        with MappedFile(file_path) as source:
+            if b'toast.' not in source:
+                return 0
+            content = source.text()
+
+    with phase('match'):
+        migrated, count = migrate_keys(content, migration)
+    if not count:
+        return 0
+
+    with phase('write'):
+        dry_run.write_file(file_path, migrated, content)
+    return count
+
+def migrate_pages(pages_dir, migration):
+    """Migrate the keys in every page under pages_dir, printing each changed
+    page; return (files modified, keys migrated)"""
+    files_modified = 0
+    keys_migrated = 0
+    for file_path in sorted(Path(pages_dir).rglob("*.tsx")):
+        count = migrate_file(file_path, migration)
+        if count:
+            files_modified += 1
+            keys_migrated += count
+            print(f"✓ {file_path.relative_to(pages_dir)}: {count} keys")
+    return files_modified, keys_migrated
+
+def main():
+    parser = argparse.ArgumentParser(description="Migrate toast translation keys in pages")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+    root = apply_common_arguments(args)
+
+    migration = load_migration(root)
+    if not migration:
+        print(f"✗ No {MIGRATION_FILE} in {root}, nothing to migrate")
+        return
+
+    print("Migrating toast keys...")
+    print("=" * 60)
+    files_modified, keys_migrated = migrate_pages(f"{root}/client/src/pages", migration)
+    print("=" * 60)
+    print(f"Files modified: {files_modified}")
+    print(f"Keys migrated: {keys_migrated}")
+    print("Done!")
+    dry_run.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Script to answer i18n usage questions from the scan index:
+
+  raw-toasts [PATH]    toast calls that still show Arabic text (under PATH)
+  key KEY              where a translation key is used (KEY may end in *)
+  message TEXT         where a toast still shows this Arabic message
+  missing-hook [PATH]  files that call t() without the useTranslation hook
+  stats                what the index holds
+
+The index (i18n_tools/scan_index.py) is refreshed before each query, so
+the answers match the files on disk; only files changed since the last
+query are scanned again.
+"""
+import sys
+import time
+import argparse
+
+from i18n_tools import SARI_ROOT
+from i18n_tools.scan_index import ScanIndex, default_index_path
+
+def print_rows(rows, empty):
+    """Print query rows as path:line lines, or the empty message"""
+    for row in rows:
+        print(':'.join(str(part) for part in row[:2]) + ''.join(f"  {part}" for part in row[2:]))
+    if not rows:
+        print(empty)
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the i18n scan index")
+    parser.add_argument('query', choices=['raw-toasts', 'key', 'message', 'missing-hook', 'stats'],
+                        help="question to answer")
+    parser.add_argument('argument', nargs='?',
+                        help="KEY for key, TEXT for message, a path prefix for raw-toasts and missing-hook")
+    parser.add_argument('--index', metavar='FILE',
+                        help="index database (default: one per root in .i18n-cache)")
+    parser.add_argument('--no-refresh', action='store_true',
+                        help="answer from the index as it is, without checking the files")
+    parser.add_argument('--root', default=SARI_ROOT,
+                        help="Sari checkout to query (default: $SARI_ROOT or %(default)s)")
+    args = parser.parse_args()
+    if args.query in ('key', 'message') and not args.argument:
+        parser.error(f"{args.query} needs an argument")
+
+    with ScanIndex(args.index or default_index_path(args.root)) as index:
+        start = time.perf_counter()
+        if not args.no_refresh:
+            counts = index.refresh(args.root)
+            refreshed = time.perf_counter()
+            if counts['scanned'] or counts['removed']:
+                print(f"Index: {counts['scanned']} files scanned, {counts['unchanged']} unchanged, "
+                      f"{counts['removed']} removed ({refreshed - start:.3f} s)", file=sys.stderr)
+            start = refreshed
+
+        under = args.argument or ''
+        if args.query == 'raw-toasts':
+            rows = index.raw_toasts(under)
+            print_rows(rows, "No Arabic toast messages left")
+        elif args.query == 'key':
+            rows = index.key_uses(args.argument)
+            if args.argument.endswith('*'):
+                rows = [(path, line, key) for key, path, line, _ in rows]
+            else:
+                rows = [(path, line) for _, path, line, _ in rows]
+            print_rows(rows, f"{args.argument} is not used")
+        elif args.query == 'message':
+            rows = index.message_files(args.argument)
+            print_rows(rows, "No toast shows this message")
+        elif args.query == 'missing-hook':
+            rows = [(path, f"{t_calls} t() calls" + ("" if has_import else ", no import"))
+                    for path, t_calls, has_import in index.missing_hooks(under)]
+            for path, note in rows:
+                print(f"{path}  {note}")
+            if not rows:
+                print("Every file that calls t() has the useTranslation hook")
+        else:
+            rows = list(index.summary().items())
+            for name, count in rows:
+                print(f"{name}: {count}")
+        print(f"{len(rows)} results ({(time.perf_counter() - start) * 1000:.1f} ms)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -5,150 +5,490 @@ Script to automatically replace Arabic toast messages with translation keys
 import re
 import json
 import os
+import time
+import argparse
 from pathlib import Path
 
-# Load toast mapping
-with open('/home/ubuntu/sari/toast-mapping.json', 'r', encoding='utf-8') as f:
-    toast_mapping = json.load(f)
+from i18n_tools import DEFAULT_IO_WORKERS, SARI_ROOT, dry_run, profiler
+from i18n_tools.artifacts import load_artifact
+from i18n_tools.cli import add_common_arguments, apply_common_arguments
+from i18n_tools.file_cache import FileCache, mapping_hash
+from i18n_tools.interpolation import interpolate, translate_call
+from i18n_tools.locale_catalog import load_catalog
+from i18n_tools.mapped_file import MappedFile, file_contains
+from i18n_tools.phases import phase
+from i18n_tools.toast_keys import MIGRATION_FILE, find_toast_key, load_migration, toast_key_index
+from i18n_tools.tsx_lexer import WHITESPACE_RE, tokenize
 
-# Flatten mapping
+# Bump when the rewrite rules change so cached results are invalidated
+CODEMOD_VERSION = 4
+
+# Toast mapping and its flattened form (loaded from the Sari root in main)
+toast_mapping = {}
 flat_mapping = {}
-for category, messages in toast_mapping.items():
-    flat_mapping.update(messages)
+# Content-addressed toast keys of ar.json by leaf, for interpolated messages
+message_keys = {}
 
 # Pages directory
-pages_dir = Path("/home/ubuntu/sari/client/src/pages")
+pages_dir = Path(f"{SARI_ROOT}/client/src/pages")
+locales_dir = Path(f"{SARI_ROOT}/client/src/locales")
+
+def load_toast_mapping(root):
+    """Return toast-mapping.json of a Sari checkout and its flattened form"""
+    with open(f'{root}/toast-mapping.json', 'r', encoding='utf-8') as f:
+        mapping = json.load(f)
+    
+    # Flatten mapping
+    flat = {}
+    for category, messages in mapping.items():
+        flat.update(messages)
+    return mapping, flat
+
+def new_stats():
+    """Return an empty statistics dict"""
+    return {
+        'files_processed': 0,
+        'files_modified': 0,
+        'replacements': 0,
+        'errors': []
+    }
+
+def merge_stats(target, partial):
+    """Add the counters and errors of a partial stats dict into target"""
+    for name in ('files_processed', 'files_modified', 'replacements'):
+        target[name] += partial[name]
+    target['errors'].extend(partial['errors'])
 
 # Statistics
-stats = {
-    'files_processed': 0,
-    'files_modified': 0,
-    'replacements': 0,
-    'errors': []
-}
-
-def replace_toast_in_file(file_path):
+stats = new_stats()
+
+# Every rewrite starts at a toast call, so files without one are skipped
+TOAST_MARKER = b'toast.'
+
+# Matcher index over every mapping entry (built on first use)
+toast_matcher = None
+
+# A toast call up to its message; the message itself is looked up in the matcher index
+TOAST_HEAD_RE = re.compile(r"toast\.(?:success|error|info|warning)\s*\(\s*(?:(?P<tick>`)|(?P<quote>['\"]))")
+# 'message: ' + error.message
+CONCAT_RE = re.compile(r":\s*['\"](?P<concat>\s*\+)")
+
+# Bump when the mapping artifact (see load_mappings) changes shape
+ARTIFACT_VERSION = 3
+
+def compile_toast_matcher(mapping):
+    """Index the mapping messages by length, so each toast call costs a few dict lookups.
+
+    At every toast call the first message in mapping order that fits wins -
+    the same outcome as applying one message at a time. Quoted literals
+    must hold the whole message, either closed right after it or in the
+    'message: ' + ... concatenation form; template literals only need the
+    message as a prefix. The index is plain data, so it is saved with the
+    mapping artifact instead of being rebuilt (or compiled) on every start.
+    """
+    by_length = {}
+    for order, msg in enumerate(mapping):
+        by_length.setdefault(len(msg), {}).setdefault(msg, order)
+    return {'lengths': sorted(by_length), 'by_length': by_length}
+
+def match_toast(matcher, content, start):
+    """Return (end, replacement, pattern name, message) for the toast call at start, or None"""
+    head = TOAST_HEAD_RE.match(content, start)
+    if head is None:
+        return None
+    pos = head.end()
+    by_length = matcher['by_length']
+    candidates = []
+    for length in matcher['lengths']:
+        order = by_length[length].get(content[pos:pos + length])
+        if order is not None:
+            candidates.append((order, length))
+    for _, length in sorted(candidates):
+        msg = content[pos:pos + length]
+        end = pos + length
+        key = flat_mapping[msg]
+        if head.group('tick') is not None:
+            return end, f"{head.group()}{{t('{key}')}}", 'pattern3', msg
+        if content[end:end + 1] in ("'", '"'):
+            return end + 1, f"{head.group()}{{t('{key}')}}{content[end]}", 'pattern1', msg
+        concat = CONCAT_RE.match(content, end)
+        if concat is not None:
+            return concat.end(), f"{head.group()}{{t('{key}')}}: '{concat.group('concat')}", 'pattern2', msg
+    return None
+
+def get_toast_matcher():
+    """Return the matcher for flat_mapping, compiling it once"""
+    global toast_matcher
+    if toast_matcher is None:
+        toast_matcher = compile_toast_matcher(flat_mapping)
+    return toast_matcher
+
+def match_interpolated(content, literal):
+    """Return (start, end, replacement, message, key) for a toast template
+    literal with ${...} interpolations whose message has a key in ar.json, or None"""
+    interpolation = interpolate(content, literal)
+    if interpolation is None:
+        return None
+    key = find_toast_key(message_keys, interpolation.message)
+    if key is None:
+        return None
+    replacement = translate_call(key, interpolation.placeholders)
+    return literal.start, literal.end, replacement, interpolation.message, key
+
+def match_literal(literal):
+    """Return (start, end, replacement, message, key) for a toast string
+    literal the mapping lacks whose whole message has a key in ar.json, or None"""
+    key = find_toast_key(message_keys, literal.value)
+    if key is None:
+        return None
+    return literal.start, literal.end, f"t('{key}')", literal.value, key
+
+def rewrite_toasts(file_path, content):
+    """Return (content with toast messages replaced, replacement count)"""
+    original_content = content
+    fired = set()
+
+    # Pattern 1: toast.xxx('message')
+    # Pattern 2: toast.xxx('message: ' + error.message)
+    # Pattern 3: toast.xxx(`message...`)
+    # Template: toast.xxx(`message ${value}`) -> toast.xxx(t('key', { value }))
+    # Literal: toast.xxx('message') the mapping lacks -> toast.xxx(t('key'))
+    # Only toast call heads found by the lexer are tried, interpolated
+    # template literals first (as one message), mapping entries second and
+    # whole literals ar.json has a content-addressed key for last
+    matcher = get_toast_matcher()
+    prof = profiler.active
+    if prof is not None:
+        file_start = time.perf_counter()
+    edits = []
+    last = 0
+    with phase('match'):
+        if prof is not None:
+            lex_start = time.perf_counter()
+        sites = []
+        literals = {}
+        for token in tokenize(content):
+            if token.kind == 'toast':
+                sites.append(token)
+            elif token.kind in ('string', 'template'):
+                literals[token.start] = token
+        if prof is not None:
+            prof.lexer(time.perf_counter() - lex_start, len(content))
+        for token in sites:
+            start = token.start
+            if start < last:
+                continue
+            if prof is not None:
+                site_start = time.perf_counter()
+            literal = literals.get(WHITESPACE_RE.match(content, token.end).end())
+            site = None
+            if literal is not None and literal.spans:
+                site = match_interpolated(content, literal)
+            if site is not None:
+                edit_start, end, replaced, msg, key = site
+                pattern = 'template'
+            else:
+                site = match_toast(matcher, content, start)
+                if site is not None:
+                    end, replaced, pattern, msg = site
+                    edit_start, key = start, flat_mapping[msg]
+                elif literal is not None and not literal.spans:
+                    site = match_literal(literal)
+                    if site is not None:
+                        edit_start, end, replaced, msg, key = site
+                        pattern = 'literal'
+            if prof is not None:
+                # The site's time goes to whichever pattern rewrote it
+                if site is None:
+                    prof.site('miss', None, time.perf_counter() - site_start, 0)
+                else:
+                    prof.site(pattern, key, time.perf_counter() - site_start, end - start)
+            if site is None:
+                continue
+            fired.add((msg, pattern))
+            edits.append((edit_start, end, replaced))
+            last = end
+    
+    if edits:
+        with phase('rewrite'):
+            pieces = []
+            last = 0
+            for start, end, replaced in edits:
+                pieces.append(content[last:start])
+                pieces.append(replaced)
+                last = end
+            pieces.append(content[last:])
+            content = ''.join(pieces)
+    # Count each (message, pattern) pair once, as the per-message loop did
+    replacements_in_file = len(fired)
+    if prof is not None:
+        prof.file(file_path, file_start, time.perf_counter() - file_start, len(original_content),
+                  len(sites), replacements_in_file if content != original_content else 0)
+    return content, replacements_in_file
+
+def replace_toast_in_file(file_path, file_stats=None):
     """Replace toast messages in a single file"""
+    if file_stats is None:
+        file_stats = stats
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        original_content = content
-        replacements_in_file = 0
+        with phase('read'):
+            with MappedFile(file_path) as source:
+                original_content = source.text()
         
-        # Pattern 1: toast.success('message')
-        # Pattern 2: toast.error('message')
-        # Pattern 3: toast.info('message')
-        # Pattern 4: toast.warning('message')
-        
-        for ar_msg, key in flat_mapping.items():
-            # Escape special regex characters in the Arabic message
-            escaped_msg = re.escape(ar_msg)
-            
-            # Pattern for simple messages: toast.xxx('message')
-            pattern1 = rf"(toast\.(success|error|info|warning)\s*\(\s*['\"]){escaped_msg}(['\"])"
-            replacement1 = rf"\1{{t('{key}')}}\3"
-            
-            if re.search(pattern1, content):
-                content = re.sub(pattern1, replacement1, content)
-                replacements_in_file += 1
-            
-            # Pattern for messages with concatenation: toast.xxx('message: ' + error.message)
-            pattern2 = rf"(toast\.(success|error|info|warning)\s*\(\s*['\"]){escaped_msg}:\s*['\"](\s*\+)"
-            replacement2 = rf"\1{{t('{key}')}}: '\3"
-            
-            if re.search(pattern2, content):
-                content = re.sub(pattern2, replacement2, content)
-                replacements_in_file += 1
-            
-            # Pattern for messages with template literals
-            pattern3 = rf"(toast\.(success|error|info|warning)\s*\(\s*`){escaped_msg}"
-            replacement3 = rf"\1{{t('{key}')}}"
-            
-            if re.search(pattern3, content):
-                content = re.sub(pattern3, replacement3, content)
-                replacements_in_file += 1
-        
-        # Special case: "تم استيراد ${count} منتج بنجاح"
-        special_pattern = r"toast\.success\(`تم استيراد \$\{[^}]+\} منتج بنجاح`\)"
-        if re.search(special_pattern, content):
-            content = re.sub(
-                special_pattern,
-                r"toast.success(`${t('toast.upload.msg1')} ${data.imported} ${t('toast.products.msg8')}`)",
-                content
-            )
-            replacements_in_file += 1
-        
-        # Special case for dynamic status messages
-        # "الاتصال ناجح! الحالة: ${data.status}"
-        dynamic_pattern1 = r"toast\.success\(`الاتصال ناجح! الحالة: \$\{[^}]+\}`\)"
-        if re.search(dynamic_pattern1, content):
-            content = re.sub(
-                dynamic_pattern1,
-                r"toast.success(`${t('toast.instances.msg9')}: ${data.status}`)",
-                content
-            )
-            replacements_in_file += 1
-        
-        # "فشل الاتصال: ${data.message}"
-        dynamic_pattern2 = r"toast\.error\(`فشل الاتصال: \$\{[^}]+\}`\)"
-        if re.search(dynamic_pattern2, content):
-            content = re.sub(
-                dynamic_pattern2,
-                r"toast.error(`${t('toast.instances.msg10')}: ${data.message}`)",
-                content
-            )
-            replacements_in_file += 1
+        content, replacements_in_file = rewrite_toasts(file_path, original_content)
         
         if content != original_content:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            with phase('write'):
+                dry_run.write_file(file_path, content, original_content)
             
-            stats['files_modified'] += 1
-            stats['replacements'] += replacements_in_file
+            file_stats['files_modified'] += 1
+            file_stats['replacements'] += replacements_in_file
             return True, replacements_in_file
         
         return False, 0
     
     except Exception as e:
-        stats['errors'].append(f"{file_path}: {str(e)}")
+        file_stats['errors'].append(f"{file_path}: {str(e)}")
         return False, 0
 
-def process_directory(directory):
+def init_worker(mapping, keys, defer_diffs=False):
+    """Give a pool worker the same mapping, message keys (and dry-run mode) the parent uses"""
+    global toast_matcher
+    if mapping is not flat_mapping:
+        flat_mapping.update(mapping)
+        message_keys.update(keys)
+        toast_matcher = None
+    get_toast_matcher()
+    if defer_diffs:
+        dry_run.defer()
+
+def read_page(file_path):
+    """Pipeline reader: return the page text, or None if it has no toast call"""
+    with phase('read'):
+        with MappedFile(file_path) as source:
+            if TOAST_MARKER not in source:
+                return None
+            return source.text()
+
+def rewrite_page(file_path, content):
+    """Pipeline transform: return (original, new content, replacements, profile)"""
+    if content is None:
+        return None
+    new_content, count = rewrite_toasts(file_path, content)
+    # The profile travels with the result, so it also comes back from worker processes
+    profile = profiler.active.drain() if profiler.active is not None else None
+    return content, new_content, count, profile
+
+def write_page(file_path, rewritten):
+    """Pipeline writer: write a changed page (or render its diff); return (rewritten, diff)"""
+    if rewritten is None or rewritten[0] == rewritten[1]:
+        return rewritten, None
+    with phase('write'):
+        return rewritten, dry_run.render(file_path, rewritten[1], rewritten[0])
+
+def process_file(file_path):
+    """Process one file and return (file_path, modified, count, has_toast, stats)"""
+    file_stats = new_stats()
+    file_stats['files_processed'] += 1
+    # Files without a toast call are rejected before being decoded
+    has_toast = file_contains(file_path, TOAST_MARKER)
+    modified, count = False, 0
+    if has_toast:
+        modified, count = replace_toast_in_file(file_path, file_stats)
+    if profiler.active is not None:
+        # Hand this file's profile back to the parent along with its stats
+        file_stats['profile'] = profiler.active.drain()
+    if dry_run.deferred is not None:
+        file_stats['diffs'] = dry_run.take()
+    return file_path, modified, count, has_toast and not modified, file_stats
+
+def process_directory(directory, jobs=1, cache=None, io_workers=0):
     """Process all TypeScript files in directory"""
+    file_paths = []
     for file_path in directory.rglob("*.tsx"):
         # Skip Products.tsx as it's already done
         if file_path.name == "Products.tsx" and "merchant" in str(file_path):
             print(f"⊘ Skipping {file_path.name} (already processed)")
             continue
-        
-        stats['files_processed'] += 1
-        modified, count = replace_toast_in_file(file_path)
-        
+        file_paths.append(file_path)
+    
+    # Files whose content was already seen unchanged under this mapping are skipped
+    hashes = {}
+    cached = {}
+    if cache is not None and cache.enabled:
+        for file_path in file_paths:
+            with MappedFile(file_path) as source:
+                hashes[file_path] = source.hash()
+            entry = cache.get(hashes[file_path])
+            if entry is not None:
+                cached[file_path] = entry
+    todo = [file_path for file_path in file_paths if file_path not in cached]
+    
+    if io_workers:
+        process_pipeline(file_paths, cached, jobs, io_workers, cache, hashes)
+    elif jobs > 1 and todo:
+        # Results come back in file order, so output and stats match a serial run
+        # Workers hand their dry-run diffs back so they come out in file order
+        from multiprocessing import Pool
+        initargs = (flat_mapping, message_keys, dry_run.sink is not None)
+        with Pool(jobs, initializer=init_worker, initargs=initargs) as pool:
+            results = pool.imap(process_file, todo, chunksize=8)
+            report_results(merge_cached(file_paths, cached, results), cache, hashes)
+    else:
+        report_results(merge_cached(file_paths, cached, map(process_file, todo)), cache, hashes)
+
+def process_pipeline(file_paths, cached, jobs, io_workers, cache=None, hashes=None):
+    """Process files through the asyncio pipeline: reads and writes overlap the rewrites"""
+    # Imported on use, like multiprocessing: they dominate the startup time otherwise
+    from concurrent.futures import ProcessPoolExecutor
+    from i18n_tools.pipeline import run_pipeline
+    
+    def read(file_path):
+        return None if file_path in cached else read_page(file_path)
+    
+    def on_result(file_path, result, error):
+        file_stats = new_stats()
+        file_stats['files_processed'] += 1
+        if file_path in cached:
+            report_result(file_path, False, 0, cached[file_path]['has_toast'], file_stats, cache, hashes)
+            return
+        rewritten, diff = result if error is None else (None, None)
+        if error is not None:
+            file_stats['errors'].append(f"{file_path}: {str(error)}")
+        modified = rewritten is not None and rewritten[0] != rewritten[1]
+        count = rewritten[2] if modified else 0
         if modified:
-            print(f"✓ {file_path.relative_to(pages_dir)}: {count} replacements")
+            file_stats['files_modified'] += 1
+            file_stats['replacements'] += count
+        if rewritten is not None and rewritten[3] is not None:
+            file_stats['profile'] = rewritten[3]
+        if diff is not None:
+            file_stats['diffs'] = [diff]
+        has_toast = error is not None or rewritten is not None
+        report_result(file_path, modified, count, has_toast and not modified, file_stats, cache, hashes)
+    
+    if jobs > 1:
+        # Rewrites run in worker processes; reads, writes and diffs stay in this one
+        with ProcessPoolExecutor(jobs, initializer=init_worker,
+                                 initargs=(flat_mapping, message_keys)) as executor:
+            run_pipeline(file_paths, read, rewrite_page, write_page, on_result,
+                         io_workers=io_workers, cpu_executor=executor, cpu_workers=jobs)
+    else:
+        run_pipeline(file_paths, read, rewrite_page, write_page, on_result, io_workers=io_workers)
+
+def merge_cached(file_paths, cached, results):
+    """Yield results in file order, filling in cached files without processing them"""
+    for file_path in file_paths:
+        if file_path in cached:
+            file_stats = new_stats()
+            file_stats['files_processed'] += 1
+            yield file_path, False, 0, cached[file_path]['has_toast'], file_stats
         else:
-            # Check if file has toast messages
-            with open(file_path, 'r', encoding='utf-8') as f:
-                if 'toast.' in f.read():
-                    print(f"○ {file_path.relative_to(pages_dir)}: no matches (may need manual review)")
+            yield next(results)
+
+def report_results(results, cache=None, hashes=None):
+    """Print per-file results and merge their stats into the global stats"""
+    for result in results:
+        report_result(*result, cache, hashes)
+
+def report_result(file_path, modified, count, has_toast, file_stats, cache=None, hashes=None):
+    """Print one file's result and merge its stats into the global stats"""
+    merge_stats(stats, file_stats)
+    if 'profile' in file_stats:
+        profiler.active.merge(file_stats['profile'])
+    for diff in file_stats.get('diffs', ()):
+        dry_run.emit(diff)
+    if cache is not None and not modified and not file_stats['errors'] and file_path in hashes:
+        cache.set(hashes[file_path], {'has_toast': has_toast})
+    if modified:
+        print(f"✓ {file_path.relative_to(pages_dir)}: {count} replacements")
+    elif has_toast:
+        print(f"○ {file_path.relative_to(pages_dir)}: no matches (may need manual review)")
+
+def build_mappings(root, use_cache=True):
+    """Return the mapping artifact of a Sari checkout: the mapping, flattened
+    with keys extract renamed followed through the migration table, its
+    matcher index, the content-addressed toast keys of ar.json (for
+    interpolated messages) and the mapping keys ar.json lacks"""
+    # Built aside, so a mapping or locale file that fails to parse leaves
+    # the loaded mapping as it was
+    mapping, flat = load_toast_mapping(root)
+    # extract points toast-mapping.json at the new keys itself; this covers
+    # a mapping edited or restored since, which must not bring msgN back
+    migration = load_migration(root)
+    flat = {msg: migration.get(key, key) for msg, key in flat.items()}
+    catalog = load_catalog(Path(f"{root}/client/src/locales"), use_snapshot=use_cache)
+    key_index = toast_key_index(catalog.locale_keys('ar'))
+    return {
+        'toast_mapping': mapping,
+        'flat_mapping': flat,
+        'matcher': compile_toast_matcher(flat),
+        'message_keys': key_index,
+        'unknown_keys': sorted({key for key in flat.values() if not catalog.has(key, 'ar')}),
+    }
+
+def load_mappings(root, use_cache=True):
+    """Load the mapping of a Sari checkout and its matcher index; return the
+    mapping keys missing from ar.json.
+
+    While toast-mapping.json, ar.json and the migration table are
+    unchanged this is one read of the saved artifact. Safe to call again
+    (watch mode does when the mapping or a locale changes).
+    """
+    global pages_dir, locales_dir, toast_matcher
+    pages_dir = Path(f"{root}/client/src/pages")
+    locales_dir = Path(f"{root}/client/src/locales")
+    artifact = load_artifact(
+        'toast-mapping',
+        mapping_hash(ARTIFACT_VERSION, CODEMOD_VERSION),
+        [f"{root}/toast-mapping.json", locales_dir / "ar.json", f"{root}/{MIGRATION_FILE}"],
+        lambda: build_mappings(root, use_cache),
+        enabled=use_cache,
+    )
+    toast_mapping.clear()
+    toast_mapping.update(artifact['toast_mapping'])
+    flat_mapping.clear()
+    flat_mapping.update(artifact['flat_mapping'])
+    message_keys.clear()
+    message_keys.update(artifact['message_keys'])
+    toast_matcher = artifact['matcher']
+    return artifact['unknown_keys']
 
 def main():
+    parser = argparse.ArgumentParser(description="Replace Arabic toast messages with translation keys")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="number of worker processes (default: 1)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="reprocess every file, ignoring the content-hash cache")
+    parser.add_argument('--profile', metavar='PREFIX', default=profiler.OUTPUT,
+                        help="profile every pattern and file, writing PREFIX.txt and "
+                             "PREFIX.trace.json (implies --no-cache)")
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="overlap file reads and writes with the rewrites (asyncio pipeline)")
+    parser.add_argument('--io-workers', type=int, default=DEFAULT_IO_WORKERS,
+                        help=f"concurrent reads/writes with --async (default: {DEFAULT_IO_WORKERS})")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+    root = apply_common_arguments(args)
+    if args.profile:
+        profiler.enable(args.profile)
+    
     print("=" * 70)
     print("Replacing Toast Messages with Translation Keys")
     print("=" * 70)
     print()
     
-    # Add missing translations to mapping
-    additional_translations = {
-        'منتج بنجاح': 'toast.products.msg8',  # for "تم استيراد X منتج بنجاح"
-        'الاتصال ناجح! الحالة': 'toast.instances.msg9',
-        'فشل الاتصال': 'toast.instances.msg10',
-    }
-    flat_mapping.update(additional_translations)
+    unknown_keys = load_mappings(root, use_cache=not args.no_cache and not args.profile)
     
     # Process all files
-    process_directory(pages_dir)
+    cache = FileCache(
+        'replace-toast-messages',
+        mapping_hash(CODEMOD_VERSION, list(flat_mapping.items()), sorted(message_keys.items())),
+        enabled=not args.no_cache and not args.profile,
+    )
+    process_directory(pages_dir, max(1, args.jobs), cache,
+                      max(1, args.io_workers) if args.use_async else 0)
+    cache.save()
     
     print()
     print("=" * 70)
@@ -157,6 +497,18 @@ def main():
     print(f"Files processed: {stats['files_processed']}")
     print(f"Files modified: {stats['files_modified']}")
     print(f"Total replacements: {stats['replacements']}")
+    if cache.enabled:
+        print(cache.summary())
+    
+    # Keys the mapping points at must exist in the source locale
+    if unknown_keys:
+        print(f"\n⚠ {len(unknown_keys)} mapping keys missing from ar.json:")
+        for key in unknown_keys:
+            print(f"  - {key}")
+    
+    if profiler.active is not None:
+        report_path, trace_path = profiler.active.write(args.profile)
+        print(f"\nProfile written to {report_path} and {trace_path}")
     
     if stats['errors']:
         print(f"\nErrors: {len(stats['errors'])}")
@@ -166,6 +518,7 @@ def main():
     print("=" * 70)
     print("Done! Please review the changes and test the application.")
     print("=" * 70)
+    dry_run.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Script to run the i18n codemods as stages of one pipeline:
+
+  extract    write the toast messages into the locale files (and report
+             toast literals pages use without a translation)
+  migrate    rewrite the t() calls of toast keys extract renamed
+             (toast-key-migration.json)
+  map        load toast-mapping.json and its matcher index
+  replace    replace the Arabic toast messages in pages with t() calls
+  inject     add the useTranslation import and hook
+  translate  machine-translate the keys the locales are missing (--backend)
+
+Each page is read once, goes through every page stage in memory and is
+written at most once. Stages that do not depend on each other run at the
+same time: translate fills the locales while the pages are rewritten.
+
+With --shard INDEX/COUNT only the pages of one shard are processed (see
+i18n_tools/shards.py) and the locale files are not written; the shard's
+findings go to a partial result file instead. --merge combines the
+partial results of all shards and writes the locale files and reports.
+The pages must be rewritten with the keys the merge writes, so a sharded
+run takes two rounds, a read-only extract round and a rewriting round:
+
+    run-i18n.py extract --shard 0/2 --partial shard-0.json   (and 1/2)
+    run-i18n.py --merge shard-0.json shard-1.json
+    run-i18n.py --shard 0/2 --partial shard-0.json           (and 1/2)
+    run-i18n.py --merge shard-0.json shard-1.json
+"""
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from i18n_tools import DEFAULT_IO_WORKERS, dry_run
+from i18n_tools.cli import add_common_arguments, apply_common_arguments
+from i18n_tools.locale_catalog import SOURCE_LOCALE, load_catalog
+from i18n_tools.mapped_file import MappedFile
+from i18n_tools.phases import phase
+from i18n_tools.pipeline import run_pipeline
+from i18n_tools.scripts import load_script
+from i18n_tools.shards import (add_page, load_partials, merge_partials, new_partial,
+                               parse_shard, select_shard, write_partial)
+from i18n_tools.stages import PAGES, Stage, graph, run_graph, select
+from i18n_tools.toast_keys import MIGRATION_FILE, load_migration, migrate_keys
+from i18n_tools.translators import BACKENDS, load_backend
+from i18n_tools.tsx_lexer import translation_keys
+
+extract_toast_messages = load_script('extract-toast-messages.py')
+replace_toast_messages = load_script('replace-toast-messages.py')
+add_usetranslation = load_script('add-usetranslation.py')
+translate_pages = load_script('translate-pages.py')
+translate_locales = load_script('translate-locales.py')
+
+root = None
+pages_dir = None
+args = None
+# Catalog as extract left it, for the untranslated-toast check
+catalog = None
+# Arabic toast message -> pages using it without a translation
+untranslated = defaultdict(list)
+# Old toast key -> current key, as extract left the locale files
+migration = {}
+# Page path (relative to the root) -> useTranslation injector for it
+injectors = {}
+# (index, count) and partial result of a --shard run
+shard = None
+partial = None
+
+def run_extract():
+    """Whole-tree part of extract: update the toast sections of the locale files"""
+    global catalog
+    if shard is None:
+        # Returned rather than read back, so a dry run migrates pages too
+        migration.update(extract_toast_messages.update_locales(root, use_cache=not args.no_cache))
+    else:
+        print("○ Locale files are left to --merge")
+    catalog = load_catalog(f"{root}/client/src/locales", use_snapshot=not args.no_cache)
+
+def check_untranslated(path, content):
+    """Page part of extract: note toast literals without a translation (and,
+    in a shard, the interpolated messages for the merge)"""
+    for message in extract_toast_messages.toast_messages(content):
+        if partial is not None:
+            page = os.path.relpath(path, root)
+            if '{{' in message:
+                add_page(partial, 'interpolated', message, page)
+            if not extract_toast_messages.has_translation(message, catalog):
+                add_page(partial, 'untranslated', message, page)
+        elif not extract_toast_messages.has_translation(message, catalog):
+            untranslated[message].append(Path(path).relative_to(pages_dir))
+    return content, None
+
+def has_toast(path, source):
+    return b'toast.' in source
+
+def run_migrate():
+    """Load the migration table, unless extract just returned it"""
+    if not migration:
+        migration.update(load_migration(root))
+    print(f"✓ {len(migration)} renamed toast keys in {MIGRATION_FILE}")
+
+def wants_migrate(path, source):
+    return bool(migration) and b'toast.' in source
+
+def migrate_page(path, content):
+    content, count = migrate_keys(content, migration)
+    return content, f"{count} keys migrated" if count else None
+
+def removed_keys(content):
+    """Return the keys the migration removed that a page still uses"""
+    return sorted({key for _, key in translation_keys(content) if key in migration})
+
+def run_map():
+    """Load the toast mapping and its matcher index"""
+    replace_toast_messages.load_mappings(root, use_cache=not args.no_cache)
+    print(f"✓ {len(replace_toast_messages.flat_mapping)} toast messages mapped")
+
+def wants_replace(path, source):
+    # replace-toast-messages.py leaves merchant/Products.tsx alone
+    if path.name == "Products.tsx" and "merchant" in str(path):
+        return False
+    return replace_toast_messages.TOAST_MARKER in source
+
+def replace_toasts(path, content):
+    content, count = replace_toast_messages.rewrite_toasts(path, content)
+    return content, f"{count} replacements" if count else None
+
+def wants_inject(path, source):
+    return os.path.relpath(path, root) in injectors
+
+def inject_hook(path, content):
+    if 'useTranslation' in content:
+        return content, None
+    new_content = injectors[os.path.relpath(path, root)](content)
+    if new_content is None:
+        return content, "no import section for useTranslation"
+    return new_content, "useTranslation added"
+
+def run_translate():
+    """Fill the locales with machine translations"""
+    backend = load_backend(args.backend)
+    translate_locales.fill_locales(root, backend, args.locales, args.source)
+
+STAGES = [
+    Stage('extract', run=run_extract, transform=check_untranslated, wants=has_toast),
+    Stage('migrate', run=run_migrate, transform=migrate_page, wants=wants_migrate, after=('extract',)),
+    Stage('map', run=run_map, after=('extract',)),
+    Stage('replace', transform=replace_toasts, wants=wants_replace, requires=('map',)),
+    Stage('inject', transform=inject_hook, wants=wants_inject, after=('replace',)),
+    Stage('translate', run=run_translate, after=('extract',)),
+]
+
+def run_pages(stages, io_workers):
+    """One pass over the pages: read once, apply the page stages, write once"""
+    totals = {'files': 0, 'modified': 0, 'errors': 0}
+
+    def read(path):
+        with phase('read'):
+            with MappedFile(path) as source:
+                # Pages no stage wants are never decoded
+                wanted = [stage for stage in stages if stage.wants is None or stage.wants(path, source)]
+                # A shard also records the keys every page uses
+                if not wanted and (partial is None or b't(' not in source):
+                    return None
+                return wanted, source.text()
+
+    def transform(path, data):
+        if data is None:
+            return None
+        wanted, original = data
+        content = original
+        notes = []
+        for stage in wanted:
+            content, note = stage.transform(path, content)
+            if note:
+                notes.append(note)
+        # Whatever stage put them there, keys the locale files no longer
+        # have would break the page at runtime
+        if any(stage.name == 'migrate' for stage in wanted):
+            stale = removed_keys(content)
+            if stale:
+                raise ValueError(f"still uses removed toast keys: {', '.join(stale)}")
+        if partial is not None:
+            page = os.path.relpath(path, root)
+            for _, key in translation_keys(content):
+                add_page(partial, 'key_usage', key, page)
+        return original, content, notes
+
+    def write(path, transformed):
+        if transformed is None or transformed[0] == transformed[1]:
+            return transformed, None
+        with phase('write'):
+            return transformed, dry_run.render(path, transformed[1], transformed[0])
+
+    def on_result(path, result, error):
+        totals['files'] += 1
+        relative = path.relative_to(pages_dir)
+        if error is not None:
+            totals['errors'] += 1
+            print(f"✗ {relative}: {error}")
+            return
+        transformed, diff = result
+        if diff is not None:
+            dry_run.emit(diff)
+        if transformed is None:
+            return
+        original, content, notes = transformed
+        if content != original:
+            totals['modified'] += 1
+        if notes:
+            print(f"{'✓' if content != original else '○'} {relative}: {', '.join(notes)}")
+
+    files = sorted(pages_dir.rglob("*.tsx"))
+    if shard is not None:
+        files = select_shard(files, root, shard)
+    run_pipeline(files, read, transform, write, on_result, io_workers=io_workers)
+    print(f"Pages: {totals['files']} read, {totals['modified']} written"
+          + (f", {totals['errors']} errors" if totals['errors'] else ""))
+    if partial is not None:
+        partial['stats'].update(totals)
+    elif catalog is not None:
+        extract_toast_messages.report_untranslated(untranslated)
+    if totals['errors']:
+        raise RuntimeError(f"{totals['errors']} pages failed")
+
+def timed(name, fn):
+    """Wrap a node so its output block starts with its name and ends with its time"""
+    def run():
+        print(f"── {name}")
+        start = time.perf_counter()
+        result = fn()
+        print(f"── {name} done ({time.perf_counter() - start:.2f} s)")
+        return result
+    return run
+
+def merge_shards(paths, use_cache=True):
+    """Combine the partial results of shard runs: write each root's locale
+    files and print its reports; return False if a shard had failures"""
+    ok = True
+    for shard_root, partials in load_partials(paths).items():
+        merged = merge_partials(partials)
+        stats = merged['stats']
+        print("=" * 60)
+        print(f"Merging {len(partials)} shards of {shard_root}")
+        print("=" * 60)
+        print(f"Pages: {stats['files']} read, {stats['modified']} written"
+              + (f", {stats['errors']} errors" if stats['errors'] else ""))
+        if stats['errors'] or merged['failed_stages']:
+            ok = False
+            failed = ', '.join(merged['failed_stages']) or 'pages'
+            print(f"⚠ Shards failed ({failed}); their findings are incomplete")
+        extract_toast_messages.update_locales(shard_root, use_cache, interpolated=merged['interpolated'])
+        # Messages the merge just gave a key are not untranslated any more
+        merged_catalog = load_catalog(f"{shard_root}/client/src/locales", use_snapshot=use_cache)
+        extract_toast_messages.report_untranslated({
+            message: pages for message, pages in merged['untranslated'].items()
+            if not extract_toast_messages.has_translation(message, merged_catalog)
+        })
+        missing = [(key, pages) for key, pages in merged['key_usage'].items()
+                   if not merged_catalog.has(key, SOURCE_LOCALE)]
+        print(f"✓ {len(merged['key_usage'])} translation keys used in pages")
+        if missing:
+            print(f"⚠ {len(missing)} of them are missing from {SOURCE_LOCALE}.json:")
+            for key, pages in missing[:20]:
+                print(f"  - {key} ({pages[0]}, {len(pages)} files)")
+            if len(missing) > 20:
+                print(f"  ... and {len(missing) - 20} more")
+    return ok
+
+def main():
+    global root, pages_dir, args, shard, partial
+    names = [stage.name for stage in STAGES]
+    parser = argparse.ArgumentParser(description="Run the i18n codemods as one pipeline")
+    parser.add_argument('stages', nargs='*', metavar='STAGE',
+                        help=f"stages to run: {', '.join(names)} (default: all; "
+                             "translate only with --backend)")
+    parser.add_argument('--backend',
+                        help=f"translation backend for translate: {', '.join(sorted(BACKENDS))} "
+                             "or package.module:Class")
+    parser.add_argument('--locales', nargs='+',
+                        help="locales to translate (default: every locale but the source)")
+    parser.add_argument('--source', default=SOURCE_LOCALE,
+                        help="locale to translate from (default: %(default)s)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="rebuild the toast section even if the locale files are up to date")
+    parser.add_argument('--io-workers', type=int, default=DEFAULT_IO_WORKERS,
+                        help=f"concurrent page reads/writes (default: {DEFAULT_IO_WORKERS})")
+    parser.add_argument('--shard', metavar='INDEX/COUNT',
+                        help="process only this shard of the pages and leave the locale files alone")
+    parser.add_argument('--partial', metavar='FILE',
+                        help="where a --shard run writes its partial result "
+                             "(default: i18n-shard-INDEX-of-COUNT.json)")
+    parser.add_argument('--merge', nargs='+', metavar='PARTIAL',
+                        help="merge the partial results of shard runs instead of running stages")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+
+    if args.merge:
+        if args.stages or args.shard:
+            parser.error("--merge takes no stages or --shard")
+        apply_common_arguments(args)
+        try:
+            ok = merge_shards(args.merge, use_cache=not args.no_cache)
+        except (OSError, ValueError, KeyError) as e:
+            parser.error(f"cannot merge: {e}")
+        print("=" * 60)
+        print("Done!" if ok else "Done (some shards failed)")
+        dry_run.close()
+        if not ok:
+            sys.exit(1)
+        return
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+
+    requested = args.stages or [name for name in names if name != 'translate' or args.backend]
+    try:
+        stages = select(STAGES, requested)
+        nodes = graph(stages)
+    except ValueError as e:
+        parser.error(str(e))
+    if 'translate' in nodes and not args.backend:
+        parser.error("the translate stage needs --backend")
+    if 'translate' in nodes and shard is not None:
+        parser.error("the translate stage writes the locale files; run it after --merge")
+    if args.backend:
+        try:
+            load_backend(args.backend)
+        except (ValueError, ImportError, AttributeError) as e:
+            parser.error(str(e))
+
+    root = apply_common_arguments(args)
+    pages_dir = Path(f"{root}/client/src/pages")
+    if shard is not None:
+        partial = new_partial(root, shard)
+    for filepath in add_usetranslation.files:
+        injectors[os.path.normpath(filepath)] = add_usetranslation.inject_use_translation
+    for filename in translate_pages.target_files:
+        injectors[os.path.join('client', 'src', 'pages', 'merchant', filename)] = \
+            translate_pages.inject_use_translation
+
+    page_stages = [stage for stage in stages if stage.transform is not None]
+    work = {}
+    for name, deps in nodes.items():
+        if name == PAGES:
+            fn = lambda: run_pages(page_stages, max(1, args.io_workers))
+            label = f"pages ({', '.join(stage.name for stage in page_stages)})"
+        else:
+            fn = next(stage.run for stage in stages if stage.name == name)
+            label = name
+        work[name] = (deps, timed(label, fn))
+
+    print("=" * 60)
+    print(f"Running {', '.join(stage.name for stage in stages)}"
+          + (f" on shard {shard[0]} of {shard[1]}" if shard is not None else ""))
+    print("=" * 60)
+    start = time.perf_counter()
+    _, errors = run_graph(work, len(work))
+    if partial is not None:
+        partial['failed_stages'] = sorted(errors)
+        partial_path = args.partial or f"i18n-shard-{shard[0]}-of-{shard[1]}.json"
+        write_partial(partial_path, partial)
+        print(f"Partial result written to {partial_path}")
+    print("=" * 60)
+    print(f"Done in {time.perf_counter() - start:.2f} s"
+          + (f" ({len(errors)} stages failed)" if errors else "!"))
+    dry_run.close()
+    if errors:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Script to fill the locale files with machine translations of the keys
+they are missing. The missing strings of each target locale are sent to
+the translation backend in large batches, and every result is kept in a
+translation memory (translation-memory.sqlite in the Sari root), so no
+string is translated twice.
+"""
+import os
+import argparse
+
+from i18n_tools import dry_run
+from i18n_tools.cli import add_common_arguments, apply_common_arguments
+from i18n_tools.locale_catalog import SOURCE_LOCALE, load_catalog
+from i18n_tools.locale_writer import LocaleWriter, group_updates
+from i18n_tools.toast_keys import normalize_message
+from i18n_tools.translation_memory import MEMORY_FILE, TranslationMemory
+from i18n_tools.translators import BACKENDS, batches, load_backend, placeholders
+
+def collect_missing(catalog, locale, source_locale):
+    """Return {key: source text} for the text keys a locale does not define"""
+    missing = {}
+    for key in catalog.missing(locale, source_locale):
+        text = catalog.get(key, source_locale)
+        if isinstance(text, str) and text.strip():
+            missing[key] = text
+    return missing
+
+def translate_texts(texts, backend, memory, source_locale, locale, max_items, max_chars):
+    """Return ({text: translation}, stats), asking the memory first and the backend in batches"""
+    found = memory.lookup(source_locale, locale, texts)
+    stats = {'memory': len(found), 'translated': 0, 'batches': 0, 'rejected': []}
+
+    # Texts that only differ after normalization are sent once
+    pending = {}
+    for text in texts:
+        if text not in found:
+            pending.setdefault(normalize_message(text), []).append(text)
+    todo = [group[0] for group in pending.values()]
+
+    for batch in batches(todo, max_items, max_chars):
+        results = backend.translate(source_locale, locale, batch)
+        if len(results) != len(batch):
+            raise ValueError(f"{backend.name} returned {len(results)} translations for {len(batch)} texts")
+        accepted = []
+        for text, result in zip(batch, results):
+            # Drop empty results and results that lost or invented a placeholder
+            if not isinstance(result, str) or not result.strip() or placeholders(result) != placeholders(text):
+                stats['rejected'].append(text)
+                continue
+            accepted.append((text, result))
+        # Stored batch by batch, so an interrupted run keeps what it already has
+        memory.add(source_locale, locale, accepted, backend.name)
+        for text, result in accepted:
+            for same in pending[normalize_message(text)]:
+                found[same] = result
+        stats['translated'] += len(accepted)
+        stats['batches'] += 1
+    return found, stats
+
+def fill_locales(root, backend, locales=None, source_locale=SOURCE_LOCALE, memory_path=None,
+                 max_items=None, max_chars=None):
+    """Translate the keys each locale (default: all but the source) is missing and write them"""
+    locales_dir = f"{root}/client/src/locales"
+    catalog = load_catalog(locales_dir)
+    max_items = max_items or backend.max_batch_items
+    max_chars = max_chars or backend.max_batch_chars
+    locales = locales or [locale for locale in catalog.locales if locale != source_locale]
+
+    writer = LocaleWriter()
+    with TranslationMemory(memory_path or os.path.join(root, MEMORY_FILE)) as memory:
+        seeded = memory.seed(catalog, source_locale)
+        if seeded:
+            print(f"✓ Translation memory: {seeded} entries from the locale files")
+        for locale in locales:
+            if locale == source_locale:
+                print(f"✗ {locale} is the source locale")
+                continue
+            if locale not in catalog.locales:
+                print(f"✗ {locale}: no {locale}.json to fill")
+                continue
+            missing = collect_missing(catalog, locale, source_locale)
+            if not missing:
+                print(f"✓ {locale}: complete")
+                continue
+            translations, stats = translate_texts(list(missing.values()), backend, memory,
+                                                  source_locale, locale, max_items, max_chars)
+            values = {key: translations[text] for key, text in missing.items() if text in translations}
+            path = os.path.join(locales_dir, f"{locale}.json")
+            for key, value in group_updates(values, catalog.locale_keys(locale)):
+                writer.set(path, key, value)
+            print(f"✓ {locale}: {len(values)}/{len(missing)} keys ({stats['memory']} from memory, "
+                  f"{stats['translated']} translated in {stats['batches']} batches)")
+            if stats['rejected']:
+                print(f"  ⚠ {len(stats['rejected'])} translations rejected (empty or placeholders changed)")
+
+    _, written = writer.commit()
+    for path in written:
+        print(f"✓ Updated {os.path.basename(path)}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Machine-translate the keys missing from locale files")
+    parser.add_argument('--backend', required=True,
+                        help=f"translation backend: {', '.join(sorted(BACKENDS))} or package.module:Class")
+    parser.add_argument('--locales', nargs='+',
+                        help="locales to fill (default: every locale but the source)")
+    parser.add_argument('--source', default=SOURCE_LOCALE,
+                        help="locale to translate from (default: %(default)s)")
+    parser.add_argument('--memory', metavar='PATH',
+                        help=f"translation memory database (default: ROOT/{MEMORY_FILE}); "
+                             "it is updated even in a dry run")
+    parser.add_argument('--batch-size', type=int,
+                        help="texts per backend request (default: the backend's limit)")
+    parser.add_argument('--batch-chars', type=int,
+                        help="characters per backend request (default: the backend's limit)")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+    root = apply_common_arguments(args)
+
+    try:
+        backend = load_backend(args.backend)
+    except (ValueError, ImportError, AttributeError) as e:
+        parser.error(str(e))
+
+    print("Translating missing locale keys...")
+    print("=" * 60)
+    fill_locales(root, backend, args.locales, args.source, args.memory, args.batch_size, args.batch_chars)
+    print("=" * 60)
+    print("Done!")
+    dry_run.close()
+
+if __name__ == "__main__":
+    main()
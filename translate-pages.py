@@ -2,72 +2,171 @@
 """
 Script to add useTranslation import to merchant pages
 """
-import re
 import os
+import argparse
+
+from i18n_tools import DEFAULT_IO_WORKERS, dry_run
+from i18n_tools.cli import add_common_arguments, apply_common_arguments
+from i18n_tools.file_cache import FileCache, mapping_hash
+from i18n_tools.injection import (HOOK, IMPORT, PLAN_VERSION, cached_plan, hook_edits,
+                                  injection_plan, splice, unsupported)
+from i18n_tools.mapped_file import MappedFile
+from i18n_tools.phases import phase
+
+# Bump when the injection rules change so cached results are invalidated
+CODEMOD_VERSION = 3
 
-pages_dir = "/home/ubuntu/sari/client/src/pages/merchant"
 target_files = ["Dashboard.tsx", "Products.tsx", "Orders.tsx", "Conversations.tsx", "Campaigns.tsx"]
 
-def add_use_translation(file_path):
+def add_use_translation(file_path, cache=None, plans=None):
     """Add useTranslation import if not exists"""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    with phase('read'):
+        with MappedFile(file_path) as source:
+            file_hash = source.hash()
+            # Check if already has useTranslation (without decoding the file)
+            present = b'useTranslation' in source
+            content = None if present else source.text()
+    if cache is not None and cache.get(file_hash) is not None:
+        print(f"✓ {os.path.basename(file_path)} already has useTranslation")
+        return False
     
-    # Check if already has useTranslation
-    if 'useTranslation' in content:
+    if present:
         print(f"✓ {os.path.basename(file_path)} already has useTranslation")
+        if cache is not None:
+            cache.set(file_hash, 'present')
         return False
     
-    # Find the import section and add useTranslation
-    import_pattern = r"(import.*?from ['\"]react['\"];)"
+    plan = cached_plan(plans, file_hash, content)
+    new_content = inject_use_translation(content, plan)
+    if new_content is None:
+        print(f"✗ Could not find import section in {os.path.basename(file_path)}")
+        return False
+    
+    with phase('write'):
+        dry_run.write_file(file_path, new_content, content)
+    
+    print(f"✓ Added useTranslation to {os.path.basename(file_path)}")
+    print_skipped(os.path.basename(file_path), plan)
+    return True
+
+def inject_use_translation(content, plan=None):
+    """Return content with the useTranslation import and hook added (None if it has no imports)"""
+    if plan is None:
+        with phase('match'):
+            plan = injection_plan(content)
     
-    if re.search(import_pattern, content):
-        # Add after react import
-        new_content = re.sub(
-            import_pattern,
-            r"\1\nimport { useTranslation } from 'react-i18next';",
-            content,
-            count=1
-        )
+    # Find the import section: after the react import, else after the first import
+    imports = plan['imports']
+    react_imports = [entry for entry in imports if entry[2] == 'react']
+    if react_imports:
+        import_end = react_imports[0][1]
+    elif imports:
+        import_end = imports[0][1]
     else:
-        # Add at the beginning after the first import
-        first_import = re.search(r"^import.*?;", content, re.MULTILINE)
-        if first_import:
-            pos = first_import.end()
-            new_content = content[:pos] + "\nimport { useTranslation } from 'react-i18next';" + content[pos:]
-        else:
-            print(f"✗ Could not find import section in {os.path.basename(file_path)}")
-            return False
+        return None
     
-    # Add const { t } = useTranslation(); after function declaration
-    func_pattern = r"(export default function \w+\([^)]*\) \{)"
-    if re.search(func_pattern, new_content):
-        new_content = re.sub(
-            func_pattern,
-            r"\1\n  const { t } = useTranslation();",
-            new_content,
-            count=1
-        )
+    with phase('rewrite'):
+        # Add const { t } = useTranslation(); to the default export and to
+        # every other component that calls t()
+        edits = hook_edits(plan, f"\n  {HOOK}")
+        edits.append((import_end, "\n" + IMPORT))
+        return splice(content, edits)
+
+def print_skipped(filename, plan):
+    """Warn about components the hook could not be added to"""
+    skipped = unsupported(plan)
+    if skipped:
+        print(f"  ⚠ no hook added to {', '.join(skipped)} in {filename} "
+              "(arrow body is not a block or parenthesized)")
+
+def process_async(pages_dir, cache, plans, io_workers):
+    """Inject through the asyncio pipeline, printing results in file order"""
+    # Imported on use: asyncio alone costs more startup time than a serial run's work
+    from i18n_tools.pipeline import run_pipeline
     
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    def read(filename):
+        file_path = os.path.join(pages_dir, filename)
+        if not os.path.exists(file_path):
+            return None
+        with phase('read'):
+            with MappedFile(file_path) as source:
+                # Check if already has useTranslation (without decoding the file)
+                if b'useTranslation' in source:
+                    return source.hash(), None
+                return source.hash(), source.text()
     
-    print(f"✓ Added useTranslation to {os.path.basename(file_path)}")
-    return True
+    def transform(filename, data):
+        if data is None or data[1] is None:
+            return data, None, None
+        plan = cached_plan(plans, data[0], data[1])
+        return data, plan, inject_use_translation(data[1], plan)
+    
+    def write(filename, transformed):
+        data, plan, new_content = transformed
+        if new_content is None:
+            return data, plan, False, None
+        with phase('write'):
+            return data, plan, True, dry_run.render(os.path.join(pages_dir, filename), new_content, data[1])
+    
+    def on_result(filename, result, error):
+        if error is not None:
+            raise error
+        data, plan, updated, diff = result
+        if data is None:
+            print(f"✗ File not found: {filename}")
+            return
+        # The cache is only used here, in file order, as in the serial loop
+        file_hash, content = data
+        if cache.get(file_hash) is not None or content is None:
+            if content is None:
+                cache.set(file_hash, 'present')
+            print(f"✓ {filename} already has useTranslation")
+        elif not updated:
+            print(f"✗ Could not find import section in {filename}")
+        else:
+            if diff is not None:
+                dry_run.emit(diff)
+            print(f"✓ Added useTranslation to {filename}")
+            print_skipped(filename, plan)
+    
+    run_pipeline(target_files, read, transform, write, on_result, io_workers=io_workers)
 
 def main():
+    parser = argparse.ArgumentParser(description="Add useTranslation to merchant pages")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="recheck every file, ignoring the content-hash cache")
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="overlap file reads and writes with the injection (asyncio pipeline)")
+    parser.add_argument('--io-workers', type=int, default=DEFAULT_IO_WORKERS,
+                        help=f"concurrent reads/writes with --async (default: {DEFAULT_IO_WORKERS})")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+    root = apply_common_arguments(args)
+    pages_dir = f"{root}/client/src/pages/merchant"
+    
     print("Adding useTranslation to merchant pages...")
     print("=" * 50)
     
-    for filename in target_files:
-        file_path = os.path.join(pages_dir, filename)
-        if os.path.exists(file_path):
-            add_use_translation(file_path)
-        else:
-            print(f"✗ File not found: {filename}")
+    # Files already seen with useTranslation are skipped without rescanning
+    cache = FileCache('translate-pages', mapping_hash(CODEMOD_VERSION), enabled=not args.no_cache)
+    # Edit plans by content hash, shared with add-usetranslation.py
+    plans = FileCache('injection-plans', mapping_hash(PLAN_VERSION), enabled=not args.no_cache)
+    
+    if args.use_async:
+        process_async(pages_dir, cache, plans, max(1, args.io_workers))
+    else:
+        for filename in target_files:
+            file_path = os.path.join(pages_dir, filename)
+            if os.path.exists(file_path):
+                add_use_translation(file_path, cache, plans)
+            else:
+                print(f"✗ File not found: {filename}")
     
+    cache.save()
+    plans.save()
     print("=" * 50)
     print("Done!")
+    dry_run.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Script to watch client/src and re-apply the i18n codemods to each page as
+soon as it is saved: toast replacement, useTranslation injection and a
+coverage check of the keys it uses. The compiled toast mapping and the
+locale catalog stay in memory; they are reloaded when toast-mapping.json
+or a locale file changes.
+"""
+import argparse
+import os
+import time
+from pathlib import Path
+
+from i18n_tools import dry_run
+from i18n_tools.cli import add_common_arguments, apply_common_arguments
+from i18n_tools.locale_catalog import SOURCE_LOCALE, load_catalog
+from i18n_tools.mapped_file import decode_source
+from i18n_tools.scripts import load_script
+from i18n_tools.tsx_lexer import translation_keys
+from i18n_tools.watcher import DEFAULT_POLL_INTERVAL, open_watcher
+
+replace_toast_messages = load_script('replace-toast-messages.py')
+add_usetranslation = load_script('add-usetranslation.py')
+translate_pages = load_script('translate-pages.py')
+
+root = None
+client_dir = None
+pages_dir = None
+locales_dir = None
+mapping_path = None
+catalog = None
+# Page path (relative to the root) -> useTranslation injector for it
+injectors = {}
+# Source file -> sorted translation keys it uses
+usage = {}
+# Path -> text this process last wrote, so its own writes are not redone
+written = {}
+
+# What a half-written save can raise while it is read or parsed; the
+# watcher reports it and retries on the next change
+READ_ERRORS = (OSError, UnicodeDecodeError, ValueError)
+
+def setup(checkout):
+    """Point the watcher at a Sari checkout and load the mapping and catalog"""
+    global root, client_dir, pages_dir, locales_dir, mapping_path, catalog
+    root = checkout
+    client_dir = os.path.join(root, 'client', 'src')
+    pages_dir = os.path.join(client_dir, 'pages')
+    locales_dir = os.path.join(client_dir, 'locales')
+    mapping_path = os.path.join(root, 'toast-mapping.json')
+    replace_toast_messages.load_mappings(root)
+    catalog = load_catalog(locales_dir)
+    injectors.clear()
+    for filepath in add_usetranslation.files:
+        injectors[os.path.normpath(filepath)] = add_usetranslation.inject_use_translation
+    for filename in translate_pages.target_files:
+        path = os.path.join('client', 'src', 'pages', 'merchant', filename)
+        injectors[path] = translate_pages.inject_use_translation
+
+def read_text(path):
+    """Return the text of a file, or None if it is gone"""
+    # Read, not mapped: an editor truncating a mapped file raises SIGBUS
+    try:
+        return decode_source(Path(path).read_bytes())
+    except FileNotFoundError:
+        return None
+
+def scan_usage():
+    """Index the keys used by every TSX file under client/src"""
+    usage.clear()
+    for file_path in sorted(Path(client_dir).rglob("*.tsx")):
+        try:
+            content = read_text(file_path)
+        except READ_ERRORS as e:
+            print(f"✗ {file_path.relative_to(client_dir)}: {e}")
+            continue
+        if content is not None:
+            usage[str(file_path)] = sorted({key for _, key in translation_keys(content)})
+
+def missing_keys(locale):
+    """Return the used keys a locale does not define"""
+    return sorted({key for keys in usage.values() for key in keys if not catalog.has(key, locale)})
+
+def print_coverage():
+    """Print how many used keys each locale is missing"""
+    counts = ', '.join(f"{locale} {len(missing_keys(locale))}" for locale in catalog.locales)
+    print(f"  {len(usage)} files, missing keys per locale: {counts}")
+
+def transform_page(path, content):
+    """Apply the per-page codemods; return (new content, notes)"""
+    notes = []
+    relative = os.path.relpath(path, root)
+    # replace-toast-messages.py leaves merchant/Products.tsx alone
+    is_done = os.path.basename(path) == "Products.tsx" and "merchant" in path
+    if path.startswith(pages_dir + os.sep) and not is_done and 'toast.' in content:
+        new_content, count = replace_toast_messages.rewrite_toasts(path, content)
+        if new_content != content:
+            content = new_content
+            notes.append(f"{count} replacements")
+    inject = injectors.get(relative)
+    if inject is not None and 'useTranslation' not in content:
+        new_content = inject(content)
+        if new_content is not None:
+            content = new_content
+            notes.append("useTranslation added")
+    return content, notes
+
+def process_source(path, quiet=False):
+    """Re-run the codemods and the coverage check for one changed file"""
+    start = time.perf_counter()
+    relative = os.path.relpath(path, client_dir)
+    try:
+        content = read_text(path)
+        if content is None:
+            if usage.pop(path, None) is not None:
+                print(f"- {relative} removed")
+            written.pop(path, None)
+            return
+        if written.get(path) == content:
+            return
+
+        original = content
+        content, notes = transform_page(path, content)
+        if content != original:
+            dry_run.write_file(path, content, original)
+            written[path] = content
+    except READ_ERRORS as e:
+        # The keys it used last time stay in usage until it reads cleanly
+        print(f"✗ {relative}: {e}")
+        return
+
+    keys = sorted({key for _, key in translation_keys(content)})
+    usage[path] = keys
+    missing = [key for key in keys if not catalog.has(key, SOURCE_LOCALE)]
+    if quiet and not notes and not missing:
+        return
+    elapsed = (time.perf_counter() - start) * 1000
+    marker = "✓" if notes else "○"
+    print(f"{marker} {relative}: {', '.join(notes) or 'up to date'} ({elapsed:.1f} ms)")
+    if missing:
+        print(f"  ⚠ {len(missing)} keys missing from {SOURCE_LOCALE}.json: {', '.join(missing)}")
+
+def reload_locales(mapping_changed):
+    """Reload the catalog (and the toast mapping); redo pages if the mapping moved"""
+    global catalog
+    start = time.perf_counter()
+    old_mapping = dict(replace_toast_messages.flat_mapping)
+    try:
+        # The catalog first: load_mappings only replaces the mapping once
+        # it has loaded, so a failure leaves both as they were
+        new_catalog = load_catalog(locales_dir)
+        replace_toast_messages.load_mappings(root)
+    except READ_ERRORS as e:
+        print(f"✗ Locales not reloaded, keeping the previous ones: {e}")
+        return
+    catalog = new_catalog
+    if not mapping_changed:
+        # ar.json decides between the content-addressed and the legacy keys
+        mapping_changed = replace_toast_messages.flat_mapping != old_mapping
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"↻ Reloaded {'mapping and ' if mapping_changed else ''}locales ({elapsed:.1f} ms)")
+    if mapping_changed:
+        for path in sorted(usage):
+            if path.startswith(pages_dir + os.sep):
+                written.pop(path, None)
+                process_source(path, quiet=True)
+    print_coverage()
+
+def handle_changes(changed):
+    """Dispatch one batch of changed paths"""
+    locales_changed = any(path.endswith('.json') for path in changed)
+    if locales_changed:
+        reload_locales(mapping_path in changed)
+    for path in sorted(changed):
+        if path.endswith('.tsx'):
+            process_source(path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-apply the i18n codemods to pages as they change")
+    parser.add_argument('--poll', action='store_true',
+                        help="poll for changes instead of using inotify")
+    parser.add_argument('--interval', type=float, default=DEFAULT_POLL_INTERVAL,
+                        help=f"seconds between polls (default: {DEFAULT_POLL_INTERVAL})")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+    setup(os.path.abspath(apply_common_arguments(args)))
+
+    watcher = open_watcher([client_dir], ('.tsx', '.json'), [mapping_path], args.poll, args.interval)
+    scan_usage()
+    print("=" * 60)
+    print(f"Watching {client_dir} ({watcher.method}), Ctrl-C to stop")
+    print("=" * 60)
+    print_coverage()
+
+    try:
+        while True:
+            changed = watcher.wait()
+            # Only locale files count among the JSON files under client/src
+            changed = {path for path in changed
+                       if path == mapping_path or not path.endswith('.json')
+                       or os.path.dirname(path) == locales_dir}
+            if changed:
+                handle_changes(changed)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        watcher.close()
+        dry_run.close()
+
+if __name__ == "__main__":
+    main()